@@ -130,13 +130,16 @@ export interface AttackCandidate {
 export interface JobStatus {
   job_id: string;
   attack_id: string;
-  status: string;  // "queued" | "running" | "complete" | "error" | "eureka"
+  status: string;  // "queued" | "running" | "complete" | "error" | "eureka" | "cancelled" | "interrupted"
   progress_pct: number;
   clock_time: string | null;
   total_candidates: number;
   top_candidates: AttackCandidate[];
   summary: Record<string, unknown> | null;
   error: string | null;
+  cancel_requested?: boolean;
+  attempts?: number;
+  result_path?: string | null;
 }
 
 
@@ -174,6 +177,14 @@ async function postJSON<T>(path: string, body: unknown): Promise<T> {
   return (await resp.json()) as T;
 }
 
+async function deleteJSON<T>(path: string): Promise<T> {
+  const resp = await fetch(apiPath(path), { method: "DELETE" });
+  if (!resp.ok) {
+    throw new ApiError(resp.status, await resp.text());
+  }
+  return (await resp.json()) as T;
+}
+
 export const api = {
   status: () => getJSON<StatusResponse>("/api/status"),
   runs: (limit = 20) => getJSON<RunsResponse>(`/api/runs?limit=${limit}`),
@@ -191,4 +202,5 @@ export const api = {
   frontierVectors: () => getJSON<FrontierVectorsResponse>("/api/k4/attacks/frontier"),
   runAttack: (req: RunAttackRequest) => postJSON<JobStatus>("/api/k4/attacks/run", req),
   jobStatus: (jobId: string) => getJSON<JobStatus>(`/api/k4/attacks/jobs/${jobId}`),
+  cancelJob: (jobId: string) => deleteJSON<JobStatus>(`/api/k4/attacks/jobs/${jobId}`),
 };
@@ -11,6 +11,8 @@ const STATUS_LABELS: Record<string, string> = {
   complete: "Complete",
   error: "Error",
   eureka: "🚨 EUREKA",
+  cancelled: "Cancelled",
+  interrupted: "Interrupted",
 };
 
 function CandidateRow({ c }: { c: AttackCandidate }) {
@@ -94,6 +96,15 @@ export default function AttackRunPanel({ vector }: Props) {
     }
   };
 
+  const handleCancel = async () => {
+    if (!job?.job_id) return;
+    try {
+      setJob(await api.cancelJob(job.job_id));
+    } catch {
+      /* job already finished; the next poll shows its final status */
+    }
+  };
+
   const statusColor = job
     ? job.status === "complete"
       ? "var(--accent)"
@@ -127,6 +138,11 @@ export default function AttackRunPanel({ vector }: Props) {
         >
           {launching ? "Launching…" : isRunning ? "Running…" : "▶ Run Attack"}
         </button>
+        {isRunning && (
+          <button className="small-button" onClick={handleCancel} disabled={job?.cancel_requested}>
+            {job?.cancel_requested ? "Cancelling…" : "■ Cancel"}
+          </button>
+        )}
         {job && (
           <span style={{ fontSize: "12px", color: statusColor }}>
             {STATUS_LABELS[job.status] ?? job.status}
@@ -151,7 +167,7 @@ export default function AttackRunPanel({ vector }: Props) {
       )}
 
       {/* Error */}
-      {job?.status === "error" && (
+      {(job?.status === "error" || job?.status === "interrupted") && (
         <div style={{ marginTop: "10px", color: "#ff8800", fontSize: "12px", fontFamily: "monospace" }}>
           Error: {job.error}
         </div>
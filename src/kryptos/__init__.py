@@ -7,43 +7,40 @@ for compatibility but may be deprecated in a future minor release.
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from importlib import import_module as _imp
 
 __version__ = "0.0.1"
 
-from .analysis import check_cribs, frequency_analysis
-from .ciphers import (
-    double_rotational_transposition,
-    vigenere_decrypt,
-)
-from .ciphers import k3_decrypt as k3_classical_decrypt
-from .ciphers import k3_decrypt as k3_decrypt  # public alias expected by tests
-
-__all__: list[str] = [
-    "__version__",
+# Exports resolve on first attribute access (module ``__getattr__``) so that
+# ``import kryptos`` -- and every CLI call or pool worker that imports a
+# submodule -- does not pull in the cipher, analysis and K1-K4 stacks.
+_LAZY_MAP: dict[str, tuple[str, str]] = {
     # Classical / sections primitives
-    "vigenere_decrypt",
-    "k3_classical_decrypt",
-    "k3_decrypt",
-    "double_rotational_transposition",
-    "frequency_analysis",
-    "check_cribs",
-]
-
-
-def _export(iterable: Iterable[str]) -> None:
-    for name in iterable:
-        if name not in __all__:
-            __all__.append(name)
-
-
-# Optional convenience: expose section decrypt wrappers in root namespace (lightweight).
-try:  # pragma: no cover
-    from .k1 import decrypt as k1_decrypt  # noqa: F401
-    from .k2 import decrypt as k2_decrypt  # noqa: F401
-    from .k3 import decrypt as k3_section_decrypt  # noqa: F401
-    from .k4 import decrypt_best as k4_decrypt_best  # noqa: F401
-
-    _export(["k1_decrypt", "k2_decrypt", "k3_section_decrypt", "k4_decrypt_best"])
-except ImportError:  # pragma: no cover - keep import failures non-fatal
-    pass
+    "vigenere_decrypt": ("kryptos.ciphers", "vigenere_decrypt"),
+    "k3_classical_decrypt": ("kryptos.ciphers", "k3_decrypt"),
+    "k3_decrypt": ("kryptos.ciphers", "k3_decrypt"),  # public alias expected by tests
+    "double_rotational_transposition": ("kryptos.ciphers", "double_rotational_transposition"),
+    "frequency_analysis": ("kryptos.analysis", "frequency_analysis"),
+    "check_cribs": ("kryptos.analysis", "check_cribs"),
+    # Convenience: section decrypt wrappers in the root namespace
+    "k1_decrypt": ("kryptos.k1", "decrypt"),
+    "k2_decrypt": ("kryptos.k2", "decrypt"),
+    "k3_section_decrypt": ("kryptos.k3", "decrypt"),
+    "k4_decrypt_best": ("kryptos.k4", "decrypt_best"),
+}
+
+__all__: list[str] = ["__version__", *_LAZY_MAP]
+
+
+def __getattr__(name: str):  # pragma: no cover - import mechanism
+    target = _LAZY_MAP.get(name)
+    if not target:
+        raise AttributeError(f"module 'kryptos' has no attribute {name!r}")
+    mod_name, attr_name = target
+    value = getattr(_imp(mod_name), attr_name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_MAP})
@@ -64,9 +64,11 @@ def create_app(index: ArtifactIndex | None = None) -> FastAPI:
     def rag_status() -> dict:
         return index.status()
 
-    @app.post("/api/rag/reindex")
-    def rag_reindex() -> dict:
-        return index.build()
+    @app.post("/api/rag/reindex", status_code=202)
+    def rag_reindex(full: bool = Query(False)) -> dict:
+        # Runs in the background; poll /api/rag/status for status["reindex"].
+        started = index.start_reindex(full=full)
+        return {**index.status(), "started": started}
 
     @app.get("/api/rag/search")
     def rag_search(q: str = Query(..., min_length=1), k: int = Query(10, ge=1, le=50)) -> dict:
@@ -0,0 +1,500 @@
+"""Persistent, bounded job queue for long-running K4 attack sweeps.
+
+Jobs are rows in a local SQLite table (status, parameters, progress
+counters, a pointer to the result file) and are executed by a fixed pool of
+daemon worker threads, so a burst of POSTs queues work instead of spawning
+unbounded threads. Cancellation is cooperative: a runner reports progress
+through :meth:`JobQueue.progress`, which raises :class:`JobCancelled` once a
+cancel has been requested. On startup :meth:`JobQueue.recover` re-queues jobs
+a previous process left behind.
+
+Each job also has an in-memory :class:`~kryptos.api.log_stream.LogBuffer` of
+JSON progress/status events for the SSE endpoint. Sweep progress is published
+through a :class:`ProgressThrottle`, which spaces emissions so that they never
+cost more than 1% of the sweep's own time.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from kryptos.api.log_stream import LogBuffer
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOB_WORKERS = 2
+# A job that was running when the server died is re-queued at most this many
+# times in total; a sweep that keeps killing the process ends up "interrupted".
+MAX_JOB_ATTEMPTS = 2
+
+PROGRESS_MIN_INTERVAL = 0.5  # seconds between progress events, at the least
+PROGRESS_MAX_OVERHEAD = 0.01  # emission time as a fraction of sweep time
+EVENT_BUFFER_CAPACITY = 200
+EVENT_BUFFERS_KEPT = 64
+
+TERMINAL_STATUSES = frozenset({"complete", "error", "eureka", "cancelled", "interrupted"})
+
+# Runner contract: runner(job_id, params) -> final job fields, e.g.
+# {"status": "complete", "summary": {...}, "top_candidates": [...]}.
+JobRunner = Callable[[str, dict[str, Any]], dict[str, Any]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id           TEXT PRIMARY KEY,
+    attack_id        TEXT NOT NULL,
+    status           TEXT NOT NULL,
+    params           TEXT NOT NULL,
+    progress_pct     REAL NOT NULL DEFAULT 0,
+    clock_time       TEXT,
+    total_candidates INTEGER NOT NULL DEFAULT 0,
+    top_candidates   TEXT NOT NULL DEFAULT '[]',
+    result_path      TEXT,
+    error            TEXT,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    attempts         INTEGER NOT NULL DEFAULT 0,
+    created_at       TEXT NOT NULL,
+    updated_at       TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, created_at);
+"""
+
+_JSON_COLUMNS = ("params", "top_candidates")
+
+
+class JobCancelled(BaseException):
+    """Raised inside a runner when its job has been cancelled or the queue is stopping.
+
+    Derives from ``BaseException`` (like ``asyncio.CancelledError``) so the
+    ``except Exception`` guards scattered through the sweep code don't swallow it.
+    """
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class ProgressThrottle:
+    """Forward progress updates to ``emit`` no more often than the time budget allows.
+
+    An emission that took ``c`` seconds holds the next one back for at least
+    ``max(min_interval, c / max_overhead)`` seconds, so however expensive
+    ``emit`` turns out to be it stays under ``max_overhead`` of the caller's
+    time. ``force=True`` (e.g. the final state) bypasses the wait.
+    """
+
+    def __init__(
+        self,
+        emit: Callable[[dict[str, Any]], None],
+        min_interval: float = PROGRESS_MIN_INTERVAL,
+        max_overhead: float = PROGRESS_MAX_OVERHEAD,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self.emit = emit
+        self.min_interval = min_interval
+        self.max_overhead = max_overhead
+        self.emitted = 0
+        self._clock = clock
+        self._next_due = float("-inf")
+
+    def __call__(self, info: dict[str, Any], force: bool = False) -> bool:
+        start = self._clock()
+        if not force and start < self._next_due:
+            return False
+        self.emit(info)
+        end = self._clock()
+        self._next_due = end + max(self.min_interval, (end - start) / self.max_overhead)
+        self.emitted += 1
+        return True
+
+
+def progress_event(info: dict[str, Any], elapsed: float) -> dict[str, Any]:
+    """Structured progress event from a sweep ``progress_cb`` payload."""
+    done, total = info["clock_idx"], info["total_clock"]
+    tested = info["total_candidates"]
+    top = info.get("top_candidates") or []
+    best = top[0] if top else {}
+    return {
+        "type": "progress",
+        "states_done": done,
+        "states_total": total,
+        "progress_pct": round(done / total * 100, 1) if total else 0.0,
+        "clock_time": info.get("clock_time"),
+        "candidates_tested": tested,
+        "tested_per_sec": round(tested / elapsed, 1) if elapsed > 0 else None,
+        "best_score": best.get("instructional_score"),
+        "best_keyword_hits": best.get("keyword_hits"),
+        "elapsed_seconds": round(elapsed, 3),
+        "eta_seconds": round(elapsed / done * (total - done), 1) if done else None,
+    }
+
+
+class JobStore:
+    """SQLite table of attack jobs, shared by request handlers and worker threads."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def create(self, attack_id: str, params: dict[str, Any]) -> dict[str, Any]:
+        job_id = str(uuid.uuid4())
+        now = _now()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO jobs (job_id, attack_id, status, params, created_at, updated_at)"
+                " VALUES (?, ?, 'queued', ?, ?, ?)",
+                (job_id, attack_id, json.dumps(params), now, now),
+            )
+        return self.get(job_id)  # type: ignore[return-value]
+
+    def get(self, job_id: str) -> dict[str, Any] | None:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return self._row_to_job(row) if row is not None else None
+
+    def update(self, job_id: str, **fields: Any) -> None:
+        if not fields:
+            return
+        for col in _JSON_COLUMNS:
+            if col in fields:
+                fields[col] = json.dumps(fields[col])
+        fields["updated_at"] = _now()
+        assignments = ", ".join(f"{col} = ?" for col in fields)
+        with self._lock, self._conn:
+            self._conn.execute(f"UPDATE jobs SET {assignments} WHERE job_id = ?", (*fields.values(), job_id))
+
+    def claim(self, job_id: str) -> dict[str, Any] | None:
+        """Move a queued job to running and count the attempt; None if it is no longer queued."""
+        with self._lock, self._conn:
+            cur = self._conn.execute(
+                "UPDATE jobs SET status = 'running', attempts = attempts + 1, updated_at = ?"
+                " WHERE job_id = ? AND status = 'queued'",
+                (_now(), job_id),
+            )
+        return self.get(job_id) if cur.rowcount == 1 else None
+
+    def cancel_if_queued(self, job_id: str) -> bool:
+        with self._lock, self._conn:
+            cur = self._conn.execute(
+                "UPDATE jobs SET status = 'cancelled', cancel_requested = 1, updated_at = ?"
+                " WHERE job_id = ? AND status = 'queued'",
+                (_now(), job_id),
+            )
+        return cur.rowcount == 1
+
+    def unfinished(self) -> list[dict[str, Any]]:
+        """Jobs left queued or running, oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM jobs WHERE status IN ('queued', 'running') ORDER BY created_at"
+            ).fetchall()
+        return [self._row_to_job(row) for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _row_to_job(row: sqlite3.Row) -> dict[str, Any]:
+        job = dict(row)
+        for col in _JSON_COLUMNS:
+            job[col] = json.loads(job[col])
+        job["cancel_requested"] = bool(job["cancel_requested"])
+        return job
+
+
+class JobQueue:
+    """Run jobs from a :class:`JobStore` on at most ``max_workers`` daemon threads.
+
+    The store (and its ``results/`` directory of summary files) is opened on
+    first use, so constructing a queue never touches the disk.
+    """
+
+    def __init__(
+        self,
+        runner: JobRunner,
+        db_path: Path,
+        max_workers: int = DEFAULT_JOB_WORKERS,
+        max_attempts: int = MAX_JOB_ATTEMPTS,
+    ):
+        self.runner = runner
+        self.db_path = Path(db_path)
+        self.results_dir = self.db_path.parent / "results"
+        self.max_workers = max(1, max_workers)
+        self.max_attempts = max(1, max_attempts)
+        self._store: JobStore | None = None
+        self._pending: queue.Queue[str | None] = queue.Queue()
+        self._workers: list[threading.Thread] = []
+        self._cancel_events: dict[str, threading.Event] = {}
+        self._event_buffers: OrderedDict[str, LogBuffer] = OrderedDict()
+        self._events_closed: set[str] = set()
+        self._enqueued: set[str] = set()
+        self._lock = threading.Lock()
+        self._stopping = False
+        self._recovered = False
+
+    @property
+    def store(self) -> JobStore:
+        with self._lock:
+            if self._store is None:
+                self._store = JobStore(self.db_path)
+            return self._store
+
+    # -- public API ---------------------------------------------------------
+    def submit(self, attack_id: str, params: dict[str, Any]) -> dict[str, Any]:
+        job = self.store.create(attack_id, params)
+        self._enqueue(job["job_id"])
+        return job
+
+    def get(self, job_id: str) -> dict[str, Any] | None:
+        """Return the job row with its ``summary`` loaded from the result file."""
+        job = self.store.get(job_id)
+        if job is None:
+            return None
+        job["summary"] = None
+        if job["result_path"]:
+            try:
+                job["summary"] = json.loads(Path(job["result_path"]).read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                logger.warning("Result file for job %s is missing or unreadable: %s", job_id, job["result_path"])
+        return job
+
+    def cancel(self, job_id: str) -> dict[str, Any] | None:
+        """Cancel a job: immediately if queued, at the runner's next progress report if running.
+
+        Jobs already in a terminal status are returned unchanged.
+        """
+        job = self.store.get(job_id)
+        if job is None or job["status"] in TERMINAL_STATUSES:
+            return job
+        if not self.store.cancel_if_queued(job_id):
+            self.store.update(job_id, cancel_requested=1)
+            self._cancel_event(job_id).set()
+        self._publish_status(job_id)
+        return self.get(job_id)
+
+    def progress(self, job_id: str, **fields: Any) -> None:
+        """Record progress counters for a running job; raise JobCancelled if it should stop."""
+        if fields:
+            self.store.update(job_id, **fields)
+            self._publish(job_id, {"type": "progress", **{k: v for k, v in fields.items() if k != "top_candidates"}})
+        if self._cancel_event(job_id).is_set():
+            raise JobCancelled(job_id)
+
+    def progress_callback(self, job_id: str) -> Callable[[dict[str, Any]], None]:
+        """Build a sweep ``progress_cb`` for ``job_id``.
+
+        Every call checks for cancellation; the job row and a
+        :func:`progress_event` are updated through a :class:`ProgressThrottle`
+        (always on the final clock state).
+        """
+        started = time.perf_counter()
+        cancelled = self._cancel_event(job_id)
+
+        def _emit(info: dict[str, Any]) -> None:
+            event = progress_event(info, time.perf_counter() - started)
+            self.store.update(
+                job_id,
+                progress_pct=event["progress_pct"],
+                clock_time=event["clock_time"],
+                total_candidates=event["candidates_tested"],
+                top_candidates=info.get("top_candidates") or [],
+            )
+            self._publish(job_id, event)
+
+        throttle = ProgressThrottle(_emit)
+
+        def _callback(info: dict[str, Any]) -> None:
+            throttle(info, force=info["clock_idx"] >= info["total_clock"])
+            if cancelled.is_set():
+                raise JobCancelled(job_id)
+
+        return _callback
+
+    def events(self, job_id: str) -> LogBuffer:
+        """The job's event buffer (JSON lines); starts with a status snapshot."""
+        buffer = self._event_buffer(job_id)
+        if buffer.latest_seq() == 0:
+            self._publish_status(job_id)
+        return buffer
+
+    def events_closed(self, job_id: str) -> bool:
+        """True once the job's terminal status event has been published."""
+        with self._lock:
+            return job_id in self._events_closed
+
+    def recover(self) -> dict[str, int]:
+        """Re-queue jobs left unfinished by a previous process.
+
+        A job that was running is re-queued unless it was being cancelled
+        (-> cancelled) or has used up ``max_attempts`` (-> interrupted).
+
+        Only the first call does anything: FastAPI runs router startup handlers
+        once per enclosing app/router, and a later pass would mistake jobs this
+        process is already running for leftovers. Jobs this process enqueued
+        itself are never touched.
+        """
+        counts = {"requeued": 0, "interrupted": 0, "cancelled": 0}
+        with self._lock:
+            if self._recovered:
+                return counts
+            self._recovered = True
+        for job in self.store.unfinished():
+            job_id = job["job_id"]
+            with self._lock:
+                if job_id in self._enqueued:
+                    continue
+            if job["status"] == "running":
+                if job["cancel_requested"]:
+                    self.store.update(job_id, status="cancelled")
+                    counts["cancelled"] += 1
+                    continue
+                if job["attempts"] >= self.max_attempts:
+                    self.store.update(
+                        job_id,
+                        status="interrupted",
+                        error=f"Interrupted by server restart after {job['attempts']} attempt(s)",
+                    )
+                    counts["interrupted"] += 1
+                    continue
+                self.store.update(job_id, status="queued")
+            self._enqueue(job_id)
+            counts["requeued"] += 1
+        if any(counts.values()):
+            logger.info("Recovered K4 attack jobs: %s", counts)
+        return counts
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Stop the workers; running jobs go back to queued for the next :meth:`recover`."""
+        with self._lock:
+            self._stopping = True
+            for event in self._cancel_events.values():
+                event.set()
+            workers = list(self._workers)
+        for _ in workers:
+            self._pending.put(None)
+        for worker in workers:
+            worker.join(timeout)
+
+    # -- workers ------------------------------------------------------------
+    def _cancel_event(self, job_id: str) -> threading.Event:
+        with self._lock:
+            event = self._cancel_events.get(job_id)
+            if event is None:
+                event = self._cancel_events[job_id] = threading.Event()
+                if self._stopping:
+                    event.set()
+            return event
+
+    def _event_buffer(self, job_id: str) -> LogBuffer:
+        with self._lock:
+            buffer = self._event_buffers.get(job_id)
+            if buffer is None:
+                buffer = self._event_buffers[job_id] = LogBuffer(EVENT_BUFFER_CAPACITY)
+                while len(self._event_buffers) > EVENT_BUFFERS_KEPT:
+                    evicted, _ = self._event_buffers.popitem(last=False)
+                    self._events_closed.discard(evicted)
+            return buffer
+
+    def _publish(self, job_id: str, event: dict[str, Any]) -> None:
+        self._event_buffer(job_id).append(json.dumps(event, default=str))
+
+    def _publish_status(self, job_id: str) -> None:
+        job = self.store.get(job_id)
+        if job is None:
+            return
+        self._publish(
+            job_id,
+            {
+                "type": "status",
+                "status": job["status"],
+                "progress_pct": job["progress_pct"],
+                "candidates_tested": job["total_candidates"],
+                "cancel_requested": job["cancel_requested"],
+                "error": job["error"],
+            },
+        )
+        if job["status"] in TERMINAL_STATUSES:
+            with self._lock:
+                self._events_closed.add(job_id)
+            self._event_buffer(job_id).notify()
+
+    def _enqueue(self, job_id: str) -> None:
+        with self._lock:
+            if len(self._workers) < self.max_workers:
+                worker = threading.Thread(
+                    target=self._worker_loop, daemon=True, name=f"k4-job-worker-{len(self._workers)}"
+                )
+                self._workers.append(worker)
+                worker.start()
+            self._enqueued.add(job_id)
+        self._pending.put(job_id)
+
+    def _worker_loop(self) -> None:
+        while True:
+            job_id = self._pending.get()
+            if job_id is None or self._stopping:
+                return
+            self._run_job(job_id)
+
+    def _run_job(self, job_id: str) -> None:
+        job = self.store.claim(job_id)
+        if job is None:  # cancelled while queued
+            return
+        self._publish_status(job_id)
+        try:
+            final = self.runner(job_id, job["params"])
+        except JobCancelled:
+            if self.store.get(job_id)["cancel_requested"]:  # type: ignore[index]
+                self.store.update(job_id, status="cancelled")
+            else:  # queue shutting down: hand the job to the next process
+                self.store.update(job_id, status="queued", attempts=job["attempts"] - 1)
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("%s job %s failed", job["attack_id"], job_id)
+            self.store.update(job_id, status="error", error=str(exc))
+        else:
+            self._finish(job_id, final)
+        finally:
+            with self._lock:
+                self._cancel_events.pop(job_id, None)
+            self._publish_status(job_id)
+
+    def _finish(self, job_id: str, final: dict[str, Any]) -> None:
+        fields = dict(final)
+        summary = fields.pop("summary", None)
+        if summary is not None:
+            self.results_dir.mkdir(parents=True, exist_ok=True)
+            result_path = self.results_dir / f"{job_id}.json"
+            result_path.write_text(json.dumps(summary, indent=2, default=str), encoding="utf-8")
+            fields["result_path"] = str(result_path)
+        fields.setdefault("status", "complete")
+        self.store.update(job_id, **fields)
+
+
+__all__ = [
+    "DEFAULT_JOB_WORKERS",
+    "MAX_JOB_ATTEMPTS",
+    "PROGRESS_MAX_OVERHEAD",
+    "PROGRESS_MIN_INTERVAL",
+    "TERMINAL_STATUSES",
+    "JobCancelled",
+    "JobQueue",
+    "JobStore",
+    "ProgressThrottle",
+    "progress_event",
+]
@@ -1,55 +1,57 @@
 """API routes for K4 frontier attack execution.
 
-POST /api/k4/attacks/run         — start a background attack job
-GET  /api/k4/attacks/jobs/{id}   — poll job status + top candidates
-GET  /api/k4/attacks/frontier    — list P1-P7 frontier vectors
+POST   /api/k4/attacks/run                — queue a background attack job
+GET    /api/k4/attacks/jobs/{id}          — poll job status + top candidates
+GET    /api/k4/attacks/jobs/{id}/events   — SSE stream of progress/status events
+DELETE /api/k4/attacks/jobs/{id}          — cancel a queued or running job
+GET    /api/k4/attacks/frontier           — list P1-P7 frontier vectors
+
+Jobs persist in ``artifacts/k4_jobs/jobs.sqlite`` and run on a bounded
+worker pool (:mod:`kryptos.api.job_queue`); jobs interrupted by a restart are
+re-queued when the app starts.
 """
 
 from __future__ import annotations
 
 import logging
-import threading
-import uuid
+from collections.abc import Callable
+from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
+from kryptos.api.job_queue import DEFAULT_JOB_WORKERS, EVENT_BUFFER_CAPACITY, TERMINAL_STATUSES, JobQueue
+from kryptos.api.log_stream import log_event_stream
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
-# In-memory job registry (survives for the lifetime of the server process)
+# Persistent job queue (set by create_k4_attack_router)
 # ---------------------------------------------------------------------------
-_JOBS: dict[str, dict[str, Any]] = {}
-_JOBS_LOCK = threading.Lock()
-
-
-def _new_job(attack_id: str) -> str:
-    job_id = str(uuid.uuid4())
-    with _JOBS_LOCK:
-        _JOBS[job_id] = {
-            "job_id": job_id,
-            "attack_id": attack_id,
-            "status": "queued",
-            "progress_pct": 0,
-            "clock_time": None,
-            "total_candidates": 0,
-            "top_candidates": [],
-            "summary": None,
-            "error": None,
-        }
-    return job_id
+_QUEUE: JobQueue | None = None
+
+
+def _default_job_db() -> Path:
+    from kryptos.paths import get_artifacts_root
+
+    return get_artifacts_root() / "k4_jobs" / "jobs.sqlite"
 
 
 def _update_job(job_id: str, **kwargs: Any) -> None:
-    with _JOBS_LOCK:
-        if job_id in _JOBS:
-            _JOBS[job_id].update(kwargs)
+    """Report progress for a running job; raises JobCancelled once it is cancelled."""
+    if _QUEUE is not None:
+        _QUEUE.progress(job_id, **kwargs)
+
+
+def _clock_progress(job_id: str) -> Callable[[dict[str, Any]], None] | None:
+    """Sweep ``progress_cb``: throttled progress events + a cancellation check per clock state."""
+    return _QUEUE.progress_callback(job_id) if _QUEUE is not None else None
 
 
 def _get_job(job_id: str) -> dict[str, Any] | None:
-    with _JOBS_LOCK:
-        return dict(_JOBS[job_id]) if job_id in _JOBS else None
+    return _QUEUE.get(job_id) if _QUEUE is not None else None
 
 
 # ---------------------------------------------------------------------------
@@ -331,6 +333,9 @@ class JobStatusResponse(BaseModel):
     top_candidates: list[dict[str, Any]]
     summary: dict[str, Any] | None
     error: str | None
+    cancel_requested: bool = False
+    attempts: int = 0
+    result_path: str | None = None
 
 
 class FrontierVectorsResponse(BaseModel):
@@ -340,8 +345,8 @@ class FrontierVectorsResponse(BaseModel):
 # ---------------------------------------------------------------------------
 # Attack worker dispatcher
 # ---------------------------------------------------------------------------
-def _run_attack_worker(job_id: str, req: "RunAttackRequest") -> None:
-    """Dispatch the correct attack module and update job state on completion."""
+def _run_attack_worker(job_id: str, req: "RunAttackRequest") -> dict[str, Any]:
+    """Dispatch the correct attack module and return its summary."""
     attack_id = req.attack_id
 
     if attack_id == "p1_three_layer":
@@ -349,22 +354,12 @@ def _run_attack_worker(job_id: str, req: "RunAttackRequest") -> None:
 
         clock_step = 86400 if req.priority_only else 3600
 
-        def _progress(info: dict[str, Any]) -> None:
-            pct = (info["clock_idx"] / info["total_clock"]) * 100
-            _update_job(
-                job_id,
-                progress_pct=round(pct, 1),
-                clock_time=info["clock_time"],
-                total_candidates=info["total_candidates"],
-                top_candidates=info["top_candidates"],
-            )
-
         summary = run_three_layer_composite(
             grid_sizes=req.grid_sizes,
             clock_step_seconds=clock_step,
             priority_clock_times=CIA_PRIORITY_TIMES,
             max_perms_per_grid=req.max_perms_per_grid,
-            progress_cb=_progress,
+            progress_cb=_clock_progress(job_id),
         )
 
     elif attack_id == "p2_shadow_masking":
@@ -385,6 +380,7 @@ def _run_attack_worker(job_id: str, req: "RunAttackRequest") -> None:
                     clock_step_seconds=43200,
                     max_perms_per_grid=24,
                     null_artifact_path=f"K4_MASK_{meta['mode'].replace(':', '-')}_NULL.json",
+                    progress_cb=lambda _info: _update_job(job_id),  # cancellation check per clock state
                 )
                 for c in result.get("best_candidates", []):
                     c["mask_mode"] = meta["mode"]
@@ -409,12 +405,12 @@ def _run_attack_worker(job_id: str, req: "RunAttackRequest") -> None:
             try:
                 from kryptos.k4.composite_sweep import _vigenere_decrypt, _keyword_hits
                 from kryptos.k4.transposition_analysis import apply_columnar_permutation_reverse
-                from itertools import permutations as _perms
+                from kryptos.k4.transposition import sample_permutations
                 ct = "".join(c for c in K4.upper() if c.isalpha())
                 for alpha_name, alphabet in KNOWN_KEYED_ALPHABETS.items():
                     stripped = _vigenere_decrypt(ct, state["shifts"], alphabet)
                     for n_cols in [7, 8, 10]:
-                        for perm in list(_perms(range(n_cols)))[:120]:
+                        for perm in sample_permutations(n_cols, 120, strategy="strided"):
                             candidate = apply_columnar_permutation_reverse(stripped, n_cols, list(perm))
                             hits = _keyword_hits(candidate)
                             if hits > 0:
@@ -429,7 +425,7 @@ def _run_attack_worker(job_id: str, req: "RunAttackRequest") -> None:
         from kryptos.k4.composite_sweep import _vigenere_decrypt, _keyword_hits, K4
         from kryptos.k4.transposition_analysis import apply_columnar_permutation_reverse
         from kryptos.k4.vigenere_key_recovery import KNOWN_KEYED_ALPHABETS
-        from itertools import permutations as _perms
+        from kryptos.k4.transposition import sample_permutations
 
         base = [clock_state_for_time(t) for t, _ in CIA_TIMESTAMP_TIMES]
         states = get_tz_offset_states(base)
@@ -441,7 +437,7 @@ def _run_attack_worker(job_id: str, req: "RunAttackRequest") -> None:
             for alpha_name, alphabet in KNOWN_KEYED_ALPHABETS.items():
                 stripped = _vigenere_decrypt(ct, state["shifts"], alphabet)
                 for n_cols in [7, 8, 10]:
-                    for perm in list(_perms(range(n_cols)))[:120]:
+                    for perm in sample_permutations(n_cols, 120, strategy="strided"):
                         candidate = apply_columnar_permutation_reverse(stripped, n_cols, list(perm))
                         hits = _keyword_hits(candidate)
                         if hits > 0:
@@ -452,14 +448,10 @@ def _run_attack_worker(job_id: str, req: "RunAttackRequest") -> None:
     elif attack_id == "p5_two_crib_filter":
         from kryptos.k4.three_layer_composite import run_three_layer_composite, CIA_PRIORITY_TIMES
 
-        def _progress(info: dict[str, Any]) -> None:
-            pct = (info["clock_idx"] / info["total_clock"]) * 100
-            _update_job(job_id, progress_pct=round(pct, 1), clock_time=info["clock_time"], total_candidates=info["total_candidates"], top_candidates=info["top_candidates"])
-
         summary = run_three_layer_composite(
             keyword_eureka_threshold=2,  # relaxed to 2 cribs
             max_perms_per_grid=req.max_perms_per_grid or 120,
-            progress_cb=_progress,
+            progress_cb=_clock_progress(job_id),
             null_artifact_path="K4_P5_2CRIB_NULL.json",
             eureka_snapshot_path="K4_P5_2CRIB_EUREKA.md",
         )
@@ -485,7 +477,7 @@ def _run_attack_worker(job_id: str, req: "RunAttackRequest") -> None:
         from kryptos.k4.composite_sweep import _vigenere_decrypt, _keyword_hits, K4
         from kryptos.k4.transposition_analysis import apply_columnar_permutation_reverse
         from kryptos.k4.vigenere_key_recovery import KNOWN_KEYED_ALPHABETS
-        from itertools import permutations as _perms
+        from kryptos.k4.transposition import sample_permutations
 
         states = get_magnetic_declination_states()
         ct = "".join(c for c in K4.upper() if c.isalpha())
@@ -496,7 +488,7 @@ def _run_attack_worker(job_id: str, req: "RunAttackRequest") -> None:
             for alpha_name, alphabet in KNOWN_KEYED_ALPHABETS.items():
                 stripped = _vigenere_decrypt(ct, state["shifts"], alphabet)
                 for n_cols in [7, 8, 10]:
-                    for perm in list(_perms(range(n_cols)))[:120]:
+                    for perm in sample_permutations(n_cols, 120, strategy="strided"):
                         candidate = apply_columnar_permutation_reverse(stripped, n_cols, list(perm))
                         hits = _keyword_hits(candidate)
                         if hits > 0:
@@ -510,41 +502,21 @@ def _run_attack_worker(job_id: str, req: "RunAttackRequest") -> None:
     elif attack_id == "p12_misspelling":
         from kryptos.k4.misspelling_alphabets import run_misspelling_sweep
 
-        def _progress_p12(info: dict[str, Any]) -> None:
-            pct = (info["clock_idx"] / info["total_clock"]) * 100
-            _update_job(
-                job_id,
-                progress_pct=round(pct, 1),
-                clock_time=info["clock_time"],
-                total_candidates=info["total_candidates"],
-                top_candidates=info["top_candidates"],
-            )
-
         summary = run_misspelling_sweep(
             grid_sizes=req.grid_sizes,
             priority_only=req.priority_only,
             max_perms_per_grid=req.max_perms_per_grid or 120,
-            progress_cb=_progress_p12,
+            progress_cb=_clock_progress(job_id),
         )
 
     elif attack_id == "p11_alt_keywords":
         from kryptos.k4.alt_keywords import run_alt_keyword_sweep
 
-        def _progress_p11(info: dict[str, Any]) -> None:
-            pct = (info["clock_idx"] / info["total_clock"]) * 100
-            _update_job(
-                job_id,
-                progress_pct=round(pct, 1),
-                clock_time=info["clock_time"],
-                total_candidates=info["total_candidates"],
-                top_candidates=info["top_candidates"],
-            )
-
         summary = run_alt_keyword_sweep(
             grid_sizes=req.grid_sizes,
             priority_only=req.priority_only,
             max_perms_per_grid=req.max_perms_per_grid or 120,
-            progress_cb=_progress_p11,
+            progress_cb=_clock_progress(job_id),
         )
 
     elif attack_id == "p18_key_csp":
@@ -568,61 +540,75 @@ def _run_attack_worker(job_id: str, req: "RunAttackRequest") -> None:
     elif attack_id == "p19_advisory_keywords":
         from kryptos.k4.advisory_keywords import run_advisory_keyword_sweep
 
-        def _progress_p19(info: dict[str, Any]) -> None:
-            pct = (info["clock_idx"] / info["total_clock"]) * 100
-            _update_job(
-                job_id,
-                progress_pct=round(pct, 1),
-                clock_time=info["clock_time"],
-                total_candidates=info["total_candidates"],
-                top_candidates=info["top_candidates"],
-            )
-
         summary = run_advisory_keyword_sweep(
             grid_sizes=req.grid_sizes,
             priority_only=req.priority_only,
             max_perms_per_grid=req.max_perms_per_grid or 120,
-            progress_cb=_progress_p19,
+            progress_cb=_clock_progress(job_id),
         )
 
     elif attack_id == "p20_cyrillic_projector":
         from kryptos.k4.cyrillic_projector import run_cyrillic_projector_sweep
 
-        def _progress_p20(info: dict[str, Any]) -> None:
-            pct = (info["clock_idx"] / info["total_clock"]) * 100
-            _update_job(
-                job_id,
-                progress_pct=round(pct, 1),
-                clock_time=info["clock_time"],
-                total_candidates=info["total_candidates"],
-                top_candidates=info["top_candidates"],
-            )
-
         summary = run_cyrillic_projector_sweep(
             grid_sizes=req.grid_sizes,
             priority_only=req.priority_only,
             max_perms_per_grid=req.max_perms_per_grid or 120,
-            progress_cb=_progress_p20,
+            progress_cb=_clock_progress(job_id),
         )
 
     else:
         summary = {"status": "error", "error": f"Unknown attack: {attack_id}"}
 
-    _update_job(
-        job_id,
-        status="complete",
-        progress_pct=100.0,
-        summary=summary,
-        total_candidates=summary.get("total_candidates", summary.get("states_tested", summary.get("variants_tested", 0))),
-        top_candidates=summary.get("best_candidates", [])[:5],
-    )
+    return summary
+
+
+def _execute_job(job_id: str, params: dict[str, Any]) -> dict[str, Any]:
+    """JobQueue runner: run one attack job and return its final job fields."""
+    from kryptos.k4.eureka import EurekaSignal
+
+    req = RunAttackRequest(**params)
+    try:
+        summary = _run_attack_worker(job_id, req)
+    except EurekaSignal as e:
+        logger.critical("EUREKA SIGNAL in %s attack! %s", req.attack_id, e)
+        return {
+            "status": "eureka",
+            "progress_pct": 100.0,
+            "summary": {"snapshot_path": e.snapshot_path, "result": e.result},
+        }
+    return {
+        "status": "complete",
+        "progress_pct": 100.0,
+        "summary": summary,
+        "total_candidates": summary.get("total_candidates", summary.get("states_tested", summary.get("variants_tested", 0))),
+        "top_candidates": summary.get("best_candidates", [])[:5],
+    }
 
 
 # ---------------------------------------------------------------------------
 # Router factory
 # ---------------------------------------------------------------------------
-def create_k4_attack_router() -> APIRouter:
-    router = APIRouter(prefix="/api/k4/attacks", tags=["k4-attacks"])
+def create_k4_attack_router(
+    job_db: Path | None = None,
+    max_workers: int = DEFAULT_JOB_WORKERS,
+) -> APIRouter:
+    """Build the attack router and its job queue.
+
+    ``job_db`` defaults to ``artifacts/k4_jobs/jobs.sqlite``. Unfinished jobs
+    from a previous run are recovered on app startup.
+    """
+    global _QUEUE
+
+    job_queue = JobQueue(_execute_job, db_path=job_db or _default_job_db(), max_workers=max_workers)
+    _QUEUE = job_queue
+
+    router = APIRouter(
+        prefix="/api/k4/attacks",
+        tags=["k4-attacks"],
+        on_startup=[job_queue.recover],
+        on_shutdown=[job_queue.shutdown],
+    )
 
     @router.get("/frontier", response_model=FrontierVectorsResponse)
     def frontier() -> FrontierVectorsResponse:
@@ -638,37 +624,38 @@ def create_k4_attack_router() -> APIRouter:
                 detail=f"Attack '{req.attack_id}' is not runnable. Runnable: {sorted(_RUNNABLE)}",
             )
 
-        job_id = _new_job(req.attack_id)
-        _update_job(job_id, status="running")
-
-        def _worker() -> None:
-            try:
-                from kryptos.k4.eureka import EurekaSignal
-                _run_attack_worker(job_id, req)
-            except EurekaSignal as e:
-                logger.critical("EUREKA SIGNAL in %s attack! %s", req.attack_id, e)
-                _update_job(
-                    job_id,
-                    status="eureka",
-                    progress_pct=100.0,
-                    summary={"snapshot_path": e.snapshot_path, "result": e.result},
-                )
-            except Exception as exc:  # noqa: BLE001
-                logger.exception("%s attack job %s failed", req.attack_id, job_id)
-                _update_job(job_id, status="error", error=str(exc))
-
-        t = threading.Thread(target=_worker, daemon=True, name=f"k4-{req.attack_id[:6]}-{job_id[:8]}")
-        t.start()
-
-        return JobStatusResponse(**_get_job(job_id))  # type: ignore[arg-type]
+        job = job_queue.submit(req.attack_id, req.model_dump())
+        return JobStatusResponse(**job_queue.get(job["job_id"]))  # type: ignore[arg-type]
 
     @router.get("/jobs/{job_id}", response_model=JobStatusResponse)
     def job_status(job_id: str) -> JobStatusResponse:
-        job = _get_job(job_id)
+        job = job_queue.get(job_id)
         if job is None:
             raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
         return JobStatusResponse(**job)
 
+    @router.get("/jobs/{job_id}/events")
+    async def job_events(request: Request, job_id: str) -> StreamingResponse:
+        if job_queue.store.get(job_id) is None:
+            raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+        stream = log_event_stream(
+            request.is_disconnected,
+            backlog=EVENT_BUFFER_CAPACITY,
+            buffer=job_queue.events(job_id),
+            until=lambda: job_queue.events_closed(job_id),
+        )
+        headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        return StreamingResponse(stream, media_type="text/event-stream", headers=headers)
+
+    @router.delete("/jobs/{job_id}", response_model=JobStatusResponse)
+    def cancel_job(job_id: str) -> JobStatusResponse:
+        job = job_queue.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+        if job["status"] in TERMINAL_STATUSES:
+            raise HTTPException(status_code=409, detail=f"Job {job_id} already finished ({job['status']})")
+        return JobStatusResponse(**job_queue.cancel(job_id))  # type: ignore[arg-type]
+
     return router
 
 
@@ -2,9 +2,9 @@
 
 A process-wide :class:`LogBuffer` (a bounded, thread-safe ring) is fed by a
 :class:`logging.Handler` attached to the ``kryptos`` logger. The SSE endpoint
-replays the recent backlog and then polls the buffer for new lines, so log
-records emitted from worker threads need no asyncio/thread coordination — the
-generator just reads the latest sequence numbers on each tick.
+replays the recent backlog and then sleeps in :meth:`LogBuffer.wait` until a
+new line arrives: appends from any thread wake the waiting streams through
+``loop.call_soon_threadsafe``, so idle clients cost nothing between lines.
 """
 
 from __future__ import annotations
@@ -12,8 +12,10 @@ from __future__ import annotations
 import asyncio
 import logging
 import threading
+import time
 from collections import deque
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
+from itertools import islice
 
 DEFAULT_CAPACITY = 1000
 _DEFAULT_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
@@ -21,18 +23,26 @@ _HANDLER_MARKER = "_kryptos_sse_handler"
 
 
 class LogBuffer:
-    """Bounded ring of formatted log lines, each tagged with a monotonic seq."""
+    """Bounded ring of formatted log lines, each tagged with a monotonic seq.
+
+    Sequence numbers are consecutive, so the entries after a cursor are always
+    the newest ``latest_seq() - cursor`` ones and :meth:`since` never scans
+    the entries it does not return.
+    """
 
     def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
         self._buf: deque[tuple[int, str]] = deque(maxlen=capacity)
         self._seq = 0
         self._lock = threading.Lock()
+        self._waiters: dict[asyncio.AbstractEventLoop, set[asyncio.Event]] = {}
 
     def append(self, line: str) -> int:
         with self._lock:
             self._seq += 1
             self._buf.append((self._seq, line))
-            return self._seq
+            seq = self._seq
+        self.notify()
+        return seq
 
     def latest_seq(self) -> int:
         with self._lock:
@@ -41,13 +51,51 @@ class LogBuffer:
     def tail(self, count: int) -> list[tuple[int, str]]:
         """Return up to ``count`` most-recent entries (oldest first)."""
         with self._lock:
-            items = list(self._buf)
-        return items[-count:] if count > 0 else []
+            return list(islice(reversed(self._buf), count))[::-1] if count > 0 else []
 
     def since(self, seq: int) -> list[tuple[int, str]]:
         """Return entries with sequence strictly greater than ``seq``."""
         with self._lock:
-            return [(s, line) for (s, line) in self._buf if s > seq]
+            count = min(self._seq - seq, len(self._buf))
+            return list(islice(reversed(self._buf), count))[::-1] if count > 0 else []
+
+    def notify(self) -> None:
+        """Wake every :meth:`wait` in progress (one thread-safe callback per event loop)."""
+        with self._lock:
+            if not self._waiters:
+                return
+            waiters = [(loop, list(events)) for loop, events in self._waiters.items()]
+        for loop, events in waiters:
+            try:
+                loop.call_soon_threadsafe(_set_all, events)
+            except RuntimeError:  # loop already closed
+                pass
+
+    async def wait(self, seq: int, timeout: float | None = None) -> bool:
+        """Wait for an entry newer than ``seq`` (or a :meth:`notify`); False on timeout."""
+        loop = asyncio.get_running_loop()
+        event = asyncio.Event()
+        with self._lock:
+            if self._seq > seq:
+                return True
+            self._waiters.setdefault(loop, set()).add(event)
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            with self._lock:
+                events = self._waiters.get(loop)
+                if events is not None:
+                    events.discard(event)
+                    if not events:
+                        del self._waiters[loop]
+
+
+def _set_all(events: list[asyncio.Event]) -> None:
+    for event in events:
+        event.set()
 
 
 # Process-wide buffer shared by the handler and the endpoint.
@@ -99,14 +147,19 @@ async def log_event_stream(
     backlog: int = 200,
     follow: bool = True,
     buffer: LogBuffer | None = None,
-    poll_interval: float = 0.5,
+    poll_interval: float = 5.0,
     heartbeat_interval: float = 15.0,
+    until: Callable[[], bool] | None = None,
 ) -> AsyncIterator[str]:
     """Yield SSE frames: the recent backlog, then (if ``follow``) live lines.
 
     ``is_disconnected`` is an awaitable returning True when the client has gone
-    away (e.g. ``starlette.Request.is_disconnected``). Heartbeat comments keep
-    proxies from closing an idle connection.
+    away (e.g. ``starlette.Request.is_disconnected``). Live lines are pushed as
+    soon as they are appended; ``poll_interval`` only bounds how long an idle
+    stream goes between disconnect checks. Heartbeat comments keep proxies from
+    closing an idle connection. If ``until`` is given, the stream ends once it
+    returns True and every line buffered before then was sent; whoever flips it
+    should call :meth:`LogBuffer.notify` so the stream notices promptly.
     """
     buf = buffer or LOG_BUFFER
 
@@ -122,22 +175,24 @@ async def log_event_stream(
     if last_seq == 0:
         last_seq = buf.latest_seq()
 
-    since_heartbeat = 0.0
+    last_sent = time.monotonic()
     while True:
         if await is_disconnected():
             return
+        # Sample ``until`` before reading so nothing buffered ahead of it is dropped.
+        finished = until is not None and until()
         new_entries = buf.since(last_seq)
         if new_entries:
             for seq, line in new_entries:
                 last_seq = seq
                 yield _format_sse(line)
-            since_heartbeat = 0.0
-        else:
-            since_heartbeat += poll_interval
-            if since_heartbeat >= heartbeat_interval:
-                since_heartbeat = 0.0
-                yield ": keep-alive\n\n"
-        await asyncio.sleep(poll_interval)
+            last_sent = time.monotonic()
+        elif not finished and time.monotonic() - last_sent >= heartbeat_interval:
+            last_sent = time.monotonic()
+            yield ": keep-alive\n\n"
+        if finished:
+            return
+        await buf.wait(last_seq, timeout=min(poll_interval, heartbeat_interval))
 
 
 __all__ = [
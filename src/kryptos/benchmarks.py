@@ -9,11 +9,13 @@ Each result row:
 
     {"cipher": "K4", "method": "quagmire_sweep", "time_sec": 1.23,
      "tested": 6240, "tested_per_sec": 5073.2, "space_reduction": null,
-     "status": "null_result", "timestamp": "..."}
+     "clock_dedup_factor": null, "status": "null_result", "timestamp": "..."}
 
 ``space_reduction`` is the fraction of the enumerated space pruned *before*
 the expensive scoring step, for attacks that report a pre-filter (e.g. the
 clock→Hill invertibility filter); ``null`` for attacks with no pre-filter.
+``clock_dedup_factor`` is raw Berlin Clock times per unique shift vector swept,
+for the clock-driven attacks; ``null`` elsewhere.
 
 Attack null artifacts are written to a temporary directory and discarded —
 provenance artifacts belong to real research runs, not benchmarks.
@@ -23,6 +25,7 @@ from __future__ import annotations
 
 import csv
 import json
+import math
 import tempfile
 import time
 from collections.abc import Callable
@@ -35,7 +38,17 @@ from kryptos.k4.eureka import EurekaSignal
 
 DEFAULT_OUT_DIR = "benchmarks"
 
-CSV_FIELDS = ["cipher", "method", "time_sec", "tested", "tested_per_sec", "space_reduction", "status", "timestamp"]
+CSV_FIELDS = [
+    "cipher",
+    "method",
+    "time_sec",
+    "tested",
+    "tested_per_sec",
+    "space_reduction",
+    "clock_dedup_factor",
+    "status",
+    "timestamp",
+]
 
 
 @dataclass
@@ -87,6 +100,551 @@ def _physical_grid(artifact_dir: Path) -> dict[str, Any]:
     return run_physical_grid_attack(null_artifact_path=artifact_dir / "physical_grid.json")
 
 
+SA_BENCH_PERIOD = 8
+SA_BENCH_ITERATIONS = 20_000
+SA_BENCH_SEED = 1234
+
+
+def _sa_transposition_run(incremental: bool, period: int, iterations: int, seed: int) -> dict[str, Any]:
+    import random
+
+    from kryptos.k4.beaufort_sweep import K4
+    from kryptos.k4.transposition_analysis import solve_columnar_permutation_simulated_annealing
+
+    # Slow cooling so the iteration cap (not the temperature floor) ends the run.
+    start = time.perf_counter()
+    perm, score = solve_columnar_permutation_simulated_annealing(
+        K4,
+        period,
+        max_iterations=iterations,
+        initial_temp=50.0,
+        cooling_rate=0.9999,
+        rng=random.Random(seed),
+        incremental=incremental,
+    )
+    elapsed = time.perf_counter() - start
+    return {
+        "time_sec": round(elapsed, 4),
+        "iterations_per_sec": round(iterations / elapsed, 2) if elapsed > 0 else None,
+        "best_perm": perm,
+        "best_score": score,
+    }
+
+
+def _sa_transposition(artifact_dir: Path) -> dict[str, Any]:
+    _sa_transposition_run(True, SA_BENCH_PERIOD, SA_BENCH_ITERATIONS, SA_BENCH_SEED)
+    return {
+        "status": "completed",
+        "run_params": {"total_tested": SA_BENCH_ITERATIONS, "period": SA_BENCH_PERIOD, "seed": SA_BENCH_SEED},
+    }
+
+
+def compare_sa_delta_scoring(
+    period: int = SA_BENCH_PERIOD,
+    iterations: int = SA_BENCH_ITERATIONS,
+    seed: int = SA_BENCH_SEED,
+) -> dict[str, Any]:
+    """Time the SA columnar solver with full re-scoring vs delta scoring.
+
+    Both runs share the seed, so they walk the same proposals and should land on
+    the same permutation; ``equal_final_scores`` confirms it (to 1e-9 — the
+    delta path keeps exact totals where the full path rounds per window).
+    """
+    full = _sa_transposition_run(False, period, iterations, seed)
+    delta = _sa_transposition_run(True, period, iterations, seed)
+    speedup = full["time_sec"] / delta["time_sec"] if delta["time_sec"] else None
+    return {
+        "period": period,
+        "iterations": iterations,
+        "seed": seed,
+        "full": full,
+        "delta": delta,
+        "speedup": round(speedup, 2) if speedup else None,
+        "equal_final_scores": abs(full["best_score"] - delta["best_score"]) <= 1e-9,
+    }
+
+
+INSTRUCTIONAL_BENCH_TEXTS = 10_000
+INSTRUCTIONAL_BENCH_LENGTH = 97
+INSTRUCTIONAL_BENCH_SEED = 97
+
+
+def _random_texts(count: int, length: int, seed: int) -> list[str]:
+    import random
+
+    rng = random.Random(seed)
+    return ["".join(rng.choices("ABCDEFGHIJKLMNOPQRSTUVWXYZ", k=length)) for _ in range(count)]
+
+
+def _instructional_score(artifact_dir: Path) -> dict[str, Any]:
+    from kryptos.k4.scoring_instructional import instructional_score
+
+    for text in _random_texts(INSTRUCTIONAL_BENCH_TEXTS, INSTRUCTIONAL_BENCH_LENGTH, INSTRUCTIONAL_BENCH_SEED):
+        instructional_score(text)
+    return {
+        "status": "completed",
+        "run_params": {"total_tested": INSTRUCTIONAL_BENCH_TEXTS, "length": INSTRUCTIONAL_BENCH_LENGTH},
+    }
+
+
+def _linear_instructional_score(
+    text: str,
+    vocabulary: frozenset[str] | None = None,
+    fuzzy_tol: int = 1,
+    min_word: int = 3,
+    max_word: int = 12,
+) -> float:
+    # The pre-deletion-index instructional_score: the same window walk, matching
+    # each window with the linear Levenshtein scan over the vocabulary.
+    from kryptos.k4.scoring_instructional import INSTRUCTIONAL_VECTORS, _fuzzy_match, _word_bonus
+
+    vocabulary = frozenset(INSTRUCTIONAL_VECTORS if vocabulary is None else vocabulary)
+    seq = "".join(c for c in text.upper() if c.isalpha())
+    if len(seq) < min_word:
+        return 0.0
+    total, matched = 0.0, set()
+    for size in range(max_word, min_word - 1, -1):
+        for i in range(len(seq) - size + 1):
+            match = _fuzzy_match(seq[i : i + size], vocabulary, tol=fuzzy_tol)
+            positions = set(range(i, i + size))
+            if match is not None and not positions & matched:
+                matched |= positions
+                total += _word_bonus(match)
+    return total * 100.0 / len(seq)
+
+
+def compare_instructional_matcher(
+    n_texts: int = INSTRUCTIONAL_BENCH_TEXTS,
+    baseline_texts: int = 100,
+    length: int = INSTRUCTIONAL_BENCH_LENGTH,
+    seed: int = INSTRUCTIONAL_BENCH_SEED,
+) -> dict[str, Any]:
+    """Time ``instructional_score`` with the deletion index vs the linear Levenshtein scan.
+
+    The indexed path scores all ``n_texts``; the linear scan (~0.4 s per 97-char
+    text) is timed on the first ``baseline_texts`` and extrapolated per text.
+    ``equal_scores`` checks both paths agree on that shared subset.
+    """
+    from kryptos.k4 import scoring_instructional as si
+
+    texts = _random_texts(n_texts, length, seed)
+
+    start = time.perf_counter()
+    indexed_scores = [si.instructional_score(t) for t in texts]
+    indexed = time.perf_counter() - start
+
+    subset = texts[:baseline_texts]
+    start = time.perf_counter()
+    linear_scores = [_linear_instructional_score(t) for t in subset]
+    linear = time.perf_counter() - start
+
+    indexed_per_text = indexed / n_texts if n_texts else 0.0
+    linear_per_text = linear / len(subset) if subset else 0.0
+    return {
+        "n_texts": n_texts,
+        "baseline_texts": len(subset),
+        "indexed_time_sec": round(indexed, 4),
+        "indexed_per_text_sec": round(indexed_per_text, 6),
+        "linear_per_text_sec": round(linear_per_text, 6),
+        "speedup": round(linear_per_text / indexed_per_text, 2) if indexed_per_text else None,
+        "equal_scores": linear_scores == indexed_scores[: len(subset)],
+    }
+
+
+FUZZY_BENCH_KEYS = 10_000
+FUZZY_BENCH_QUERIES = 200
+FUZZY_BENCH_SIZES = (10_000, 100_000, 1_000_000)
+FUZZY_BENCH_SEED = 26
+
+
+def _random_keys(count: int, seed: int, min_len: int = 6, max_len: int = 10) -> list[str]:
+    import random
+
+    rng = random.Random(seed)
+    alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    return ["".join(rng.choices(alphabet, k=rng.randint(min_len, max_len))) for _ in range(count)]
+
+
+def _fuzzy_queries(keys: list[str], count: int, seed: int) -> list[str]:
+    # Half fresh random keys (mostly misses), half one-letter mutations of tried keys (hits).
+    import random
+
+    rng = random.Random(seed)
+    queries = _random_keys(count - count // 2, seed + 1)
+    for key in rng.sample(keys, count // 2):
+        i = rng.randrange(len(key))
+        queries.append(key[:i] + rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ") + key[i + 1 :])
+    return queries
+
+
+def _fuzzy_tracker(keys: list[str], cache_dir: Path):
+    from kryptos.provenance.search_space import SearchSpaceTracker
+
+    tracker = SearchSpaceTracker(cache_dir=cache_dir)
+    tracker._tried_keys["vigenere"] = set(keys)  # skip tried_keys.jsonl: only the lookup is timed
+    return tracker
+
+
+def _fuzzy_dedup(artifact_dir: Path) -> dict[str, Any]:
+    keys = _random_keys(FUZZY_BENCH_KEYS, FUZZY_BENCH_SEED)
+    tracker = _fuzzy_tracker(keys, artifact_dir / "search_space")
+    for query in _fuzzy_queries(keys, FUZZY_BENCH_QUERIES, FUZZY_BENCH_SEED):
+        tracker.already_tried_fuzzy("vigenere", query, tol=1)
+    return {
+        "status": "completed",
+        "run_params": {"total_tested": FUZZY_BENCH_QUERIES, "tried_keys": FUZZY_BENCH_KEYS},
+    }
+
+
+def compare_fuzzy_dedup(
+    sizes: tuple[int, ...] = FUZZY_BENCH_SIZES,
+    n_queries: int = FUZZY_BENCH_QUERIES,
+    baseline_queries: int = 20,
+    tol: int = 1,
+    seed: int = FUZZY_BENCH_SEED,
+) -> list[dict[str, Any]]:
+    """Time ``already_tried_fuzzy`` with the BK-tree vs the brute-force Levenshtein scan.
+
+    For each tried-key count in ``sizes``: the one-off tree build, the mean
+    indexed query over ``n_queries``, and the brute-force scan timed on the
+    first ``baseline_queries`` queries. ``equal_answers`` checks both agree there.
+    """
+    from kryptos.provenance.search_space import _levenshtein
+
+    rows = []
+    for size in sizes:
+        keys = _random_keys(size, seed)
+        queries = _fuzzy_queries(keys, n_queries, seed)
+        with tempfile.TemporaryDirectory() as tmp:
+            tracker = _fuzzy_tracker(keys, Path(tmp))
+            start = time.perf_counter()
+            tracker.already_tried_fuzzy("vigenere", "", tol=tol)  # first fuzzy query builds the tree
+            build = time.perf_counter() - start
+
+            start = time.perf_counter()
+            indexed = [tracker.already_tried_fuzzy("vigenere", q, tol=tol) for q in queries]
+            indexed_per_query = (time.perf_counter() - start) / len(queries)
+
+        subset = queries[:baseline_queries]
+        start = time.perf_counter()
+        brute = [
+            any(abs(len(k) - len(q)) <= tol and _levenshtein(q, k) <= tol for k in keys) for q in subset
+        ]
+        brute_per_query = (time.perf_counter() - start) / len(subset) if subset else 0.0
+
+        rows.append(
+            {
+                "tried_keys": size,
+                "tol": tol,
+                "build_time_sec": round(build, 3),
+                "indexed_per_query_sec": round(indexed_per_query, 6),
+                "brute_per_query_sec": round(brute_per_query, 6),
+                "speedup": round(brute_per_query / indexed_per_query, 2) if indexed_per_query else None,
+                "equal_answers": brute == indexed[: len(subset)],
+            }
+        )
+    return rows
+
+
+CAMPAIGN_BENCH_SPECS = 50_000
+CAMPAIGN_BENCH_WORKERS = (1, 4, 8)
+CAMPAIGN_BENCH_SEED = 50
+
+
+def _synthetic_campaign_queue(n_specs: int, seed: int) -> list[Any]:
+    # Explicit-key Vigenère specs: each task is one decrypt plus full plaintext validation,
+    # so the run measures dispatch/validation throughput rather than key recovery.
+    from kryptos.pipeline.attack_generator import AttackSpec
+    from kryptos.provenance.attack_log import AttackParameters
+
+    keys = _random_keys(n_specs, seed, min_len=4, max_len=14)
+    return [
+        AttackSpec(
+            parameters=AttackParameters("vigenere", {"key_length": len(key), "key": key, "method": "synthetic"}),
+            priority=0.5,
+            source="benchmark",
+            rationale="synthetic campaign queue",
+            tags=["benchmark"],
+        )
+        for key in keys
+    ]
+
+
+def compare_campaign_workers(
+    n_specs: int = CAMPAIGN_BENCH_SPECS,
+    workers: tuple[int, ...] = CAMPAIGN_BENCH_WORKERS,
+    seed: int = CAMPAIGN_BENCH_SEED,
+) -> list[dict[str, Any]]:
+    """Time ``K4CampaignOrchestrator.run_campaign`` tasks/sec at each worker count.
+
+    The queue is ``n_specs`` synthetic explicit-key Vigenère specs against K4.
+    ``workers=1`` is the in-process serial path; larger counts use the process
+    pool (initializer-built context, tuple tasks, in-worker validation).
+    ``task_payload_bytes`` is the mean pickled size of one pool task.
+    """
+    import pickle
+    from types import SimpleNamespace
+
+    from kryptos.k4.beaufort_sweep import K4
+    from kryptos.pipeline.k4_campaign import K4CampaignOrchestrator
+
+    queue = _synthetic_campaign_queue(n_specs, seed)
+    payload = sum(
+        len(pickle.dumps((n, s.parameters.cipher_type, s.parameters.key_or_params)))
+        for n, s in enumerate(queue[:1000], start=1)
+    ) / min(len(queue), 1000)
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        orchestrator = K4CampaignOrchestrator(workspace_dir=Path(tmp), log_level="WARNING")
+        orchestrator.attack_generator = SimpleNamespace(generate_comprehensive_queue=lambda **_kwargs: queue)
+        for count in workers:
+            orchestrator.max_workers = count
+            start = time.perf_counter()
+            result = orchestrator.run_campaign(K4, max_attacks=n_specs, max_time_seconds=24 * 3600)
+            elapsed = time.perf_counter() - start
+            rows.append(
+                {
+                    "workers": count,
+                    "tasks": result.total_attacks,
+                    "time_sec": round(elapsed, 3),
+                    "tasks_per_sec": round(result.total_attacks / elapsed, 1) if elapsed > 0 else None,
+                    "valid_candidates": result.successful_attacks,
+                    "task_payload_bytes": round(payload, 1),
+                }
+            )
+    return rows
+
+
+def _baseline_stats_per_metric(text: str) -> dict[str, float]:
+    # The pre-single-pass baseline_stats: one helper call (and one re-clean of the text) per metric.
+    from kryptos.k4 import scoring as s
+
+    return {
+        "chi_square": s.chi_square_stat(text),
+        "bigram_score": s.bigram_score(text),
+        "trigram_score": s.trigram_score(text),
+        "quadgram_score": s.quadgram_score(text) if s.QUADGRAMS else 0.0,
+        "crib_bonus": s.crib_bonus(text),
+        "rarity_weighted_crib_bonus": s.rarity_weighted_crib_bonus(text),
+        "combined_score": s.combined_plaintext_score(text),
+        "index_of_coincidence": s.index_of_coincidence(text),
+        "vowel_ratio": s.vowel_ratio(text),
+        "letter_coverage": s.letter_coverage(text),
+        "letter_entropy": s.letter_entropy(text),
+        "repeating_bigram_fraction": s.repeating_bigram_fraction(text),
+        "wordlist_hit_rate": s.wordlist_hit_rate(text),
+        "trigram_entropy": s.trigram_entropy(text),
+        "bigram_gap_variance": s.bigram_gap_variance(text),
+        "berlin_clock_pattern_bonus": float(s.berlin_clock_pattern_validator(text)["pattern_bonus"]),
+    }
+
+
+def compare_baseline_stats(n_candidates: int = 50, repeats: int = 20, seed: int = 97) -> dict[str, Any]:
+    """``reporting.write_candidates_json`` for ``n_candidates`` 97-char candidates: single-pass vs per-metric stats.
+
+    Best-of-``repeats`` wall time per report write with the single-pass
+    ``baseline_stats`` and with the old one-helper-per-metric version
+    swapped in; ``equal_metrics`` checks both produce identical metrics.
+    """
+    from unittest import mock
+
+    from kryptos.k4 import reporting
+    from kryptos.k4.scoring import baseline_stats
+
+    texts = _random_texts(n_candidates, 97, seed)
+    candidates = [{"text": t, "score": -float(i)} for i, t in enumerate(texts)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        out = str(Path(tmp) / "k4_candidates.json")
+
+        def _best_write() -> float:
+            times = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                reporting.write_candidates_json("bench", "K4", texts[0], candidates, output_path=out)
+                times.append(time.perf_counter() - start)
+            return min(times)
+
+        single_s = _best_write()
+        with mock.patch.object(reporting, "baseline_stats", _baseline_stats_per_metric):
+            per_metric_s = _best_write()
+    return {
+        "candidates": n_candidates,
+        "per_metric_ms": round(per_metric_s * 1000, 2),
+        "single_pass_ms": round(single_s * 1000, 2),
+        "speedup": round(per_metric_s / single_s, 2) if single_s > 0 else None,
+        "equal_metrics": all(baseline_stats(t) == _baseline_stats_per_metric(t) for t in texts),
+    }
+
+
+COLUMNAR_BENCH_WIDTHS = (5, 6, 7, 8, 9, 10)
+COLUMNAR_BENCH_PERMS = 5_000
+COLUMNAR_BENCH_SEED = 97
+
+
+def _columnar_split_join(ct: str, n_cols: int, perm: tuple[int, ...]) -> str:
+    # The pre-gather inverse: slice columns, reorder them, read the grid row by row.
+    n = len(ct)
+    n_rows = (n + n_cols - 1) // n_cols
+    full_cols = n % n_cols if n % n_cols != 0 else n_cols
+    col_lengths = [n_rows if i < full_cols else (n_rows - 1) for i in range(n_cols)]
+    cols: list[str] = []
+    idx = 0
+    for p in perm:
+        cols.append(ct[idx : idx + col_lengths[p]])
+        idx += col_lengths[p]
+    original_order = [""] * n_cols
+    for read_index, p in enumerate(perm):
+        original_order[p] = cols[read_index]
+    return "".join(cell[r] for r in range(n_rows) for cell in original_order if r < len(cell))
+
+
+def _columnar_perms(width: int, n_perms: int, seed: int) -> list[tuple[int, ...]]:
+    import random
+
+    from kryptos.k4.transposition import sample_permutations
+
+    return list(sample_permutations(width, n_perms, random.Random(seed)))
+
+
+def _columnar_gather(artifact_dir: Path) -> dict[str, Any]:
+    from kryptos.k4.beaufort_sweep import K4
+    from kryptos.k4.transposition import apply_columnar_permutations
+
+    total = 0
+    for width in COLUMNAR_BENCH_WIDTHS:
+        perms = _columnar_perms(width, COLUMNAR_BENCH_PERMS, COLUMNAR_BENCH_SEED)
+        total += len(apply_columnar_permutations(K4, width, perms))
+    return {"status": "completed", "run_params": {"total_tested": total, "widths": list(COLUMNAR_BENCH_WIDTHS)}}
+
+
+def compare_columnar_gather(
+    widths: tuple[int, ...] = COLUMNAR_BENCH_WIDTHS,
+    n_perms: int = COLUMNAR_BENCH_PERMS,
+    seed: int = COLUMNAR_BENCH_SEED,
+) -> list[dict[str, Any]]:
+    """Permutations/sec inverting a columnar transposition of the 97-char K4 text.
+
+    Per width: the old split/reorder/join inverse, ``apply_columnar_permutation``
+    (cached column layout + ``itemgetter`` gather) and the batched
+    ``apply_columnar_permutations`` (one NumPy ``take``). ``equal_texts``
+    checks all three agree on every permutation.
+    """
+    from kryptos.k4.beaufort_sweep import K4
+    from kryptos.k4.transposition import apply_columnar_permutation, apply_columnar_permutations
+
+    def _rate(fn: Callable[[], list[str]]) -> tuple[list[str], float | None]:
+        start = time.perf_counter()
+        out = fn()
+        elapsed = time.perf_counter() - start
+        return out, round(len(out) / elapsed, 1) if elapsed > 0 else None
+
+    rows = []
+    for width in widths:
+        perms = _columnar_perms(width, n_perms, seed)
+        split_join, split_join_rate = _rate(lambda: [_columnar_split_join(K4, width, p) for p in perms])
+        gather, gather_rate = _rate(lambda: [apply_columnar_permutation(K4, width, p) for p in perms])
+        batched, batched_rate = _rate(lambda: apply_columnar_permutations(K4, width, perms))
+        rows.append(
+            {
+                "cols": width,
+                "perms": len(perms),
+                "split_join_per_sec": split_join_rate,
+                "gather_per_sec": gather_rate,
+                "batched_per_sec": batched_rate,
+                "equal_texts": split_join == gather == batched,
+            }
+        )
+    return rows
+
+
+COLUMNAR_BNB_WIDTHS = (5, 6, 7, 8)
+
+
+def _columnar_bnb(artifact_dir: Path) -> dict[str, Any]:
+    from kryptos.k4.beaufort_sweep import K4
+    from kryptos.k4.transposition import branch_and_bound_width
+
+    nodes = sum(branch_and_bound_width(K4, width, top_k=1)[1] for width in COLUMNAR_BNB_WIDTHS)
+    return {"status": "completed", "run_params": {"total_tested": nodes, "widths": list(COLUMNAR_BNB_WIDTHS)}}
+
+
+def compare_columnar_branch_and_bound(
+    widths: tuple[int, ...] = COLUMNAR_BNB_WIDTHS,
+    top_k: int = 1,
+) -> list[dict[str, Any]]:
+    """Exact best columnar permutations on K4: branch-and-bound vs scoring every permutation.
+
+    ``tree_nodes`` is the size of the full read-order search tree (every
+    prefix of every permutation) and ``bnb_nodes`` the part of it the bound
+    let the search visit. ``equal_scores`` checks both return the same
+    top-``top_k`` quadgram scores. How much is cut depends on the n-gram
+    table: the bound is only as tight as the gap between the best listed
+    gram and the unknown-gram score.
+    """
+    import itertools
+
+    from kryptos.k4.beaufort_sweep import K4
+    from kryptos.k4.scoring import quadgram_score
+    from kryptos.k4.transposition import apply_columnar_permutations, branch_and_bound_width
+
+    rows = []
+    for width in widths:
+        start = time.perf_counter()
+        perms = list(itertools.permutations(range(width)))
+        scores = sorted(map(quadgram_score, apply_columnar_permutations(K4, width, perms)), reverse=True)
+        naive_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        ranked, nodes = branch_and_bound_width(K4, width, top_k=top_k)
+        bnb_s = time.perf_counter() - start
+        tree_nodes = sum(math.perm(width, depth) for depth in range(width + 1))
+        rows.append(
+            {
+                "cols": width,
+                "perms": len(perms),
+                "tree_nodes": tree_nodes,
+                "bnb_nodes": nodes,
+                "nodes_visited_frac": round(nodes / tree_nodes, 3),
+                "naive_s": round(naive_s, 3),
+                "bnb_s": round(bnb_s, 3),
+                "equal_scores": [score for score, _ in ranked] == scores[:top_k],
+            }
+        )
+    return rows
+
+
+VIGENERE_BEAM_PERIODS = tuple(range(4, 15))
+VIGENERE_BEAM_SEED = 14
+
+
+def _vigenere_beam(artifact_dir: Path) -> dict[str, Any]:
+    import random
+
+    from kryptos.k4.running_key import K3_PLAINTEXT_FULL
+    from kryptos.k4.vigenere_key_recovery import KEYED_ALPHABET, recover_key_by_frequency
+
+    alphabet = KEYED_ALPHABET
+    plaintext = "".join(c for c in K3_PLAINTEXT_FULL if c.isalpha())
+    rng = random.Random(VIGENERE_BEAM_SEED)
+    recovered = 0
+    for period in VIGENERE_BEAM_PERIODS:
+        key = "".join(rng.choice(alphabet) for _ in range(period))
+        ct = "".join(
+            alphabet[(alphabet.index(c) + alphabet.index(key[i % period])) % 26] for i, c in enumerate(plaintext)
+        )
+        recovered += key in recover_key_by_frequency(ct, period, top_n=10)
+    return {
+        "status": "completed",
+        "run_params": {
+            "total_tested": len(VIGENERE_BEAM_PERIODS),
+            "periods": list(VIGENERE_BEAM_PERIODS),
+            "recovered_in_top_10": recovered,
+        },
+    }
+
+
 BENCHMARK_CASES: dict[str, BenchmarkCase] = {
     "beaufort_sweep": BenchmarkCase("K4", "beaufort_sweep", _beaufort),
     "quagmire_sweep": BenchmarkCase("K4", "quagmire_sweep", _quagmire),
@@ -95,6 +653,12 @@ BENCHMARK_CASES: dict[str, BenchmarkCase] = {
     "clock_subrow": BenchmarkCase("K4", "clock_subrow_attack", _clock_subrow),
     "clock_transposition": BenchmarkCase("K4", "clock_transposition_attack", _clock_transposition),
     "physical_grid": BenchmarkCase("K4", "physical_grid_attack", _physical_grid),
+    "sa_transposition": BenchmarkCase("K4", "sa_transposition_delta", _sa_transposition),
+    "instructional_score": BenchmarkCase("K4", "instructional_score_index", _instructional_score),
+    "fuzzy_dedup": BenchmarkCase("K4", "fuzzy_dedup_bktree", _fuzzy_dedup),
+    "columnar_gather": BenchmarkCase("K4", "columnar_gather", _columnar_gather),
+    "columnar_bnb": BenchmarkCase("K4", "columnar_branch_and_bound", _columnar_bnb),
+    "vigenere_beam": BenchmarkCase("K4", "vigenere_beam_key_recovery", _vigenere_beam),
 }
 
 
@@ -116,6 +680,11 @@ def _extract_space_reduction(summary: dict[str, Any]) -> float | None:
     return None
 
 
+def _extract_clock_dedup_factor(summary: dict[str, Any]) -> float | None:
+    factor = summary.get("run_params", {}).get("clock_dedup_factor")
+    return float(factor) if factor is not None else None
+
+
 def run_benchmarks(
     names: list[str] | None = None,
     out_dir: str | Path = DEFAULT_OUT_DIR,
@@ -158,6 +727,7 @@ def run_benchmarks(
                     "tested": tested,
                     "tested_per_sec": round(tested / elapsed, 2) if tested and elapsed > 0 else None,
                     "space_reduction": _extract_space_reduction(summary),
+                    "clock_dedup_factor": _extract_clock_dedup_factor(summary),
                     "status": status,
                     "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
                 }
@@ -188,4 +758,14 @@ def format_results_table(rows: list[dict[str, Any]]) -> str:
     return "\n".join(lines)
 
 
-__all__ = ["BENCHMARK_CASES", "BenchmarkCase", "run_benchmarks", "format_results_table", "CSV_FIELDS"]
+__all__ = [
+    "BENCHMARK_CASES",
+    "BenchmarkCase",
+    "run_benchmarks",
+    "format_results_table",
+    "compare_sa_delta_scoring",
+    "compare_instructional_matcher",
+    "compare_fuzzy_dedup",
+    "compare_campaign_workers",
+    "CSV_FIELDS",
+]
@@ -309,6 +309,17 @@ def build_parser() -> argparse.ArgumentParser:
     sp_db_init = sub.add_parser("db-init", help="Create kryptos Postgres/Neon tables (requires DATABASE_URL)")
     sp_db_init.set_defaults(func=cmd_db_init)
 
+    sp_attack_migrate = sub.add_parser(
+        "attack-log-migrate", help="Import attack_log.jsonl into the indexed SQLite provenance store"
+    )
+    sp_attack_migrate.add_argument(
+        "--log-dir", type=str, default="", help="Attack log directory (default: artifacts/attack_logs)"
+    )
+    sp_attack_migrate.add_argument(
+        "--jsonl", type=str, default="", help="JSONL log to import (default: <log-dir>/attack_log.jsonl)"
+    )
+    sp_attack_migrate.set_defaults(func=cmd_attack_log_migrate)
+
     sp_benchmark = sub.add_parser("benchmark", help="Run K4 attack-sweep benchmarks (writes results.json/csv)")
     sp_benchmark.add_argument("--cases", type=str, default="", help="Comma-separated case names (default: all)")
     sp_benchmark.add_argument(
@@ -477,6 +488,25 @@ def cmd_db_init(args: argparse.Namespace) -> int:
     return 0
 
 
+def cmd_attack_log_migrate(args: argparse.Namespace) -> int:
+    """Import an attack_log.jsonl into the SQLite provenance store."""
+    from kryptos.paths import get_artifacts_root
+    from kryptos.provenance.attack_log import ATTACK_DB_FILENAME, migrate_jsonl_log
+
+    log_dir = Path(args.log_dir) if args.log_dir else get_artifacts_root() / "attack_logs"
+    jsonl = Path(args.jsonl) if args.jsonl else None
+    try:
+        counts = migrate_jsonl_log(log_dir, jsonl_path=jsonl)
+    except OSError as exc:
+        print(f"attack-log-migrate failed: {exc}")
+        return 1
+    print(
+        f"Imported {counts['imported']} attacks into {log_dir / ATTACK_DB_FILENAME}"
+        f" ({counts['duplicates']} duplicates, {counts['invalid']} invalid lines skipped)"
+    )
+    return 0
+
+
 def cmd_benchmark(args: argparse.Namespace) -> int:
     """Run attack-sweep benchmarks and write results.json/results.csv."""
     from kryptos.benchmarks import format_results_table, run_benchmarks
@@ -1,13 +1,33 @@
-"""Thin database connection helper — reads DATABASE_URL from the environment."""
+"""Thin database connection helper — reads DATABASE_URL from the environment.
+
+Connections come from one process-wide ``psycopg2.pool.ThreadedConnectionPool``
+so repeated persistence calls reuse an open connection instead of paying a
+TCP + auth handshake each time. The pool is created lazily on first checkout
+and rebuilt after ``fork`` (a child never touches its parent's sockets).
+psycopg2's pool raises ``PoolError`` rather than waiting once every connection
+is checked out, so :func:`get_conn` first takes one of ``POOL_MAX_CONN``
+semaphore slots, blocking up to ``POOL_CHECKOUT_TIMEOUT`` seconds.
+"""
 
 from __future__ import annotations
 
 import os
+import threading
 from collections.abc import Generator
 from contextlib import contextmanager
+from typing import Any
 
 _URL_ENV = "DATABASE_URL"
 
+POOL_MIN_CONN = 1
+POOL_MAX_CONN = 8
+POOL_CHECKOUT_TIMEOUT = 30.0  # seconds a checkout waits for a free connection
+
+_pool: Any = None
+_pool_slots: threading.BoundedSemaphore | None = None
+_pool_key: tuple[int, str] | None = None
+_pool_lock = threading.Lock()
+
 
 def get_db_url() -> str:
     url = os.getenv(_URL_ENV)
@@ -17,17 +37,69 @@ def get_db_url() -> str:
     return url.split("#")[0].strip()
 
 
-@contextmanager
-def get_conn() -> Generator:
-    """Context manager that yields an autocommit psycopg2 connection."""
+def _import_pool_module():
     try:
-        import psycopg2
+        import psycopg2.pool
     except ImportError as exc:
         raise ImportError("psycopg2-binary is required: pip install psycopg2-binary") from exc
+    return psycopg2.pool
+
+
+def get_pool():
+    """Return the process-wide connection pool for the current DATABASE_URL.
+
+    The pool is (re)built when first used, when DATABASE_URL changes, or in a
+    forked child. An inherited pool is dropped without closing it — its
+    sockets belong to the parent process.
+    """
+    return _pool_and_slots()[0]
+
+
+def _pool_and_slots() -> tuple[Any, threading.BoundedSemaphore]:
+    global _pool, _pool_key, _pool_slots
+
+    url = get_db_url()
+    key = (os.getpid(), url)
+    with _pool_lock:
+        if _pool is None or _pool_slots is None or _pool_key != key:
+            if _pool is not None and _pool_key is not None and _pool_key[0] == key[0]:
+                _pool.closeall()
+            _pool = _import_pool_module().ThreadedConnectionPool(POOL_MIN_CONN, POOL_MAX_CONN, url)
+            _pool_slots = threading.BoundedSemaphore(POOL_MAX_CONN)
+            _pool_key = key
+        return _pool, _pool_slots
+
+
+def close_pool() -> None:
+    """Close every pooled connection; the next checkout opens a fresh pool."""
+    global _pool, _pool_key, _pool_slots
+
+    with _pool_lock:
+        if _pool is not None and _pool_key is not None and _pool_key[0] == os.getpid():
+            _pool.closeall()
+        _pool = None
+        _pool_slots = None
+        _pool_key = None
+
+
+@contextmanager
+def get_conn() -> Generator:
+    """Context manager that checks out an autocommit connection from the pool.
 
-    conn = psycopg2.connect(get_db_url())
-    conn.autocommit = True
+    The connection goes back to the pool on exit; one that was closed under us
+    (server restart, network drop) is discarded instead of being reused. When
+    all ``POOL_MAX_CONN`` connections are in use the call waits for one to be
+    returned, raising ``TimeoutError`` after ``POOL_CHECKOUT_TIMEOUT`` seconds.
+    """
+    pool, slots = _pool_and_slots()
+    if not slots.acquire(timeout=POOL_CHECKOUT_TIMEOUT):
+        raise TimeoutError(f"no pooled database connection became free within {POOL_CHECKOUT_TIMEOUT}s")
     try:
-        yield conn
+        conn = pool.getconn()
+        try:
+            conn.autocommit = True
+            yield conn
+        finally:
+            pool.putconn(conn, close=bool(conn.closed))
     finally:
-        conn.close()
+        slots.release()
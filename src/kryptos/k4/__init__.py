@@ -11,9 +11,6 @@ from dataclasses import dataclass
 from importlib import import_module as _imp
 from typing import Any
 
-from .adfgvx import adfgvx_decrypt, adfgvx_encrypt, build_polybius_square
-from .nihilist import nihilist_decrypt, nihilist_encrypt
-
 __all__ = [
     "decrypt_best",
     "DecryptResult",
@@ -193,6 +190,10 @@ _LAZY_MAP = {
         "kryptos.k4.transposition",
         "search_columnar_adaptive",
     ),
+    "search_columnar_branch_and_bound": (
+        "kryptos.k4.transposition",
+        "search_columnar_branch_and_bound",
+    ),
     "generate_route_variants": (
         "kryptos.k4.transposition_routes",
         "generate_route_variants",
@@ -251,6 +252,10 @@ _LAZY_MAP = {
     ),
     "search_with_crib": ("kryptos.k4.transposition_constraints", "search_with_crib"),
     "invert_columnar": ("kryptos.k4.transposition_constraints", "invert_columnar"),
+    "crib_consistent_permutations": (
+        "kryptos.k4.transposition_constraints",
+        "crib_consistent_permutations",
+    ),
     # Cribs utilities
     "annotate_cribs": ("kryptos.k4.cribs", "annotate_cribs"),
     "normalize_cipher": ("kryptos.k4.cribs", "normalize_cipher"),
@@ -283,27 +288,27 @@ _LAZY_MAP = {
         "beaufort_decrypt_alphabet",
     ),
     "BEAUFORT_KEY_CANDIDATES": ("kryptos.k4.beaufort_sweep", "BEAUFORT_KEY_CANDIDATES"),
-    # Module objects (allow `from kryptos.k4 import transposition` etc.)
-    # (Handled by explicit module passthroughs below rather than lazy attr lookup.)
+    # Fractionating ciphers (ADFGVX, Nihilist)
+    "adfgvx_encrypt": ("kryptos.k4.adfgvx", "adfgvx_encrypt"),
+    "adfgvx_decrypt": ("kryptos.k4.adfgvx", "adfgvx_decrypt"),
+    "build_polybius_square": ("kryptos.k4.adfgvx", "build_polybius_square"),
+    "nihilist_encrypt": ("kryptos.k4.nihilist", "nihilist_encrypt"),
+    "nihilist_decrypt": ("kryptos.k4.nihilist", "nihilist_decrypt"),
 }
 
+# Submodules reachable as attributes (`kryptos.k4.scoring`) without a prior import.
+_LAZY_SUBMODULES = frozenset({"scoring", "transposition", "cribs"})
+
 # Intentionally omit __all__ to allow linters that require concrete symbol presence
 # to skip validation; lazy attribute loading supplies them on demand.
 
 
 def __getattr__(name: str):  # pragma: no cover - import mechanism
+    if name in _LAZY_SUBMODULES:
+        return _imp(f"kryptos.k4.{name}")
     target = _LAZY_MAP.get(name)
     if not target:
         raise AttributeError(f"kryptos.k4 has no attribute {name!r}")
     mod_name, attr_name = target
     module = _imp(mod_name)
     return getattr(module, attr_name)
-
-
-# Module passthroughs needed by tests / legacy code: expose full submodules as attributes.
-try:  # pragma: no cover - defensive
-    scoring = _imp("kryptos.k4.scoring")
-    transposition = _imp("kryptos.k4.transposition")
-    cribs = _imp("kryptos.k4.cribs")
-except ImportError:  # pragma: no cover - do not crash import if optional
-    pass
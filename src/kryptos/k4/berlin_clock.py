@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from datetime import datetime, time, timedelta
 
 ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
@@ -87,6 +87,41 @@ def enumerate_clock_shift_sequences(
     return out
 
 
+def dedupe_clock_shift_sequences(states: Iterable[dict]) -> list[dict]:
+    """Collapse clock states that light the same lamp pattern.
+
+    The 24-lamp encoding only resolves the minute and the parity of the second, so
+    sub-minute steps produce many identical shift vectors. Returns one entry per
+    unique vector in first-seen order: a copy of the first state with that vector
+    plus ``'times'``, every time that produces it.
+    """
+    unique: dict[tuple[int, ...], dict] = {}
+    for state in states:
+        key = tuple(state['shifts'])
+        entry = unique.get(key)
+        if entry is None:
+            unique[key] = {**state, 'times': [state['time']]}
+        else:
+            entry['times'].append(state['time'])
+    return list(unique.values())
+
+
+def enumerate_unique_clock_shift_sequences(
+    start: str = '00:00:00',
+    end: str = '23:59:59',
+    step_seconds: int = 3600,
+) -> list[dict]:
+    """Like :func:`enumerate_clock_shift_sequences`, one entry per unique shift vector."""
+    return dedupe_clock_shift_sequences(enumerate_clock_shift_sequences(start, end, step_seconds))
+
+
+def clock_dedup_factor(unique_states: Sequence[dict]) -> float:
+    """Raw clock states per unique shift vector (1.0 when nothing collapsed)."""
+    if not unique_states:
+        return 1.0
+    return round(sum(len(s['times']) for s in unique_states) / len(unique_states), 4)
+
+
 __all__ = [
     'berlin_clock_shifts',
     'apply_clock_shifts',
@@ -94,4 +129,7 @@ __all__ = [
     'encode_clock_state',
     'full_berlin_clock_shifts',
     'enumerate_clock_shift_sequences',
+    'dedupe_clock_shift_sequences',
+    'enumerate_unique_clock_shift_sequences',
+    'clock_dedup_factor',
 ]
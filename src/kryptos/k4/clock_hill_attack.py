@@ -20,9 +20,9 @@ from datetime import timezone
 from pathlib import Path
 from typing import Any
 
-from .berlin_clock import enumerate_clock_shift_sequences, full_clock_state
+from .berlin_clock import clock_dedup_factor, enumerate_unique_clock_shift_sequences, full_clock_state
 from .eureka import DEFAULT_SNAPSHOT_PATH, EurekaSignal, write_breakthrough_snapshot
-from .hill_cipher import hill_decrypt, matrix_inv_mod
+from .hill_cipher import hill_decrypt_with_inverse, inverse_key
 from .keystream_validator import crib_hit_count
 
 K4 = "OBKRUOXOGHULBSOLIFBBWFLRVQQPRNGKSSOTWTQSJQSSEKZZWATJKLUDIAWINFBNYPVTTMZFPKWGDKZXTJCDIGKUHUAUEKCAR"
@@ -66,7 +66,7 @@ def run_clock_hill_attack(
     when no breakthrough is found.
     """
     ct = "".join(c for c in ciphertext.upper() if c.isalpha())
-    clock_states = enumerate_clock_shift_sequences(step_seconds=clock_step_seconds)
+    clock_states = enumerate_unique_clock_shift_sequences(step_seconds=clock_step_seconds)
     ts_start = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
     total_states = 0
@@ -76,16 +76,16 @@ def run_clock_hill_attack(
     for clock in clock_states:
         shifts = clock["shifts"]
         clock_time = clock["time"]
+        clock_times = clock["times"]
         total_states += 1
 
         matrix = clock_state_to_2x2_matrix(shifts)
-        if matrix_inv_mod(matrix) is None:
+        inverse = inverse_key(matrix)
+        if inverse is None:
             continue
         invertible_count += 1
 
-        candidate = hill_decrypt(ct, matrix)
-        if candidate is None:
-            continue
+        candidate = hill_decrypt_with_inverse(ct, inverse)
 
         kw_hits = _keyword_hits(candidate)
         crib_hits = crib_hit_count(candidate)
@@ -94,6 +94,7 @@ def run_clock_hill_attack(
             key_info = {
                 "attack": "clock_hill_2x2",
                 "clock_time": clock_time,
+                "clock_times": clock_times,
                 "clock_shifts_prefix": list(shifts[:4]),
                 "hill_matrix": matrix,
             }
@@ -120,6 +121,7 @@ def run_clock_hill_attack(
                     "keyword_hits": kw_hits,
                     "crib_hits": crib_hits,
                     "clock_time": clock_time,
+                    "clock_times": clock_times,
                     "hill_matrix": matrix,
                 }
             )
@@ -132,6 +134,7 @@ def run_clock_hill_attack(
         "timestamp": ts_start,
         "run_params": {
             "clock_step_seconds": clock_step_seconds,
+            "clock_dedup_factor": clock_dedup_factor(clock_states),
             "total_clock_states": total_states,
             "invertible_states": invertible_count,
             "keyword_eureka_threshold": keyword_eureka_threshold,
@@ -217,7 +220,7 @@ def run_clock_vigenere_attack(
     Returns summary dict. Writes null-result artifact when no breakthrough found.
     """
     ct = "".join(c for c in ciphertext.upper() if c.isalpha())
-    clock_states = enumerate_clock_shift_sequences(step_seconds=clock_step_seconds)
+    clock_states = enumerate_unique_clock_shift_sequences(step_seconds=clock_step_seconds)
     ts_start = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
     total_tested = 0
@@ -225,6 +228,7 @@ def run_clock_vigenere_attack(
 
     for clock in clock_states:
         clock_time = clock["time"]
+        clock_times = clock["times"]
         h, m, s = (int(x) for x in clock_time.split(":"))
         cs = full_clock_state(_dt_time(h, m, s))
 
@@ -247,6 +251,7 @@ def run_clock_vigenere_attack(
                 key_info = {
                     "attack": "clock_vigenere_4char",
                     "clock_time": clock_time,
+                    "clock_times": clock_times,
                     "encoding_scheme": scheme_name,
                     "key_ints": key_ints,
                     "key_letters": "".join(ALPHABET[v] for v in key_ints),
@@ -275,6 +280,7 @@ def run_clock_vigenere_attack(
                         "crib_hits": crib_hits,
                         "positional_match": positional_match,
                         "clock_time": clock_time,
+                        "clock_times": clock_times,
                         "encoding_scheme": scheme_name,
                         "key_letters": "".join(ALPHABET[v] for v in key_ints),
                     }
@@ -288,6 +294,7 @@ def run_clock_vigenere_attack(
         "timestamp": ts_start,
         "run_params": {
             "clock_step_seconds": clock_step_seconds,
+            "clock_dedup_factor": clock_dedup_factor(clock_states),
             "encoding_schemes": list(CLOCK_KEY_ENCODING_SCHEMES.keys()),
             "total_tested": total_tested,
             "keyword_eureka_threshold": keyword_eureka_threshold,
@@ -21,7 +21,7 @@ from datetime import timezone
 from pathlib import Path
 from typing import Any
 
-from .berlin_clock import enumerate_clock_shift_sequences, full_clock_state
+from .berlin_clock import clock_dedup_factor, enumerate_unique_clock_shift_sequences, full_clock_state
 from .eureka import DEFAULT_SNAPSHOT_PATH, EurekaSignal, write_breakthrough_snapshot
 from .keystream_validator import crib_hit_count
 from .transposition import apply_columnar_permutation
@@ -101,7 +101,7 @@ def run_clock_subrow_attack(
     Returns summary dict. Writes null-result artifact on completion without hit.
     """
     ct = "".join(c for c in ciphertext.upper() if c.isalpha())
-    clock_states = enumerate_clock_shift_sequences(step_seconds=clock_step_seconds)
+    clock_states = enumerate_unique_clock_shift_sequences(step_seconds=clock_step_seconds)
     ts_start = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
     total_tested = 0
@@ -109,6 +109,7 @@ def run_clock_subrow_attack(
 
     for clock in clock_states:
         clock_time = clock["time"]
+        clock_times = clock["times"]
         h, m, s = (int(x) for x in clock_time.split(":"))
         cs = full_clock_state(_dt_time(h, m, s))
 
@@ -126,6 +127,7 @@ def run_clock_subrow_attack(
                 key_info = {
                     "attack": "clock_subrow_vigenere",
                     "clock_time": clock_time,
+                    "clock_times": clock_times,
                     "encoding_scheme": scheme_name,
                     "shifts": shifts,
                 }
@@ -152,6 +154,7 @@ def run_clock_subrow_attack(
                         "keyword_hits": kw_hits,
                         "crib_hits": crib_hits,
                         "clock_time": clock_time,
+                        "clock_times": clock_times,
                         "encoding_scheme": scheme_name,
                         "shifts": shifts,
                     }
@@ -165,6 +168,7 @@ def run_clock_subrow_attack(
         "timestamp": ts_start,
         "run_params": {
             "clock_step_seconds": clock_step_seconds,
+            "clock_dedup_factor": clock_dedup_factor(clock_states),
             "encoding_schemes": list(SUBROW_ENCODING_SCHEMES.keys()),
             "total_tested": total_tested,
             "keyword_eureka_threshold": keyword_eureka_threshold,
@@ -219,7 +223,7 @@ def run_clock_transposition_attack(
     Returns summary dict. Writes null-result artifact on completion without hit.
     """
     ct = "".join(c for c in ciphertext.upper() if c.isalpha())
-    clock_states = enumerate_clock_shift_sequences(step_seconds=clock_step_seconds)
+    clock_states = enumerate_unique_clock_shift_sequences(step_seconds=clock_step_seconds)
     ts_start = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
     total_tested = 0
@@ -259,6 +263,7 @@ def run_clock_transposition_attack(
 
     for clock in clock_states:
         clock_time = clock["time"]
+        clock_times = clock["times"]
         h, m, s = (int(x) for x in clock_time.split(":"))
         cs = full_clock_state(_dt_time(h, m, s))
         widths = lamp_row_widths(cs)
@@ -276,6 +281,7 @@ def run_clock_transposition_attack(
                 "attack": "clock_lamp_transposition",
                 "variant": "multi_round_identity",
                 "clock_time": clock_time,
+                "clock_times": clock_times,
                 "widths": widths,
                 "valid_widths": valid_widths,
             },
@@ -291,6 +297,7 @@ def run_clock_transposition_attack(
                 "attack": "clock_lamp_transposition",
                 "variant": "multi_round_reverse",
                 "clock_time": clock_time,
+                "clock_times": clock_times,
                 "widths": widths,
                 "valid_widths": valid_widths,
             },
@@ -306,6 +313,7 @@ def run_clock_transposition_attack(
                         "attack": "clock_lamp_transposition",
                         "variant": f"single_{'reverse' if reverse else 'identity'}",
                         "clock_time": clock_time,
+                        "clock_times": clock_times,
                         "width": w,
                         "widths": widths,
                     },
@@ -319,6 +327,7 @@ def run_clock_transposition_attack(
         "timestamp": ts_start,
         "run_params": {
             "clock_step_seconds": clock_step_seconds,
+            "clock_dedup_factor": clock_dedup_factor(clock_states),
             "total_tested": total_tested,
             "keyword_eureka_threshold": keyword_eureka_threshold,
             "ts_start": ts_start,
@@ -19,13 +19,15 @@ Eureka event so each run is fully provenance-tracked and reproducible.
 
 from __future__ import annotations
 
+import heapq
 import json
+from collections.abc import Callable
 from datetime import datetime, timezone
 from itertools import permutations
 from pathlib import Path
 from typing import Any
 
-from .berlin_clock import enumerate_clock_shift_sequences
+from .berlin_clock import clock_dedup_factor, enumerate_unique_clock_shift_sequences
 from .eureka import DEFAULT_SNAPSHOT_PATH, EurekaSignal, write_breakthrough_snapshot
 from .inverse_transposition_sweep import K4_GRID_GEOMETRIES, SWEEP_ROUTES, invert_permutation
 from .keystream_validator import K4_CRIBS
@@ -73,6 +75,7 @@ def run_composite_sweep(
     eureka_snapshot_path: str | Path = DEFAULT_SNAPSHOT_PATH,
     null_artifact_path: str | Path = _NULL_ARTIFACT_PATH,
     keyword_eureka_threshold: int = 4,
+    progress_cb: Callable[[dict[str, Any]], None] | None = None,
 ) -> dict[str, Any]:
     """Run composite parameter sweep over alphabets × grids × clock states × routes.
 
@@ -86,6 +89,8 @@ def run_composite_sweep(
         eureka_snapshot_path:     Breakthrough snapshot destination.
         null_artifact_path:       Null-result provenance artifact destination.
         keyword_eureka_threshold: K4 keywords required in plaintext to trigger Eureka (max 4).
+        progress_cb:              Optional callback(dict) fired after every clock state, with
+                                  the same keys as ``run_three_layer_composite``'s.
 
     Returns:
         Summary dict. Raises EurekaSignal immediately on keyword hit ≥ threshold.
@@ -96,7 +101,7 @@ def run_composite_sweep(
         grid_sizes = K4_GRID_GEOMETRIES
 
     ct = "".join(c for c in ciphertext.upper() if c.isalpha())
-    clock_states = enumerate_clock_shift_sequences(step_seconds=clock_step_seconds)
+    clock_states = enumerate_unique_clock_shift_sequences(step_seconds=clock_step_seconds)
     ts_start = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
     alignment = check_keyed_alphabet_realignment(ct, K4_CRIBS, alphabets=alphabets)
@@ -105,9 +110,10 @@ def run_composite_sweep(
     best_candidates: list[dict[str, Any]] = []
 
     try:
-        for clock in clock_states:
+        for clock_idx, clock in enumerate(clock_states, start=1):
             clock_shifts = clock["shifts"]
             clock_time = clock["time"]
+            clock_times = clock["times"]
 
             for alpha_name, alphabet in alphabets.items():
                 clock_stripped = _vigenere_decrypt(ct, clock_shifts, alphabet)
@@ -139,6 +145,7 @@ def run_composite_sweep(
                                     "inv_perm": list(invert_permutation(perm)),
                                     "route": route_name,
                                     "clock_time": clock_time,
+                                    "clock_times": clock_times,
                                     "clock_shifts": list(clock_shifts),
                                 }
                                 snap = write_breakthrough_snapshot(
@@ -167,9 +174,24 @@ def run_composite_sweep(
                                         "perm": list(perm),
                                         "route": route_name,
                                         "clock_time": clock_time,
+                                        "clock_times": clock_times,
                                     }
                                 )
 
+            if progress_cb is not None:
+                progress_cb(
+                    {
+                        "clock_idx": clock_idx,
+                        "total_clock": len(clock_states),
+                        "clock_time": clock_time,
+                        "clock_times": clock_times,
+                        "total_candidates": total_candidates,
+                        "top_candidates": heapq.nlargest(
+                            5, best_candidates, key=lambda r: (r["keyword_hits"], r["instructional_score"])
+                        ),
+                    }
+                )
+
     except EurekaSignal:
         raise
 
@@ -179,6 +201,7 @@ def run_composite_sweep(
         "alphabets": list(alphabets.keys()),
         "grid_sizes": grid_sizes,
         "clock_step_seconds": clock_step_seconds,
+        "clock_dedup_factor": clock_dedup_factor(clock_states),
         "clock_states_count": len(clock_states),
         "routes": list(routes),
         "max_perms_per_grid": max_perms_per_grid,
@@ -2,12 +2,22 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
+from functools import lru_cache
 from math import gcd
+from pathlib import Path
+
+import numpy as np
 
 ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
 MOD = 26
 
+# MOD_INV_TABLE[a] is the inverse of a mod 26, or None when gcd(a, 26) != 1.
+MOD_INV_TABLE: tuple[int | None, ...] = tuple(
+    next((x for x in range(1, MOD) if (a * x) % MOD == 1), None) for a in range(MOD)
+)
+COPRIME_DETERMINANTS: tuple[int, ...] = tuple(d for d in range(MOD) if gcd(d, MOD) == 1)
+
 
 def _char_to_int(c: str) -> int:
     return ALPHABET.index(c)
@@ -26,6 +36,8 @@ def _chunks(seq: Sequence[int], size: int):
 
 def mod_inv(a: int, m: int = MOD) -> int | None:
     a = a % m
+    if m == MOD:
+        return MOD_INV_TABLE[a]
     for x in range(1, m):
         if (a * x) % m == 1:
             return x
@@ -86,13 +98,25 @@ def hill_encrypt_block(block: Sequence[int], key: list[list[int]]) -> list[int]:
 
 
 def hill_decrypt_block(block: Sequence[int], key: list[list[int]]) -> list[int] | None:
-    inv = matrix_inv_mod(key)
+    inv = inverse_key(key)
     if inv is None:
         return None
     size = len(inv)
     return [sum(inv[row][col] * block[col] for col in range(size)) % MOD for row in range(size)]
 
 
+@lru_cache(maxsize=65536)
+def _inverse_cached(key: tuple[tuple[int, ...], ...]) -> tuple[tuple[int, ...], ...] | None:
+    inv = matrix_inv_mod([list(row) for row in key])
+    return None if inv is None else tuple(tuple(row) for row in inv)
+
+
+def inverse_key(key: Sequence[Sequence[int]]) -> list[list[int]] | None:
+    """Inverse of ``key`` mod 26, memoised so a key is only ever inverted once."""
+    inv = _inverse_cached(tuple(tuple(int(v) for v in row) for row in key))
+    return None if inv is None else [list(row) for row in inv]
+
+
 def hill_encrypt(text: str, key: list[list[int]]) -> str:
     t = ''.join(c for c in text.upper() if c.isalpha())
     nums = [_char_to_int(c) for c in t]
@@ -104,27 +128,159 @@ def hill_encrypt(text: str, key: list[list[int]]) -> str:
 
 
 def hill_decrypt(text: str, key: list[list[int]]) -> str | None:
+    inv = inverse_key(key)
+    if inv is None:
+        # Keep the historical contract: too-short text yields '' even for a singular key.
+        t = ''.join(c for c in text.upper() if c.isalpha())
+        return None if len(t) >= len(key) else ''
+    return hill_decrypt_with_inverse(text, inv)
+
+
+def hill_decrypt_with_inverse(text: str, inverse: list[list[int]]) -> str:
+    """Decrypt with an already-inverted key matrix (the invert-once path).
+
+    Use this (or :func:`inverse_key`) when the same key decrypts many texts, or
+    when the caller already holds the inverse, to skip per-call inversion.
+    """
     t = ''.join(c for c in text.upper() if c.isalpha())
     nums = [_char_to_int(c) for c in t]
-    size = len(key)
+    size = len(inverse)
     out: list[int] = []
     for chunk in _chunks(nums, size):
-        dec = hill_decrypt_block(chunk, key)
-        if dec is None:
-            return None
-        out.extend(dec)
+        out.extend(sum(inverse[row][col] * chunk[col] for col in range(size)) % MOD for row in range(size))
     return ''.join(_int_to_char(n) for n in out)
 
 
+def hill_decrypt_batch(text: str, inverses: np.ndarray | Sequence[list[list[int]]]) -> list[str]:
+    """Decrypt ``text`` under N already-inverted keys in one matmul mod 26.
+
+    ``inverses`` is an ``(N, n, n)`` array (or list of n×n matrices) of a single
+    block size. Trailing partial blocks are dropped, as in :func:`hill_decrypt`.
+    """
+    inv = np.asarray(inverses, dtype=np.int64)
+    if inv.ndim != 3 or inv.shape[1] != inv.shape[2]:
+        raise ValueError("inverses must have shape (N, n, n)")
+    size = inv.shape[1]
+    t = ''.join(c for c in text.upper() if c.isalpha())
+    nums = np.frombuffer(t.encode('ascii'), dtype=np.uint8).astype(np.int64) - ord('A')
+    blocks = nums[: len(nums) - len(nums) % size].reshape(-1, size)
+    plain = np.einsum('kij,bj->kbi', inv, blocks) % MOD
+    letters = (plain.reshape(inv.shape[0], -1) + ord('A')).astype(np.uint8)
+    return [row.tobytes().decode('ascii') for row in letters]
+
+
+@lru_cache(maxsize=1)
+def _build_invertible_2x2_array() -> np.ndarray:
+    a, b, c, d = (axis.ravel() for axis in np.indices((MOD,) * 4, dtype=np.int16))
+    det = (a * d - b * c) % MOD
+    keep = np.isin(det, COPRIME_DETERMINANTS)
+    keys = np.stack([a[keep], b[keep], c[keep], d[keep]], axis=1).reshape(-1, 2, 2).astype(np.int8)
+    keys.setflags(write=False)
+    return keys
+
+
+def invertible_2x2_key_array(cache_path: str | Path | None = None) -> np.ndarray:
+    """Every invertible 2x2 key mod 26 as an ``(N, 2, 2)`` int8 array.
+
+    Rows are in the same lexicographic (a, b, c, d) order as the original
+    quadruple loop. With ``cache_path`` the array is loaded from / saved to a
+    ``.npy`` file so repeated runs skip the build entirely.
+    """
+    path = Path(cache_path) if cache_path is not None else None
+    if path is not None and path.exists():
+        cached = np.load(path)
+        if cached.ndim == 3 and cached.shape[1:] == (2, 2):
+            return cached
+    keys = _build_invertible_2x2_array()
+    if path is not None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'wb') as fh:
+            np.save(fh, keys)
+    return keys
+
+
+def iter_invertible_2x2_by_determinant(
+    cache_path: str | Path | None = None,
+) -> Iterator[tuple[int, np.ndarray]]:
+    """Yield ``(det, keys)`` for each determinant class coprime to 26."""
+    keys = invertible_2x2_key_array(cache_path).astype(np.int16)
+    det = (keys[:, 0, 0] * keys[:, 1, 1] - keys[:, 0, 1] * keys[:, 1, 0]) % MOD
+    for d in COPRIME_DETERMINANTS:
+        yield d, keys[det == d].astype(np.int8)
+
+
 def invertible_2x2_keys() -> list[list[list[int]]]:
+    return invertible_2x2_key_array().tolist()
+
+
+def _crib_block_pairs(
+    ciphertext: str,
+    cribs: dict[str, tuple[str, int]],
+    offset: int,
+) -> list[tuple[tuple[int, int], tuple[int, int]]] | None:
+    """(plain, cipher) integer pairs for every 2-block fully covered by a crib.
+
+    Returns None when two cribs disagree about the same position.
+    """
+    ct = ''.join(c for c in ciphertext.upper() if c.isalpha())
+    known: dict[int, str] = {}
+    for word, start in cribs.values():
+        for i, ch in enumerate(word.upper()):
+            pos = start + i
+            if pos >= len(ct):
+                break
+            if known.setdefault(pos, ch) != ch:
+                return None
+    pairs = []
+    for pos in sorted(known):
+        if (pos - offset) % 2 == 0 and pos + 1 in known:
+            plain = (_char_to_int(known[pos]), _char_to_int(known[pos + 1]))
+            cipher = (_char_to_int(ct[pos]), _char_to_int(ct[pos + 1]))
+            pairs.append((plain, cipher))
+    return pairs
+
+
+def solve_2x2_keys_from_cribs(
+    ciphertext: str,
+    cribs: dict[str, tuple[str, int]] | None = None,
+    offset: int = 0,
+) -> list[list[list[int]]]:
+    """Invertible 2x2 keys consistent with every crib-covered block.
+
+    Each crib block gives ``C = K·P (mod 26)``, i.e. one linear equation per key
+    row. Rows are solved independently over all 26² candidates (this also covers
+    block pairs whose plaintext matrix is singular mod 26), then combined and
+    filtered for invertibility - typically leaving a handful of keys, or none,
+    before any decryption or scoring happens.
+
+    Args:
+        ciphertext: Ciphertext containing the cribs.
+        cribs: label -> (plaintext, 0-based start); defaults to the confirmed K4
+            cribs (EAST/NORTHEAST/BERLIN/CLOCK).
+        offset: Block alignment (0 or 1) of the Hill layer relative to the text.
+    """
+    if cribs is None:
+        from .keystream_validator import K4_CRIBS
+
+        cribs = K4_CRIBS
+    pairs = _crib_block_pairs(ciphertext, cribs, offset % 2)
+    if pairs is None:
+        return []
+    if not pairs:
+        return invertible_2x2_keys()
+    plain = np.array([p for p, _ in pairs], dtype=np.int64)
+    cipher = np.array([c for _, c in pairs], dtype=np.int64)
+    x, y = (axis.ravel() for axis in np.indices((MOD, MOD)))
+    lhs = (x[:, None] * plain[None, :, 0] + y[:, None] * plain[None, :, 1]) % MOD
+    rows = []
+    for r in range(2):
+        ok = np.all(lhs == cipher[None, :, r], axis=1)
+        rows.append(np.stack([x[ok], y[ok]], axis=1))
     keys: list[list[list[int]]] = []
-    for a in range(26):
-        for b in range(26):
-            for c in range(26):
-                for d in range(26):
-                    det = (a * d - b * c) % 26
-                    if gcd(det, 26) == 1:
-                        keys.append([[a, b], [c, d]])
+    for r0 in rows[0].tolist():
+        for r1 in rows[1].tolist():
+            if MOD_INV_TABLE[(r0[0] * r1[1] - r0[1] * r1[0]) % MOD] is not None:
+                keys.append([r0, r1])
     return keys
 
 
@@ -162,13 +318,16 @@ def brute_force_crib(cipher_segment: str, plain_segment: str, limit: int = 1000)
     if len(p) < 4 or len(ct) < 4:
         return []
     results: list[dict] = []
+    blocks = [[_char_to_int(c) for c in p[:2]], [_char_to_int(c) for c in p[2:4]]]
+    target = [_char_to_int(c) for c in ct]
     count = 0
     for key in invertible_2x2_keys():
         if count >= limit:
             break
-        enc = hill_encrypt(p, key)[:4]
-        if enc == ct:
-            results.append({'key': key, 'enc': enc})
+        # Encrypt the two crib blocks as integers; no per-key string rebuild.
+        enc_nums = hill_encrypt_block(blocks[0], key) + hill_encrypt_block(blocks[1], key)
+        if enc_nums == target:
+            results.append({'key': key, 'enc': ct})
         count += 1
     return results
 
@@ -181,7 +340,15 @@ __all__ = [
     'hill_decrypt_block',
     'hill_encrypt',
     'hill_decrypt',
+    'hill_decrypt_with_inverse',
+    'hill_decrypt_batch',
+    'inverse_key',
+    'MOD_INV_TABLE',
     'invertible_2x2_keys',
+    'invertible_2x2_key_array',
+    'iter_invertible_2x2_by_determinant',
+    'solve_2x2_keys_from_cribs',
+    'COPRIME_DETERMINANTS',
     'solve_2x2_key',
     'brute_force_crib',
 ]
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from itertools import combinations, permutations
 
-from .hill_cipher import ALPHABET, hill_decrypt, matrix_inv_mod, solve_2x2_key
+from .hill_cipher import ALPHABET, hill_decrypt_with_inverse, inverse_key, matrix_inv_mod, solve_2x2_key
 from .scoring import combined_plaintext_score_cached as combined_plaintext_score
 
 KNOWN_CRIBS = {
@@ -93,7 +93,7 @@ def _solve_3x3_keys(plain: str, cipher: str) -> list[list[list[int]]]:
                         val += Cv[r][k] * Pinv[k][col]
                     row.append(val % 26)
                 K.append(row)
-            if matrix_inv_mod(K) is not None:
+            if inverse_key(K) is not None:
                 flat = tuple(v for row in K for v in row)
                 if flat not in {tuple(v for row in kk for v in row) for kk in keys}:
                     keys.append(K)
@@ -158,7 +158,8 @@ def decrypt_and_score(
     seen_texts: set[str] = set()
     for info in key_infos:
         k = info['key']
-        dec = hill_decrypt(ciphertext, k)
+        inverse = inverse_key(k)
+        dec = hill_decrypt_with_inverse(ciphertext, inverse) if inverse is not None else None
         attempt_entry = {
             'source': info['source'],
             'size': info.get('size', len(k)),
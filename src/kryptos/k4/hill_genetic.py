@@ -9,7 +9,14 @@ from __future__ import annotations
 import random
 from math import gcd
 
-from kryptos.k4.hill_cipher import MOD, hill_decrypt, matrix_det, matrix_inv_mod
+from kryptos.k4.hill_cipher import (
+    MOD,
+    hill_decrypt,
+    hill_decrypt_with_inverse,
+    inverse_key,
+    matrix_det,
+    matrix_inv_mod,
+)
 from kryptos.k4.scoring import combined_plaintext_score
 
 
@@ -56,13 +63,12 @@ def ensure_invertible(matrix: list[list[int]]) -> list[list[int]]:
 
 
 def fitness(key: list[list[int]], ciphertext: str) -> float:
-    if matrix_inv_mod(key) is None:
+    inverse = inverse_key(key)
+    if inverse is None:
         return -1000.0
 
     try:
-        plaintext = hill_decrypt(ciphertext, key)
-        if plaintext is None:
-            return -1000.0
+        plaintext = hill_decrypt_with_inverse(ciphertext, inverse)
         return combined_plaintext_score(plaintext)
     except Exception:
         return -1000.0
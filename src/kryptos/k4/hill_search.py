@@ -2,16 +2,29 @@
 
 from __future__ import annotations
 
-from .hill_cipher import hill_decrypt
+from .hill_cipher import hill_decrypt_batch, inverse_key
 from .scoring import combined_plaintext_score
 
 
+_BATCH_CHUNK = 8192
+
+
 def score_decryptions(ciphertext: str, keys: list[list[list[int]]], limit: int = 100) -> list[dict]:
-    results: list[dict] = []
-    for k in keys[:limit]:
-        dec = hill_decrypt(ciphertext, k)
-        if dec:
-            results.append({'key': k, 'score': combined_plaintext_score(dec), 'text': dec})
+    # Invert each key once, then decrypt every key of a given size in one batched matmul.
+    by_size: dict[int, list[tuple[int, list[list[int]], list[list[int]]]]] = {}
+    for idx, k in enumerate(keys[:limit]):
+        inv = inverse_key(k)
+        if inv is not None:
+            by_size.setdefault(len(k), []).append((idx, k, inv))
+    decrypted: list[tuple[int, list[list[int]], str]] = []
+    for group in by_size.values():
+        # Chunk so a full 2x2 sweep (~157k keys) never materialises one huge einsum result.
+        for start in range(0, len(group), _BATCH_CHUNK):
+            chunk = group[start : start + _BATCH_CHUNK]
+            texts = hill_decrypt_batch(ciphertext, [inv for _, _, inv in chunk])
+            decrypted.extend((idx, k, dec) for (idx, k, _), dec in zip(chunk, texts, strict=True))
+    decrypted.sort(key=lambda item: item[0])
+    results = [{'key': k, 'score': combined_plaintext_score(dec), 'text': dec} for _, k, dec in decrypted if dec]
     results.sort(key=lambda r: r['score'], reverse=True)
     return results
 
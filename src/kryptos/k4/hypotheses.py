@@ -10,7 +10,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Protocol
 
-from .hill_cipher import invertible_2x2_keys
+from .hill_cipher import invertible_2x2_keys, solve_2x2_keys_from_cribs
 from .hill_genetic import genetic_algorithm_hill3x3
 from .hill_search import score_decryptions
 from .transposition import search_columnar
@@ -74,8 +74,23 @@ class CompositeHypothesis:
 
 
 class HillCipher2x2Hypothesis:
+    def __init__(self, cribs: dict[str, tuple[str, int]] | None = None, offset: int = 0):
+        """Initialize the Hill 2x2 hypothesis.
+
+        Args:
+            cribs: Optional label -> (plaintext, 0-based start) map. When given, only
+                keys consistent with every crib-covered block are scored instead of
+                the full 157,248-key space.
+            offset: Block alignment used with ``cribs``.
+        """
+        self.cribs = cribs
+        self.offset = offset
+
     def generate_candidates(self, ciphertext: str, limit: int = 10) -> list[Candidate]:
-        keys = invertible_2x2_keys()
+        if self.cribs is not None:
+            keys = solve_2x2_keys_from_cribs(ciphertext, self.cribs, offset=self.offset)
+        else:
+            keys = invertible_2x2_keys()
 
         results = score_decryptions(ciphertext, keys, limit=len(keys))
 
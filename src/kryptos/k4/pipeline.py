@@ -294,6 +294,8 @@ def make_transposition_multi_crib_stage(
 
     def _run(ct: str) -> StageResult:
         all_cands: list[dict[str, Any]] = []
+        surviving_perms: dict[int, int] = {}
+        surviving_perms_capped: dict[int, bool] = {}
         for n_cols in range(min_cols, max_cols + 1):
             cands = search_with_multiple_cribs_positions(
                 ct,
@@ -303,6 +305,8 @@ def make_transposition_multi_crib_stage(
                 max_perms=max_perms,
                 limit=limit,
             )
+            surviving_perms[n_cols] = cands[0]['surviving_perms'] if cands else 0
+            surviving_perms_capped[n_cols] = cands[0]['surviving_perms_capped'] if cands else False
             for c in cands:
                 c['cols'] = n_cols
                 c['trace'] = [
@@ -333,6 +337,8 @@ def make_transposition_multi_crib_stage(
                 'candidates': top,
                 'positional_cribs': positional_cribs,
                 'window': window,
+                'surviving_perms': surviving_perms,
+                'surviving_perms_capped': surviving_perms_capped,
             },
             score=best.get('score', combined_plaintext_score(ct)),
         )
@@ -1,14 +1,23 @@
-"""Scoring utilities for K4 analysis (file-driven frequencies)."""
+"""Scoring utilities for K4 analysis (file-driven frequencies).
+
+The n-gram, letter-frequency, crib and wordlist tables (``LETTER_FREQ``,
+``BIGRAMS``, ``TRIGRAMS``, ``QUADGRAMS``, ``CRIBS``, ``WORDLIST``) are read
+from ``data/`` and ``config/`` on first use rather than at import, so CLI
+start-up and process-pool workers that never score do not parse the TSVs.
+"""
 
 from __future__ import annotations
 
+import heapq
 import json
 import math
 import os
+import threading
 from collections import Counter
-from collections.abc import Iterable, Sequence
+from collections.abc import Callable, Iterable, Sequence
 from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 from kryptos.paths import get_repo_root
 
@@ -80,73 +89,101 @@ def _load_wordlist(path: str) -> set[str]:
     return words
 
 
-LETTER_FREQ: dict[str, float] = _load_letter_freq(os.path.join(NGRAMS_DIR, 'letter_freq.tsv'))
-BIGRAMS: dict[str, float] = _load_ngrams(os.path.join(NGRAMS_DIR, 'bigrams.tsv'))
-TRIGRAMS: dict[str, float] = _load_ngrams(os.path.join(NGRAMS_DIR, 'trigrams.tsv'))
-_quad_hi_path = os.path.join(NGRAMS_DIR, 'quadgrams_high_quality.tsv')
-if os.path.exists(_quad_hi_path):
-    QUADGRAMS: dict[str, float] = _load_ngrams(_quad_hi_path)
-else:
-    QUADGRAMS: dict[str, float] = _load_ngrams(os.path.join(NGRAMS_DIR, 'quadgrams.tsv'))
+_FALLBACK_LETTER_FREQ: dict[str, float] = {
+    'E': 12.702,
+    'T': 9.056,
+    'A': 8.167,
+    'O': 7.507,
+    'N': 6.749,
+    'I': 6.966,
+    'S': 6.327,
+    'R': 5.987,
+    'H': 6.094,
+    'L': 4.025,
+    'D': 4.253,
+    'C': 2.782,
+    'U': 2.758,
+    'M': 2.406,
+    'F': 2.228,
+    'Y': 1.974,
+    'W': 2.360,
+    'G': 2.015,
+    'P': 1.929,
+    'B': 1.492,
+    'V': 0.978,
+    'K': 0.772,
+    'X': 0.150,
+    'J': 0.153,
+    'Q': 0.095,
+    'Z': 0.074,
+}
+
+_FALLBACK_WORDLIST: frozenset[str] = frozenset({
+    'THE',
+    'AND',
+    'YOU',
+    'THAT',
+    'FOR',
+    'WITH',
+    'HAVE',
+    'THIS',
+    'FROM',
+    'CLOCK',
+    'BERLIN',
+    'TIME',
+    'CODE',
+    'DATA',
+    'NEXT',
+    'OVER',
+    'PART',
+    'TEXT',
+})
+
+
+def _load_quadgrams() -> dict[str, float]:
+    hi_path = os.path.join(NGRAMS_DIR, 'quadgrams_high_quality.tsv')
+    if os.path.exists(hi_path):
+        return _load_ngrams(hi_path)
+    return _load_ngrams(os.path.join(NGRAMS_DIR, 'quadgrams.tsv'))
+
+
+_TABLE_LOADERS: dict[str, Callable[[], Any]] = {
+    'LETTER_FREQ': lambda: _load_letter_freq(os.path.join(NGRAMS_DIR, 'letter_freq.tsv'))
+    or dict(_FALLBACK_LETTER_FREQ),
+    'BIGRAMS': lambda: _load_ngrams(os.path.join(NGRAMS_DIR, 'bigrams.tsv')),
+    'TRIGRAMS': lambda: _load_ngrams(os.path.join(NGRAMS_DIR, 'trigrams.tsv')),
+    'QUADGRAMS': _load_quadgrams,
+    'CRIBS': lambda: _load_config_cribs(CONFIG_PATH),
+    'WORDLIST': lambda: _load_wordlist(os.path.join(DATA_DIR, 'wordlist.txt')) or set(_FALLBACK_WORDLIST),
+}
+_tables_lock = threading.Lock()
+
+
+def _table(name: str) -> Any:
+    """Return the module-level table *name*, loading it on first use.
+
+    Loaded tables live in the module globals, so mutating them in place or
+    replacing them with ``setattr``/``monkeypatch`` behaves as before.
+    """
+    g = globals()
+    try:
+        return g[name]
+    except KeyError:
+        with _tables_lock:
+            if name not in g:
+                g[name] = _TABLE_LOADERS[name]()
+        return g[name]
 
-CRIBS: list[str] = _load_config_cribs(CONFIG_PATH)
-WORDLIST: set[str] = _load_wordlist(os.path.join(DATA_DIR, 'wordlist.txt'))
 
-_promoted_cribs_cache: dict[str, tuple[float, set[str]]] = {}
+def __getattr__(name: str) -> Any:
+    if name in _TABLE_LOADERS:
+        return _table(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-BERLIN_CLOCK_TERMS = {'BERLIN', 'CLOCK'}
 
-if not LETTER_FREQ:
-    LETTER_FREQ = {
-        'E': 12.702,
-        'T': 9.056,
-        'A': 8.167,
-        'O': 7.507,
-        'N': 6.749,
-        'I': 6.966,
-        'S': 6.327,
-        'R': 5.987,
-        'H': 6.094,
-        'L': 4.025,
-        'D': 4.253,
-        'C': 2.782,
-        'U': 2.758,
-        'M': 2.406,
-        'F': 2.228,
-        'Y': 1.974,
-        'W': 2.360,
-        'G': 2.015,
-        'P': 1.929,
-        'B': 1.492,
-        'V': 0.978,
-        'K': 0.772,
-        'X': 0.150,
-        'J': 0.153,
-        'Q': 0.095,
-        'Z': 0.074,
-    }
+_promoted_cribs_cache: dict[str, tuple[float, set[str]]] = {}
 
-if not WORDLIST:
-    WORDLIST = {
-        'THE',
-        'AND',
-        'YOU',
-        'THAT',
-        'FOR',
-        'WITH',
-        'HAVE',
-        'THIS',
-        'FROM',
-        'CLOCK',
-        'BERLIN',
-        'TIME',
-        'CODE',
-        'DATA',
-        'NEXT',
-        'OVER',
-        'PART',
-        'TEXT',
-    }
+BERLIN_CLOCK_TERMS = {'BERLIN', 'CLOCK'}
 
 _UNKNOWN_BIGRAM = -2.0
 _UNKNOWN_TRIGRAM = -2.5
@@ -155,12 +192,14 @@ _UNKNOWN_QUADGRAM = -4.0
 
 def chi_square_stat(text: str) -> float:
     filtered = [c for c in text.upper() if c.isalpha()]
-    n = len(filtered)
+    return _chi_square(Counter(filtered), len(filtered))
+
+
+def _chi_square(counts: Counter[str], n: int) -> float:
     if n == 0:
         return float('inf')
-    counts = Counter(filtered)
     chi = 0.0
-    for letter, exp in LETTER_FREQ.items():
+    for letter, exp in _table('LETTER_FREQ').items():
         obs = counts.get(letter, 0)
         expected = exp * n / 100.0
         if expected > 0:
@@ -169,7 +208,10 @@ def chi_square_stat(text: str) -> float:
 
 
 def _score_ngrams(text: str, table: dict[str, float], size: int, unknown: float) -> float:
-    seq = ''.join(c for c in text.upper() if c.isalpha())
+    return _seq_ngram_score(''.join(c for c in text.upper() if c.isalpha()), table, size, unknown)
+
+
+def _seq_ngram_score(seq: str, table: dict[str, float], size: int, unknown: float) -> float:
     if len(seq) < size:
         return 0.0
 
@@ -181,22 +223,113 @@ def _score_ngrams(text: str, table: dict[str, float], size: int, unknown: float)
 
 
 def bigram_score(text: str) -> float:
-    return _score_ngrams(text, BIGRAMS, 2, _UNKNOWN_BIGRAM)
+    return _score_ngrams(text, _table('BIGRAMS'), 2, _UNKNOWN_BIGRAM)
 
 
 def trigram_score(text: str) -> float:
-    return _score_ngrams(text, TRIGRAMS, 3, _UNKNOWN_TRIGRAM)
+    return _score_ngrams(text, _table('TRIGRAMS'), 3, _UNKNOWN_TRIGRAM)
 
 
 def quadgram_score(text: str) -> float:
-    return _score_ngrams(text, QUADGRAMS, 4, _UNKNOWN_QUADGRAM)
+    return _score_ngrams(text, _table('QUADGRAMS'), 4, _UNKNOWN_QUADGRAM)
+
+
+_ABORT_SLACK = 1e-9  # keep float drift in the remaining-gram bound from rejecting a passing text
+_quadgram_range_cache: tuple[dict[str, float], int, float, float, float] | None = None
+
+
+def _quadgram_range(table: dict[str, float]) -> tuple[float, float]:
+    """Lowest and highest score a single quadgram can add (cached per table object, size and unknown score)."""
+    global _quadgram_range_cache
+    cached = _quadgram_range_cache
+    if cached is not None and cached[0] is table and cached[1:3] == (len(table), _UNKNOWN_QUADGRAM):
+        return cached[3], cached[4]
+    values = [_UNKNOWN_QUADGRAM, *table.values()]
+    _quadgram_range_cache = (table, len(table), _UNKNOWN_QUADGRAM, min(values), max(values))
+    return min(values), max(values)
+
+
+def score_at_least(text: str, threshold: float) -> float | None:
+    """``quadgram_score(text)`` if it reaches ``threshold``, else ``None``.
+
+    Quadgrams are summed left to right; scoring stops as soon as the running
+    total plus the best possible score for every remaining quadgram falls
+    short of ``threshold``. A returned score is bit-identical to
+    :func:`quadgram_score`, so callers keeping a top-K can pass their current
+    K-th best as ``threshold`` and rank survivors as before. How early a
+    text is rejected depends on the gap between the table's best quadgram
+    and a typical one.
+    """
+    seq = ''.join(c for c in text.upper() if c.isalpha())
+    if len(seq) < 4:
+        return 0.0 if 0.0 >= threshold else None
+    table = _table('QUADGRAMS')
+    table_get = table.get
+    worst, best = _quadgram_range(table)
+    n_grams = len(seq) - 3
+    floor = threshold - _ABORT_SLACK
+    # Even all-worst quadgrams cannot trigger the abort before this many grams, so skip the check there.
+    unchecked = n_grams if best == worst else int((n_grams * best - floor) / (best - worst)) - 1
+    unchecked = max(0, min(n_grams, unchecked))
+    total = 0.0
+    for i in range(unchecked):
+        total += table_get(seq[i : i + 4], _UNKNOWN_QUADGRAM)
+    need = floor - (n_grams - unchecked) * best  # running total must stay >= need after each gram
+    for i in range(unchecked, n_grams):
+        total += table_get(seq[i : i + 4], _UNKNOWN_QUADGRAM)
+        need += best
+        if total < need:
+            return None
+    return total if total >= threshold else None
+
+
+class QuadgramTopK:
+    """The ``k`` best candidates of a sweep by quadgram score.
+
+    Once ``k`` candidates are held, each new text is scored with
+    :func:`score_at_least` against the current ``k``-th best, so most are
+    rejected part-way through. ``early_abort=False`` scores every text in
+    full (same results; kept for benchmarking). On equal scores the
+    candidate offered first is kept.
+    """
+
+    def __init__(self, k: int, early_abort: bool = True):
+        self.k = k
+        self.early_abort = early_abort
+        self._heap: list[tuple[float, int, dict[str, Any]]] = []
+        self._offered = 0
+
+    def offer(self, text: str, item: dict[str, Any]) -> float | None:
+        """Score ``text`` and keep ``item`` if it ranks; returns the score, or ``None`` if rejected early."""
+        if self.k <= 0:
+            return None
+        self._offered += 1
+        full = len(self._heap) >= self.k
+        if full and self.early_abort:
+            score = score_at_least(text, self._heap[0][0])
+            if score is None:
+                return None
+        else:
+            score = quadgram_score(text)
+        entry = (score, -self._offered, item)
+        if not full:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+        return score
+
+    def results(self) -> list[dict[str, Any]]:
+        """Held items best first, each with its ``quadgram_score``."""
+        ranked = sorted(self._heap, key=lambda e: (-e[0], -e[1]))
+        return [{**item, 'quadgram_score': score} for score, _, item in ranked]
 
 
 def _get_all_cribs() -> list[str]:
     from kryptos.spy.crib_store import PROMOTED_CRIBS_PATH, load_promoted_cribs
 
-    all_cribs = list(CRIBS)
-    config_set = set(CRIBS)
+    cribs = _table('CRIBS')
+    all_cribs = list(cribs)
+    config_set = set(cribs)
 
     if PROMOTED_CRIBS_PATH.exists():
         mtime = PROMOTED_CRIBS_PATH.stat().st_mtime
@@ -212,24 +345,27 @@ def _get_all_cribs() -> list[str]:
 
 
 def crib_bonus(text: str) -> float:
-    upper = ''.join(c for c in text.upper() if c.isalpha())
+    return _crib_bonus(''.join(c for c in text.upper() if c.isalpha()), _get_all_cribs())
+
+
+def _crib_bonus(seq: str, all_cribs: list[str]) -> float:
     bonus = 0.0
-    for crib in _get_all_cribs():
-        if crib and crib in upper:
+    for crib in all_cribs:
+        if crib and crib in seq:
             bonus += 5.0 * len(crib)
     return bonus
 
 
 def rarity_weighted_crib_bonus(text: str) -> float:
-    all_cribs = _get_all_cribs()
-    if not all_cribs:
-        return 0.0
-    seq = ''.join(c for c in text.upper() if c.isalpha())
-    if not seq:
+    return _rarity_weighted_crib_bonus(''.join(c for c in text.upper() if c.isalpha()), _get_all_cribs())
+
+
+def _rarity_weighted_crib_bonus(seq: str, all_cribs: list[str]) -> float:
+    if not all_cribs or not seq:
         return 0.0
     rarities: dict[str, float] = {}
     max_rarity = 0.0
-    for letter, pct in LETTER_FREQ.items():
+    for letter, pct in _table('LETTER_FREQ').items():
         p = pct / 100.0 if pct > 0 else 0.0001
         r = 1.0 / p
         rarities[letter] = r
@@ -289,8 +425,12 @@ def combined_plaintext_score(text: str) -> float:
     chi = chi_square_stat(text)
     bi = bigram_score(text)
     tri = trigram_score(text)
-    quad = quadgram_score(text) if QUADGRAMS else 0.0
-    return bi + tri + quad - 0.05 * chi + crib_bonus(text)
+    quad = quadgram_score(text) if _table('QUADGRAMS') else 0.0
+    return _combine_scores(chi, bi, tri, quad, crib_bonus(text))
+
+
+def _combine_scores(chi: float, bi: float, tri: float, quad: float, cribs: float) -> float:
+    return bi + tri + quad - 0.05 * chi + cribs
 
 
 @lru_cache(maxsize=10000)
@@ -299,12 +439,15 @@ def combined_plaintext_score_cached(text: str) -> float:
 
 
 def berlin_clock_pattern_validator(text: str) -> dict[str, bool | int]:
-    upper = ''.join(c for c in text.upper() if c.isalpha())
-    has_berlin = 'BERLIN' in upper
-    has_clock = 'CLOCK' in upper
+    return _berlin_clock_pattern(''.join(c for c in text.upper() if c.isalpha()))
+
+
+def _berlin_clock_pattern(seq: str) -> dict[str, bool | int]:
+    has_berlin = 'BERLIN' in seq
+    has_clock = 'CLOCK' in seq
     order_ok = False
     if has_berlin and has_clock:
-        order_ok = upper.find('BERLIN') < upper.find('CLOCK')
+        order_ok = seq.find('BERLIN') < seq.find('CLOCK')
     return {
         'has_berlin': has_berlin,
         'has_clock': has_clock,
@@ -321,55 +464,54 @@ def combined_plaintext_score_extended(text: str) -> float:
 
 
 def wordlist_hit_rate(text: str, min_len: int = 3, max_len: int = 8) -> float:
-    seq = ''.join(c for c in text.upper() if c.isalpha())
+    return _wordlist_hit_rate(''.join(c for c in text.upper() if c.isalpha()), min_len, max_len)
+
+
+_WORDLIST_MAX_WINDOWS = 5000
+
+
+@lru_cache(maxsize=256)
+def _wordlist_windows(n: int, size: int) -> tuple[slice, ...]:
+    return tuple(slice(i, i + size) for i in range(min(n - size + 1, _WORDLIST_MAX_WINDOWS)))
+
+
+def _wordlist_hit_rate(seq: str, min_len: int = 3, max_len: int = 8) -> float:
     n = len(seq)
     if n < min_len:
         return 0.0
+    in_wordlist = _table('WORDLIST').__contains__
     total = 0
     hits = 0
-    for L in range(min_len, max_len + 1):
-        if L > n:
-            break
-        for i in range(n - L + 1):
-            if total >= 5000:
-                break
-            total += 1
-            if seq[i : i + L] in WORDLIST:
-                hits += 1
-        if total >= 5000:
+    for L in range(min_len, min(max_len, n) + 1):
+        windows = _wordlist_windows(n, L)[: _WORDLIST_MAX_WINDOWS - total]
+        hits += sum(map(in_wordlist, map(seq.__getitem__, windows)))
+        total += len(windows)
+        if total >= _WORDLIST_MAX_WINDOWS:
             break
     return hits / total if total else 0.0
 
 
 def trigram_entropy(text: str) -> float:
     seq = ''.join(c for c in text.upper() if c.isalpha())
-    if len(seq) < 3:
-        return 0.0
-    trigrams = [seq[i : i + 3] for i in range(len(seq) - 3 + 1)]
-    counts = Counter(trigrams)
-    n = sum(counts.values())
-    ent = 0.0
-    for v in counts.values():
-        p = v / n
-        ent -= p * math.log2(p)
-    return ent
+    trigrams = _grams(seq, 3)
+    return _entropy(Counter(trigrams), len(trigrams))
 
 
 def bigram_gap_variance(text: str) -> float:
-    seq = ''.join(c for c in text.upper() if c.isalpha())
-    if len(seq) < 4:
+    return _bigram_gap_variance(_grams(''.join(c for c in text.upper() if c.isalpha()), 2))
+
+
+def _bigram_gap_variance(bigrams: list[str]) -> float:
+    if len(bigrams) < 3:  # fewer than four letters
         return 0.0
     positions: dict[str, list[int]] = {}
-    for i in range(len(seq) - 2 + 1):
-        gram = seq[i : i + 2]
+    for i, gram in enumerate(bigrams):
         positions.setdefault(gram, []).append(i)
     gap_vars: list[float] = []
-    for _gram, pos_list in positions.items():
+    for pos_list in positions.values():
         if len(pos_list) < 2:
             continue
         gaps = [pos_list[i + 1] - pos_list[i] for i in range(len(pos_list) - 1)]
-        if not gaps:
-            continue
         mean_gap = sum(gaps) / len(gaps)
         var = sum((g - mean_gap) ** 2 for g in gaps) / len(gaps)
         gap_vars.append(var)
@@ -378,31 +520,60 @@ def bigram_gap_variance(text: str) -> float:
     return sum(gap_vars) / len(gap_vars)
 
 
+def _grams(seq: str, size: int) -> list[str]:
+    return [seq[i : i + size] for i in range(len(seq) - size + 1)]
+
+
+def _entropy(counts: Counter[str], n: int) -> float:
+    if n == 0:
+        return 0.0
+    ent = 0.0
+    for v in counts.values():
+        p = v / n
+        ent -= p * math.log2(p)
+    return ent
+
+
 def baseline_stats(text: str) -> dict[str, float]:
-    stats = {
-        'chi_square': chi_square_stat(text),
-        'bigram_score': bigram_score(text),
-        'trigram_score': trigram_score(text),
-        'quadgram_score': quadgram_score(text) if QUADGRAMS else 0.0,
-        'crib_bonus': crib_bonus(text),
-        'rarity_weighted_crib_bonus': rarity_weighted_crib_bonus(text),
-        'combined_score': combined_plaintext_score(text),
-        'index_of_coincidence': index_of_coincidence(text),
-        'vowel_ratio': vowel_ratio(text),
-        'letter_coverage': letter_coverage(text),
-        'letter_entropy': letter_entropy(text),
-        'repeating_bigram_fraction': repeating_bigram_fraction(text),
-        'wordlist_hit_rate': wordlist_hit_rate(text),
-        'trigram_entropy': trigram_entropy(text),
-        'bigram_gap_variance': bigram_gap_variance(text),
+    """All report metrics for ``text`` from one cleaned sequence.
+
+    The letter histogram and the bigram/trigram windows are built once and
+    passed to the same sequence-level cores the individual metric functions
+    (``chi_square_stat``, ``bigram_score``, ``letter_entropy``, ...) use, so
+    every value matches theirs exactly.
+    """
+    seq = ''.join(c for c in text.upper() if c.isalpha())
+    n = len(seq)
+    counts = Counter(seq)
+    bigrams = _grams(seq, 2)
+    trigrams = _grams(seq, 3)
+
+    chi = _chi_square(counts, n)
+    bi = _seq_ngram_score(seq, _table('BIGRAMS'), 2, _UNKNOWN_BIGRAM)
+    tri = _seq_ngram_score(seq, _table('TRIGRAMS'), 3, _UNKNOWN_TRIGRAM)
+    quadgrams = _table('QUADGRAMS')
+    quad = _seq_ngram_score(seq, quadgrams, 4, _UNKNOWN_QUADGRAM) if quadgrams else 0.0
+    all_cribs = _get_all_cribs()
+    cribs_bonus = _crib_bonus(seq, all_cribs)
+
+    return {
+        'chi_square': chi,
+        'bigram_score': bi,
+        'trigram_score': tri,
+        'quadgram_score': quad,
+        'crib_bonus': cribs_bonus,
+        'rarity_weighted_crib_bonus': _rarity_weighted_crib_bonus(seq, all_cribs),
+        'combined_score': _combine_scores(chi, bi, tri, quad, cribs_bonus),
+        'index_of_coincidence': _index_of_coincidence(counts, n),
+        'vowel_ratio': _vowel_ratio(counts, n),
+        'letter_coverage': _letter_coverage(counts),
+        'letter_entropy': _entropy(counts, n),
+        'repeating_bigram_fraction': _repeating_bigram_fraction(bigrams),
+        'wordlist_hit_rate': _wordlist_hit_rate(seq),
+        'trigram_entropy': _entropy(Counter(trigrams), len(trigrams)),
+        'bigram_gap_variance': _bigram_gap_variance(bigrams),
+        'berlin_clock_pattern_bonus': float(_berlin_clock_pattern(seq)['pattern_bonus']),
     }
-    pattern = berlin_clock_pattern_validator(text)
-    stats.update(
-        {
-            'berlin_clock_pattern_bonus': float(pattern['pattern_bonus']),
-        },
-    )
-    return stats
 
 
 def segment_plaintext_scores(segments: Iterable[str]) -> dict[str, float]:
@@ -411,10 +582,12 @@ def segment_plaintext_scores(segments: Iterable[str]) -> dict[str, float]:
 
 def index_of_coincidence(text: str) -> float:
     letters = [c for c in text.upper() if c.isalpha()]
-    n = len(letters)
+    return _index_of_coincidence(Counter(letters), len(letters))
+
+
+def _index_of_coincidence(counts: Counter[str], n: int) -> float:
     if n < 2:
         return 0.0
-    counts = Counter(letters)
     num = sum(v * (v - 1) for v in counts.values())
     den = n * (n - 1)
     return num / den if den else 0.0
@@ -422,36 +595,35 @@ def index_of_coincidence(text: str) -> float:
 
 def vowel_ratio(text: str) -> float:
     letters = [c for c in text.upper() if c.isalpha()]
-    if not letters:
+    return _vowel_ratio(Counter(letters), len(letters))
+
+
+def _vowel_ratio(counts: Counter[str], n: int) -> float:
+    if n == 0:
         return 0.0
-    vowels = set('AEIOUY')
-    vcount = sum(1 for c in letters if c in vowels)
-    return vcount / len(letters)
+    return sum(counts[v] for v in 'AEIOUY') / n
 
 
 def letter_coverage(text: str) -> float:
-    letters = {c for c in text.upper() if c.isalpha()}
-    return len(letters) / 26.0
+    return _letter_coverage(Counter(c for c in text.upper() if c.isalpha()))
+
+
+def _letter_coverage(counts: Counter[str]) -> float:
+    return len(counts) / 26.0
 
 
 def letter_entropy(text: str) -> float:
     letters = [c for c in text.upper() if c.isalpha()]
-    n = len(letters)
-    if n == 0:
-        return 0.0
-    counts = Counter(letters)
-    ent = 0.0
-    for v in counts.values():
-        p = v / n
-        ent -= p * math.log2(p)
-    return ent
+    return _entropy(Counter(letters), len(letters))
 
 
 def repeating_bigram_fraction(text: str) -> float:
-    seq = ''.join(c for c in text.upper() if c.isalpha())
-    if len(seq) < 2:
+    return _repeating_bigram_fraction(_grams(''.join(c for c in text.upper() if c.isalpha()), 2))
+
+
+def _repeating_bigram_fraction(bigrams: list[str]) -> float:
+    if not bigrams:
         return 0.0
-    bigrams = [seq[i : i + 2] for i in range(len(seq) - 2 + 1)]
     counts = Counter(bigrams)
     repeats = sum(v for v in counts.values() if v > 1)
     return repeats / len(bigrams)
@@ -472,7 +644,7 @@ def positional_letter_deviation_score(text: str, period: int = 5) -> float:
             continue
         counts = Counter(bucket)
         chi = 0.0
-        for letter, exp_pct in LETTER_FREQ.items():
+        for letter, exp_pct in _table('LETTER_FREQ').items():
             expected = exp_pct * bn / 100.0
             if expected <= 0:
                 continue
@@ -635,6 +807,8 @@ __all__ = [
     'crib_bonus',
     'rarity_weighted_crib_bonus',
     'quadgram_score',
+    'score_at_least',
+    'QuadgramTopK',
     'combined_plaintext_score',
     'combined_plaintext_score_cached',
     'segment_plaintext_scores',
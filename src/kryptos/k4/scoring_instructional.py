@@ -11,6 +11,9 @@ domain-specific vocabulary to use with K5 or other puzzles.
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from functools import lru_cache
+
 INSTRUCTIONAL_VECTORS: frozenset[str] = frozenset({
     # Cardinal / ordinal directions (confirmed Sanborn theme)
     "NORTH", "SOUTH", "EAST", "WEST",
@@ -100,6 +103,65 @@ def _fuzzy_match(word: str, vocabulary: frozenset[str], tol: int = 1) -> str | N
     return best_word
 
 
+def _deletes(word: str, tol: int) -> set[str]:
+    """``word`` plus every string reachable by deleting up to ``tol`` characters."""
+    out = {word}
+    frontier = {word}
+    for _ in range(tol):
+        frontier = {w[:i] + w[i + 1 :] for w in frontier for i in range(len(w))}
+        out |= frontier
+    return out
+
+
+class _DeletionIndex:
+    """Symmetric-deletion (SymSpell-style) index answering ``_fuzzy_match`` queries.
+
+    Two words are within Levenshtein distance ``tol`` only if some ≤tol-deletion
+    variant of one equals a ≤tol-deletion variant of the other, so a query needs
+    one dict lookup per deletion variant instead of a DP against every word.
+    Hits are confirmed with :func:`levenshtein` and ties are broken exactly as the
+    linear scan does (smallest length difference, then vocabulary iteration order).
+    """
+
+    def __init__(self, vocabulary: Iterable[str], tol: int):
+        self.vocabulary = frozenset(vocabulary)
+        self.tol = tol
+        self._rank = {w: i for i, w in enumerate(self.vocabulary)}
+        self._variants: dict[str, list[str]] = {}
+        if tol > 0:
+            for w in self.vocabulary:
+                for variant in _deletes(w, tol):
+                    self._variants.setdefault(variant, []).append(w)
+        lengths = [len(w) for w in self.vocabulary] or [0]
+        self._min_len = min(lengths) - tol
+        self._max_len = max(lengths) + tol
+
+    def match(self, word: str) -> str | None:
+        if word in self.vocabulary:
+            return word
+        n = len(word)
+        if self.tol == 0 or not self._min_len <= n <= self._max_len:
+            return None
+        best_word: str | None = None
+        best_key: tuple[int, int] | None = None
+        seen: set[str] = set()
+        for variant in _deletes(word, self.tol):
+            for candidate in self._variants.get(variant, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                if levenshtein(word, candidate) <= self.tol:
+                    key = (abs(len(candidate) - n), self._rank[candidate])
+                    if best_key is None or key < best_key:
+                        best_word, best_key = candidate, key
+        return best_word
+
+
+@lru_cache(maxsize=16)
+def _deletion_index(vocabulary: frozenset[str], tol: int) -> _DeletionIndex:
+    return _DeletionIndex(vocabulary, tol)
+
+
 def _extract_windows(text: str, min_len: int = 3, max_len: int = 12) -> list[str]:
     """Extract all alpha substrings of length [min_len, max_len] from text."""
     seq = "".join(c for c in text.upper() if c.isalpha())
@@ -136,6 +198,7 @@ def instructional_score(
     seq = "".join(c for c in text.upper() if c.isalpha())
     if len(seq) < min_word:
         return 0.0
+    match_word = _deletion_index(frozenset(vocabulary), fuzzy_tol).match
 
     total_bonus = 0.0
     # Track matched positions to avoid double-counting overlapping hits
@@ -146,7 +209,7 @@ def instructional_score(
             continue
         for i in range(len(seq) - length + 1):
             window = seq[i : i + length]
-            match = _fuzzy_match(window, vocabulary, tol=fuzzy_tol)
+            match = match_word(window)
             if match is not None:
                 positions = set(range(i, i + length))
                 if not positions & matched_positions:
@@ -0,0 +1,267 @@
+"""Vectorized n-gram scoring backend for K4 sweeps.
+
+The dict path in :mod:`kryptos.k4.scoring` re-cleans the text on every call and
+runs one dict lookup per n-gram window. This backend encodes text once into a
+small integer array and scores it with fancy indexing into dense log-probability
+tables built from the same n-gram TSVs (``BIGRAMS``/``TRIGRAMS``/``QUADGRAMS``).
+
+Index 0-25 maps A-Z. Index 26 collects any other alphabetic character that
+survives ``str.upper``/``str.isalpha`` filtering, so every window containing one
+scores as "unknown" exactly like the dict path. Window sums are accumulated
+left to right (``np.cumsum``) so results are bit-identical to the dict path,
+not merely close.
+
+Typical use::
+
+    codes = encode_text(candidate)
+    score = combined_score_encoded(codes)
+
+    batch = encode_batch(candidates)        # (N, L) int8, equal lengths
+    scores = combined_score_batch(batch)    # (N,) float64
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, fields
+from multiprocessing import shared_memory
+from typing import Any
+
+import numpy as np
+
+from . import scoring as _scoring
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+OTHER_LETTER = 26
+SYMBOLS = 27
+
+_LUT = np.full(128, OTHER_LETTER, dtype=np.int8)
+for _i, _c in enumerate(ALPHABET):
+    _LUT[ord(_c)] = _i
+_DECODE = ALPHABET + '\u00d8'
+
+
+@dataclass(frozen=True)
+class NgramTables:
+    """Dense log-probability tables indexed by encoded n-gram."""
+
+    bigram: np.ndarray  # shape (27, 27)
+    trigram: np.ndarray  # shape (27, 27, 27)
+    quadgram: np.ndarray  # shape (27, 27, 27, 27)
+    has_quadgrams: bool
+    letter_expected: np.ndarray  # percentage per LETTER_FREQ entry, in dict order
+    letter_index: np.ndarray  # encoded letter per LETTER_FREQ entry, in dict order
+
+    def table(self, size: int) -> np.ndarray:
+        if size == 2:
+            return self.bigram
+        if size == 3:
+            return self.trigram
+        if size == 4:
+            return self.quadgram
+        raise ValueError(f"Unsupported n-gram size: {size}")
+
+
+def _dense_table(grams: dict[str, float], size: int, unknown: float) -> np.ndarray:
+    table = np.full((SYMBOLS,) * size, unknown, dtype=np.float64)
+    for gram, value in grams.items():
+        if len(gram) != size or any(c not in ALPHABET for c in gram):
+            continue
+        table[tuple(ALPHABET.index(c) for c in gram)] = value
+    return table
+
+
+def build_tables() -> NgramTables:
+    """Build dense tables from the n-gram dicts currently loaded in ``scoring``."""
+    letters = list(_scoring.LETTER_FREQ.items())
+    return NgramTables(
+        bigram=_dense_table(_scoring.BIGRAMS, 2, _scoring._UNKNOWN_BIGRAM),
+        trigram=_dense_table(_scoring.TRIGRAMS, 3, _scoring._UNKNOWN_TRIGRAM),
+        quadgram=_dense_table(_scoring.QUADGRAMS, 4, _scoring._UNKNOWN_QUADGRAM),
+        has_quadgrams=bool(_scoring.QUADGRAMS),
+        letter_expected=np.array([pct for _, pct in letters], dtype=np.float64),
+        letter_index=np.array(
+            [ALPHABET.index(letter) if letter in ALPHABET else OTHER_LETTER for letter, _ in letters],
+            dtype=np.intp,
+        ),
+    )
+
+
+_TABLES: NgramTables | None = None
+
+
+def get_tables() -> NgramTables:
+    """Return the process-wide tables, building them on first use."""
+    global _TABLES
+    if _TABLES is None:
+        _TABLES = build_tables()
+    return _TABLES
+
+
+def reset_tables() -> None:
+    """Drop cached tables so the next call rebuilds from ``scoring`` dicts."""
+    global _TABLES
+    _TABLES = None
+
+
+_ATTACHED: list[shared_memory.SharedMemory] = []
+
+
+def share_tables(tables: NgramTables | None = None) -> tuple[shared_memory.SharedMemory, dict[str, Any]]:
+    """Copy tables into one shared-memory block for worker processes.
+
+    Returns the block (the caller owns it: ``close()`` + ``unlink()`` when the
+    workers are done) and a small picklable spec for :func:`attach_tables`.
+    """
+    t = tables or get_tables()
+    arrays = {f.name: getattr(t, f.name) for f in fields(t) if isinstance(getattr(t, f.name), np.ndarray)}
+    shm = shared_memory.SharedMemory(create=True, size=sum(a.nbytes for a in arrays.values()))
+    layout: dict[str, tuple[int, tuple[int, ...], str]] = {}
+    offset = 0
+    for name, arr in arrays.items():
+        np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf, offset=offset)[...] = arr
+        layout[name] = (offset, arr.shape, arr.dtype.str)
+        offset += arr.nbytes
+    return shm, {"name": shm.name, "layout": layout, "has_quadgrams": t.has_quadgrams}
+
+
+def attach_tables(spec: dict[str, Any]) -> NgramTables:
+    """Read-only tables backed by a block created with :func:`share_tables` (no copy)."""
+    shm = shared_memory.SharedMemory(name=spec["name"])
+    _ATTACHED.append(shm)  # keep the mapping alive as long as the tables are in use
+    arrays = {}
+    for name, (offset, shape, dtype) in spec["layout"].items():
+        arr = np.ndarray(tuple(shape), dtype=np.dtype(dtype), buffer=shm.buf, offset=offset)
+        arr.setflags(write=False)
+        arrays[name] = arr
+    return NgramTables(has_quadgrams=spec["has_quadgrams"], **arrays)
+
+
+def encode_text(text: str) -> np.ndarray:
+    """Encode text as an int8 array, dropping non-alphabetic characters."""
+    seq = ''.join(c for c in text.upper() if c.isalpha())
+    if seq.isascii():
+        return _LUT[np.frombuffer(seq.encode('ascii'), dtype=np.uint8)]
+    return np.array([_LUT[ord(c)] if ord(c) < 128 else OTHER_LETTER for c in seq], dtype=np.int8)
+
+
+def encode_batch(texts: Sequence[str]) -> np.ndarray:
+    """Encode equal-length candidates into a 2-D ``(N, L)`` int8 array."""
+    rows = [encode_text(t) for t in texts]
+    if not rows:
+        return np.zeros((0, 0), dtype=np.int8)
+    length = len(rows[0])
+    if any(len(r) != length for r in rows):
+        raise ValueError("encode_batch requires candidates of equal (letters-only) length")
+    return np.stack(rows)
+
+
+def decode(codes: np.ndarray) -> str:
+    """Decode an encoded 1-D array back to text.
+
+    Index 26 decodes as ``Ø`` - still alphabetic, so crib matching on the decoded
+    text sees the same letter boundaries as the original.
+    """
+    return ''.join(_DECODE[c] for c in codes.tolist())
+
+
+def _window_index(codes: np.ndarray, size: int) -> np.ndarray:
+    """Flat table index for every n-gram window along the last axis."""
+    c = codes.astype(np.intp, copy=False)
+    width = c.shape[-1] - size + 1
+    idx = c[..., 0:width].copy()
+    for k in range(1, size):
+        idx *= SYMBOLS
+        idx += c[..., k : k + width]
+    return idx
+
+
+def ngram_window_scores(codes: np.ndarray, size: int, tables: NgramTables | None = None) -> np.ndarray:
+    """Per-window log-probabilities along the last axis (empty if too short)."""
+    t = tables or get_tables()
+    if codes.shape[-1] < size:
+        return np.zeros(codes.shape[:-1] + (0,), dtype=np.float64)
+    return t.table(size).ravel()[_window_index(codes, size)]
+
+
+def _sequential_sum(values: np.ndarray) -> np.ndarray | float:
+    # cumsum accumulates strictly left to right, matching the dict path's ``total +=`` loop.
+    if values.shape[-1] == 0:
+        return np.zeros(values.shape[:-1]) if values.ndim > 1 else 0.0
+    out = np.cumsum(values, axis=-1)[..., -1]
+    return out if values.ndim > 1 else float(out)
+
+
+def ngram_score_encoded(codes: np.ndarray, size: int, tables: NgramTables | None = None):
+    """Sum of n-gram log-probabilities; float for 1-D input, array for 2-D."""
+    return _sequential_sum(ngram_window_scores(codes, size, tables))
+
+
+def chi_square_encoded(codes: np.ndarray, tables: NgramTables | None = None):
+    """Chi-square against ``LETTER_FREQ``; float for 1-D input, array for 2-D."""
+    t = tables or get_tables()
+    batch = np.atleast_2d(codes)
+    n = batch.shape[-1]
+    if n == 0:
+        out = np.full(batch.shape[0], float('inf'))
+        return out if codes.ndim > 1 else float('inf')
+    offsets = (np.arange(batch.shape[0]) * SYMBOLS)[:, None]
+    counts = np.bincount((batch.astype(np.intp) + offsets).ravel(), minlength=batch.shape[0] * SYMBOLS)
+    counts = counts.reshape(batch.shape[0], SYMBOLS)
+    obs = counts[:, t.letter_index].astype(np.float64)
+    expected = t.letter_expected * n / 100.0
+    keep = expected > 0
+    terms = (obs[:, keep] - expected[keep]) ** 2 / expected[keep]
+    out = _sequential_sum(terms) if terms.shape[-1] else np.zeros(batch.shape[0])
+    if codes.ndim > 1:
+        return out
+    return float(out[0])
+
+
+def combined_score_encoded(codes: np.ndarray, tables: NgramTables | None = None) -> float:
+    """Equivalent of ``scoring.combined_plaintext_score`` for a 1-D encoded text."""
+    t = tables or get_tables()
+    chi = chi_square_encoded(codes, t)
+    bi = ngram_score_encoded(codes, 2, t)
+    tri = ngram_score_encoded(codes, 3, t)
+    quad = ngram_score_encoded(codes, 4, t) if t.has_quadgrams else 0.0
+    return bi + tri + quad - 0.05 * chi + _scoring.crib_bonus(decode(codes))
+
+
+def combined_score_batch(batch: np.ndarray, tables: NgramTables | None = None) -> np.ndarray:
+    """Combined score for every row of an ``(N, L)`` encoded batch in one call."""
+    t = tables or get_tables()
+    if batch.ndim != 2:
+        raise ValueError("combined_score_batch expects a 2-D (N, L) array")
+    n_rows = batch.shape[0]
+    chi = chi_square_encoded(batch, t)
+    bi = ngram_score_encoded(batch, 2, t)
+    tri = ngram_score_encoded(batch, 3, t)
+    quad = ngram_score_encoded(batch, 4, t) if t.has_quadgrams else np.zeros(n_rows)
+    bonus = np.array([_scoring.crib_bonus(decode(row)) for row in batch], dtype=np.float64)
+    return bi + tri + quad - 0.05 * chi + bonus
+
+
+def combined_plaintext_score_vec(text: str) -> float:
+    """Drop-in string entry point backed by the vectorized tables."""
+    return combined_score_encoded(encode_text(text))
+
+
+__all__ = [
+    "ALPHABET",
+    "NgramTables",
+    "build_tables",
+    "get_tables",
+    "reset_tables",
+    "share_tables",
+    "attach_tables",
+    "encode_text",
+    "encode_batch",
+    "decode",
+    "ngram_window_scores",
+    "ngram_score_encoded",
+    "chi_square_encoded",
+    "combined_score_encoded",
+    "combined_score_batch",
+    "combined_plaintext_score_vec",
+]
@@ -19,7 +19,8 @@ class SolverConfig:
     rng_seed: int | None = None
 
     # Vigenere recovery options
-    vigenere_max_candidates: int | None = None
+    vigenere_beam_width: int | None = None  # prefixes kept per key column (beam search)
+    vigenere_max_candidates: int | None = None  # key combinations re-ranked by SPY scoring
 
     # Transposition SA options
     sa_num_restarts: int | None = None
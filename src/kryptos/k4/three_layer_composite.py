@@ -13,15 +13,22 @@ Then a full 24-state hourly sweep.  Search space at 6 cols, 3 alphabets:
 
 from __future__ import annotations
 
+import heapq
 import json
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import closing
 from datetime import datetime, timezone
-from itertools import permutations
+from itertools import islice, permutations
 from pathlib import Path
 from typing import Any
 
-from .berlin_clock import enumerate_clock_shift_sequences, full_berlin_clock_shifts
+from .berlin_clock import (
+    clock_dedup_factor,
+    dedupe_clock_shift_sequences,
+    enumerate_clock_shift_sequences,
+    full_berlin_clock_shifts,
+)
 from .eureka import DEFAULT_SNAPSHOT_PATH, EurekaSignal, write_breakthrough_snapshot
 from .inverse_transposition_sweep import K4_GRID_GEOMETRIES
 from .keystream_validator import K4_CRIBS
@@ -87,7 +94,7 @@ def _build_clock_sequence(
     priority_times: list[str],
     clock_step_seconds: int,
 ) -> list[dict[str, Any]]:
-    """Priority CIA timestamps first, then remaining hourly states (no duplicates)."""
+    """Priority CIA timestamps first, then remaining states, one per unique shift vector."""
     from datetime import time as dtime
 
     def _parse(ts: str) -> dict[str, Any]:
@@ -101,7 +108,136 @@ def _build_clock_sequence(
 
     full = enumerate_clock_shift_sequences(step_seconds=clock_step_seconds)
     rest = [{"time": e["time"], "shifts": e["shifts"], "priority": False} for e in full if e["time"] not in priority_set]
-    return priority + rest
+    return dedupe_clock_shift_sequences(priority + rest)
+
+
+_TOP_K = 10  # summaries keep the best 10 near-misses
+
+
+def _push_top(heap: list[tuple], item: tuple, k: int = _TOP_K) -> None:
+    """Keep the ``k`` best ``(kw_hits, score, -clock_idx, -seq, record)`` items.
+
+    The negated indices make ties resolve to the earliest candidate, matching a
+    stable sort of every near-miss in sweep order.
+    """
+    if len(heap) < k:
+        heapq.heappush(heap, item)
+    elif item[:4] > heap[0][:4]:
+        heapq.heapreplace(heap, item)
+
+
+def _ranked(heap: list[tuple]) -> list[dict[str, Any]]:
+    return [item[4] for item in sorted(heap, key=lambda it: it[:4], reverse=True)]
+
+
+def _sweep_clock_state(
+    ct: str,
+    clock_idx: int,
+    clock: dict[str, Any],
+    subst_alphabets: dict[str, str],
+    grid_sizes: list[int],
+    max_perms_per_grid: int | None,
+    keyword_eureka_threshold: int,
+    base_scorer: Callable[[str], float] | None = None,
+) -> dict[str, Any]:
+    """Sweep every (alphabet, grid, perm) for one clock state.
+
+    Returns the candidate count, a bounded top-K heap of near-misses and, if a
+    candidate reached the Eureka threshold, that hit (the sweep stops there).
+    """
+    clock_shifts = clock["shifts"]
+    clock_time = clock["time"]
+    clock_times = clock["times"]
+    heap: list[tuple] = []
+    count = 0
+    for alpha_name, alphabet in subst_alphabets.items():
+        for n_cols in grid_sizes:
+            for perm in islice(permutations(range(n_cols)), max_perms_per_grid):
+                candidate = _decrypt_three_layer(ct, n_cols, perm, clock_shifts, alphabet)
+                count += 1
+
+                kw_hits = _keyword_hits(candidate)
+                if kw_hits >= keyword_eureka_threshold:
+                    key_info = {
+                        "alpha_name": alpha_name,
+                        "n_cols": n_cols,
+                        "perm": list(perm),
+                        "clock_time": clock_time,
+                        "clock_times": clock_times,
+                        "clock_shifts": list(clock_shifts),
+                        "attack": "P1_three_layer",
+                    }
+                    eureka = {"candidate_text": candidate, "key_info": key_info, "keyword_hits": kw_hits}
+                    return {"clock_idx": clock_idx, "count": count, "top": heap, "eureka": eureka}
+
+                if kw_hits > 0:
+                    score = combined_instructional_score(candidate, base_scorer=base_scorer, gate_entropy=False)
+                    record = {
+                        "candidate_text": candidate,
+                        "keyword_hits": kw_hits,
+                        "instructional_score": score,
+                        "alpha_name": alpha_name,
+                        "n_cols": n_cols,
+                        "perm": list(perm),
+                        "clock_time": clock_time,
+                        "clock_times": clock_times,
+                    }
+                    _push_top(heap, (kw_hits, score, -clock_idx, -count, record))
+    return {"clock_idx": clock_idx, "count": count, "top": heap, "eureka": None}
+
+
+_WORKER_SCORER: Callable[[str], float] | None = None
+
+
+def _init_sweep_worker(tables_spec: dict[str, Any]) -> None:
+    """Process-pool initializer: score against the parent's shared n-gram tables."""
+    global _WORKER_SCORER
+    from .scoring_vectorized import attach_tables, combined_score_encoded, encode_text
+
+    tables = attach_tables(tables_spec)
+
+    def _score(text: str) -> float:
+        return combined_score_encoded(encode_text(text), tables)
+
+    _WORKER_SCORER = _score
+
+
+def _sweep_clock_state_worker(args: tuple) -> dict[str, Any]:
+    return _sweep_clock_state(*args, base_scorer=_WORKER_SCORER)
+
+
+def _iter_clock_results(
+    ct: str,
+    clock_sequence: list[dict[str, Any]],
+    sweep_args: tuple,
+    workers: int,
+) -> Iterator[dict[str, Any]]:
+    """Yield per-clock-state results in clock order, serially or from a process pool."""
+    tasks = [(ct, idx, clock, *sweep_args) for idx, clock in enumerate(clock_sequence)]
+    if workers <= 1:
+        for task in tasks:
+            yield _sweep_clock_state(*task)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    from .scoring_vectorized import share_tables
+
+    shm, spec = share_tables()
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_sweep_worker, initargs=(spec,)
+        ) as executor:
+            futures = [executor.submit(_sweep_clock_state_worker, task) for task in tasks]
+            try:
+                for future in futures:  # submission order keeps progress and ties deterministic
+                    yield future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+    finally:
+        shm.close()
+        shm.unlink()
 
 
 def run_three_layer_composite(
@@ -115,6 +251,7 @@ def run_three_layer_composite(
     eureka_snapshot_path: str | Path = "K4_3LAYER_BREAKTHROUGH.md",
     null_artifact_path: str | Path = _NULL_ARTIFACT_PATH,
     progress_cb: Callable[[dict[str, Any]], None] | None = None,
+    workers: int = 1,
 ) -> dict[str, Any]:
     """Run the P1 3-layer composite attack against K4.
 
@@ -129,6 +266,9 @@ def run_three_layer_composite(
         eureka_snapshot_path:   Breakthrough snapshot destination.
         null_artifact_path:     Null-result provenance artifact.
         progress_cb:            Optional callback(dict) fired every clock state.
+        workers:                Worker processes; clock states are sharded across
+                                them with n-gram tables in shared memory. Results
+                                are identical for any worker count.
 
     Returns:
         Summary dict. Raises EurekaSignal on keyword_eureka_threshold hit.
@@ -145,102 +285,62 @@ def run_three_layer_composite(
     ts_start = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
     total_candidates = 0
-    best_candidates: list[dict[str, Any]] = []
+    top: list[tuple] = []
 
     total_clock = len(clock_sequence)
     logger.info(
-        "P1 3-layer composite: %d clock states, %d alphabets, grids=%s, max_perms=%s",
+        "P1 3-layer composite: %d clock states, %d alphabets, grids=%s, max_perms=%s, workers=%d",
         total_clock,
         len(subst_alphabets),
         grid_sizes,
         max_perms_per_grid,
+        workers,
     )
 
-    try:
-        for clock_idx, clock in enumerate(clock_sequence):
-            clock_shifts = clock["shifts"]
-            clock_time = clock["time"]
+    sweep_args = (subst_alphabets, grid_sizes, max_perms_per_grid, keyword_eureka_threshold)
+    results = _iter_clock_results(ct, clock_sequence, sweep_args, workers)
+    with closing(results):  # on Eureka, stop the pool and release shared memory right away
+        for result in results:
+            clock = clock_sequence[result["clock_idx"]]
             is_priority = clock.get("priority", False)
-
             if is_priority:
-                logger.info("P1: priority clock state %s (CIA timestamp)", clock_time)
-
-            for alpha_name, alphabet in subst_alphabets.items():
-                for n_cols in grid_sizes:
-                    perm_gen = permutations(range(n_cols))
-                    perm_count = 0
-
-                    for perm in perm_gen:
-                        if max_perms_per_grid is not None and perm_count >= max_perms_per_grid:
-                            break
-                        perm_count += 1
-
-                        candidate = _decrypt_three_layer(ct, n_cols, perm, clock_shifts, alphabet)
-                        total_candidates += 1
-
-                        kw_hits = _keyword_hits(candidate)
-                        if kw_hits >= keyword_eureka_threshold:
-                            key_info = {
-                                "alpha_name": alpha_name,
-                                "n_cols": n_cols,
-                                "perm": list(perm),
-                                "clock_time": clock_time,
-                                "clock_shifts": list(clock_shifts),
-                                "attack": "P1_three_layer",
-                            }
-                            snap = write_breakthrough_snapshot(
-                                candidate,
-                                key_info,
-                                extra={"keyword_hits": kw_hits, "sweep_ts": ts_start},
-                                path=eureka_snapshot_path,
-                            )
-                            result = {
-                                "candidate_text": candidate,
-                                "key_info": key_info,
-                                "snapshot_path": snap,
-                                "keyword_hits": kw_hits,
-                            }
-                            raise EurekaSignal(snapshot_path=snap, result=result)
-
-                        if kw_hits > 0:
-                            score = combined_instructional_score(candidate, gate_entropy=False)
-                            best_candidates.append(
-                                {
-                                    "candidate_text": candidate,
-                                    "keyword_hits": kw_hits,
-                                    "instructional_score": score,
-                                    "alpha_name": alpha_name,
-                                    "n_cols": n_cols,
-                                    "perm": list(perm),
-                                    "clock_time": clock_time,
-                                }
-                            )
+                logger.info("P1: priority clock state %s (CIA timestamp)", clock["time"])
+
+            total_candidates += result["count"]
+            for item in result["top"]:
+                _push_top(top, item)
+
+            if result["eureka"] is not None:
+                hit = result["eureka"]
+                snap = write_breakthrough_snapshot(
+                    hit["candidate_text"],
+                    hit["key_info"],
+                    extra={"keyword_hits": hit["keyword_hits"], "sweep_ts": ts_start},
+                    path=eureka_snapshot_path,
+                )
+                raise EurekaSignal(snapshot_path=snap, result={**hit, "snapshot_path": snap})
 
             if progress_cb is not None:
                 progress_cb(
                     {
-                        "clock_idx": clock_idx + 1,
+                        "clock_idx": result["clock_idx"] + 1,
                         "total_clock": total_clock,
-                        "clock_time": clock_time,
+                        "clock_time": clock["time"],
+                        "clock_times": clock["times"],
                         "is_priority": is_priority,
                         "total_candidates": total_candidates,
-                        "top_candidates": sorted(
-                            best_candidates,
-                            key=lambda r: (-r["keyword_hits"], -r["instructional_score"]),
-                        )[:5],
+                        "top_candidates": _ranked(top)[:5],
                     }
                 )
 
-    except EurekaSignal:
-        raise
-
-    best_candidates.sort(key=lambda r: (-r["keyword_hits"], -r["instructional_score"]))
+    best_candidates = _ranked(top)
 
     run_params = {
         "attack": "P1_three_layer_composite",
         "subst_alphabets": list(subst_alphabets.keys()),
         "grid_sizes": grid_sizes,
         "clock_step_seconds": clock_step_seconds,
+        "clock_dedup_factor": clock_dedup_factor(clock_sequence),
         "clock_states_count": len(clock_sequence),
         "priority_clock_times": priority_clock_times,
         "max_perms_per_grid": max_perms_per_grid,
@@ -257,7 +357,7 @@ def run_three_layer_composite(
     }
 
     logger.info(
-        "P1 3-layer composite complete: %d candidates checked, %d near-misses",
+        "P1 3-layer composite complete: %d candidates checked, top %d near-misses kept",
         total_candidates,
         len(best_candidates),
     )
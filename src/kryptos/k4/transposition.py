@@ -1,8 +1,14 @@
 """Columnar transposition search utilities for K4 hypotheses."""
 
+import heapq
 import itertools
+import math
+import operator
 import random
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator, Sequence
+from functools import lru_cache
+
+import numpy as np
 
 from .scoring import combined_plaintext_score_cached as combined_plaintext_score
 
@@ -29,30 +35,118 @@ def get_transposition_attempt_log(clear: bool = False) -> list[dict]:
     return out
 
 
+def unrank_permutation(rank: int, n: int) -> tuple[int, ...]:
+    """Return the ``rank``-th permutation of ``range(n)`` in lexicographic order.
+
+    Decodes the Lehmer code of ``rank`` digit by digit, so rank ``r`` matches the
+    ``r``-th tuple yielded by ``itertools.permutations(range(n))``.
+    """
+    total = math.factorial(n)
+    if not 0 <= rank < total:
+        raise ValueError(f"rank {rank} out of range for {n}! = {total}")
+    pool = list(range(n))
+    out: list[int] = []
+    for i in range(n - 1, -1, -1):
+        digit, rank = divmod(rank, math.factorial(i))
+        out.append(pool.pop(digit))
+    return tuple(out)
+
+
+def sample_permutations(
+    n: int,
+    k: int,
+    rng: random.Random | None = None,
+    strategy: str = 'random',
+) -> Iterator[tuple[int, ...]]:
+    """Lazily yield up to ``k`` permutations of ``range(n)`` without materialising all ``n!``.
+
+    When ``k >= n!`` every permutation is yielded in lexicographic order. Otherwise
+    ``strategy`` picks the ranks:
+
+    - ``'random'``: ``rng.sample(range(n!), k)`` - the same draw (and the same
+      permutations) as ``rng.sample(list(itertools.permutations(range(n))), k)``.
+    - ``'strided'``: ``k`` ranks evenly spaced across the whole rank space, so
+      leading columns vary too (the first ``k`` ranks only shuffle the tail).
+    - ``'first'``: ranks ``0..k-1``.
+    """
+    total = math.factorial(n)
+    if k >= total:
+        yield from itertools.permutations(range(n))
+        return
+    if strategy == 'random':
+        ranks: Iterable[int] = (rng or random).sample(range(total), k)
+    elif strategy == 'strided':
+        ranks = (i * total // k for i in range(k))
+    elif strategy == 'first':
+        ranks = range(k)
+    else:
+        raise ValueError(f"Unknown sampling strategy: {strategy}")
+    for rank in ranks:
+        yield unrank_permutation(rank, n)
+
+
+@lru_cache(maxsize=256)
+def _column_layout(length: int, n_cols: int) -> tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...]]:
+    """Column lengths plus the (row, column) of every plaintext cell, in reading order.
+
+    Depends only on the text length and column count, so every permutation
+    tried at one width shares it.
+    """
+    n_rows = (length + n_cols - 1) // n_cols
+    full_cols = length % n_cols if length % n_cols != 0 else n_cols
+    col_lengths = tuple(n_rows if i < full_cols else (n_rows - 1) for i in range(n_cols))
+    cells = [(r, c) for r in range(n_rows) for c in range(n_cols) if r < col_lengths[c]]
+    return col_lengths, tuple(r for r, _ in cells), tuple(c for _, c in cells)
+
+
+def columnar_gather_indices(length: int, n_cols: int, perm: Sequence[int]) -> list[int]:
+    """Flat index array for inverting a columnar transposition under ``perm``.
+
+    ``plaintext[i] == ciphertext[indices[i]]``: the ciphertext holds the
+    columns in ``perm`` order, so column ``c`` starts at the summed lengths of
+    the columns read before it and cell ``(r, c)`` sits ``r`` past that start.
+    """
+    col_lengths, rows, cols = _column_layout(length, n_cols)
+    starts = [0] * n_cols
+    offset = 0
+    for p in perm:
+        starts[p] = offset
+        offset += col_lengths[p]
+    return [starts[c] + r for r, c in zip(rows, cols, strict=True)]
+
+
 def apply_columnar_permutation(ciphertext: str, n_cols: int, perm: tuple[int, ...]) -> str:
-    ct = ''.join(c for c in ciphertext if c.isalpha())
-    n = len(ct)
+    ct = ciphertext if ciphertext.isalpha() else ''.join(c for c in ciphertext if c.isalpha())
     if n_cols <= 0:
         return ct
-    n_rows = (n + n_cols - 1) // n_cols
-    full_cols = n % n_cols if n % n_cols != 0 else n_cols
-    col_lengths = [n_rows if i < full_cols else (n_rows - 1) for i in range(n_cols)]
-    cols: list[str] = []
-    idx = 0
-    for p in perm:
-        L = col_lengths[p]
-        cols.append(ct[idx : idx + L])
-        idx += L
-    original_order: list[str] = [''] * n_cols
-    for read_index, p in enumerate(perm):
-        original_order[p] = cols[read_index]
-    plaintext_chars: list[str] = []
-    for r in range(n_rows):
-        for c in range(n_cols):
-            cell = original_order[c]
-            if r < len(cell):
-                plaintext_chars.append(cell[r])
-    return ''.join(plaintext_chars)
+    indices = columnar_gather_indices(len(ct), n_cols, perm)
+    if len(indices) < 2:  # itemgetter returns a bare item (or fails) below two indices
+        return ''.join(ct[i] for i in indices)
+    return ''.join(operator.itemgetter(*indices)(ct))
+
+
+def apply_columnar_permutations(ciphertext: str, n_cols: int, perms: Sequence[Sequence[int]]) -> list[str]:
+    """Invert one columnar transposition under many permutations at once.
+
+    Equivalent to ``[apply_columnar_permutation(ciphertext, n_cols, p) for p in perms]``,
+    but builds every gather-index row with array ops and applies them with a
+    single ``take`` over the byte-encoded ciphertext.
+    """
+    ct = ciphertext if ciphertext.isalpha() else ''.join(c for c in ciphertext if c.isalpha())
+    if n_cols <= 0:
+        return [ct] * len(perms)
+    if not perms or not ct.isascii():
+        return [apply_columnar_permutation(ct, n_cols, p) for p in perms]
+    col_lengths, rows, cols = _column_layout(len(ct), n_cols)
+    perm_arr = np.asarray(perms, dtype=np.intp)
+    read_lengths = np.asarray(col_lengths, dtype=np.intp)[perm_arr]
+    offsets = np.zeros_like(read_lengths)
+    np.cumsum(read_lengths[:, :-1], axis=1, out=offsets[:, 1:])
+    starts = np.empty_like(offsets)
+    np.put_along_axis(starts, perm_arr, offsets, axis=1)
+    gather = starts[:, np.asarray(cols, dtype=np.intp)] + np.asarray(rows, dtype=np.intp)
+    buf = np.frombuffer(ct.encode('ascii'), dtype=np.uint8)
+    return [row.tobytes().decode('ascii') for row in buf.take(gather)]
 
 
 def _partial_score(text: str, length: int) -> float:
@@ -76,12 +170,10 @@ def search_columnar(
     Returns list of dicts: {'cols': n_cols, 'perm': perm, 'score': score, 'text': plaintext}
     """
     results: list[dict] = []
+    ct = ''.join(c for c in ciphertext if c.isalpha())
     for n_cols in range(min_cols, max_cols + 1):
-        all_perms_iter: Iterable[tuple[int, ...]] = itertools.permutations(range(n_cols))
-        for count, perm in enumerate(all_perms_iter):
-            if count >= max_perms_per_width:
-                break
-            pt = apply_columnar_permutation(ciphertext, n_cols, perm)
+        perms = list(itertools.islice(itertools.permutations(range(n_cols)), max(max_perms_per_width, 0)))
+        for perm, pt in zip(perms, apply_columnar_permutations(ct, n_cols, perms), strict=True):
             pruned_flag = False
             if prune:
                 ps = _partial_score(pt, partial_length)
@@ -96,6 +188,166 @@ def search_columnar(
     return results[:50]
 
 
+_NGRAM_TABLES = {
+    2: ('BIGRAMS', '_UNKNOWN_BIGRAM'),
+    3: ('TRIGRAMS', '_UNKNOWN_TRIGRAM'),
+    4: ('QUADGRAMS', '_UNKNOWN_QUADGRAM'),
+}
+_BOUND_EPS = 1e-6  # slack for float drift in the incrementally-maintained bound
+
+
+def _ngram_model(size: int) -> tuple[dict[str, float], float, dict[str, float]]:
+    """The ``size``-gram table, its unknown-gram score and per-pattern maxima.
+
+    ``maxima`` maps a pattern with ``?`` for unfixed letters (``'T?O?'``) to the
+    best score any completion can reach. Unlisted patterns can do no better
+    than ``unknown``; a completion outside the table always exists, so
+    ``maxima.get(pattern, unknown)`` is an admissible per-window bound.
+    """
+    from . import scoring as _scoring
+
+    table_name, unknown_name = _NGRAM_TABLES[size]
+    table: dict[str, float] = getattr(_scoring, table_name)
+    unknown: float = getattr(_scoring, unknown_name)
+    maxima: dict[str, float] = {}
+    for gram, value in table.items():
+        if len(gram) != size:
+            continue
+        for mask in range(1 << size):
+            pattern = ''.join(ch if mask >> k & 1 else '?' for k, ch in enumerate(gram))
+            if value > maxima.get(pattern, unknown):
+                maxima[pattern] = value
+    return table, unknown, maxima
+
+
+def branch_and_bound_width(
+    ciphertext: str,
+    n_cols: int,
+    top_k: int = 50,
+    ngram_size: int = 4,
+) -> tuple[list[tuple[float, tuple[int, ...]]], int]:
+    """Exact top-``top_k`` permutations at one width by n-gram log-probability.
+
+    Depth-first over the ciphertext read order: fixing ``perm[d]`` pins the
+    offset of that column, so every plaintext cell in it is known. Windows
+    whose letters are all known contribute their exact score; every other
+    window contributes the best score any completion of its known letters can
+    reach. That sum bounds every permutation below the node, so a subtree is
+    cut once it cannot beat the current ``top_k``-th score. Children are
+    explored best-bound first to raise that threshold early.
+
+    The objective is ``scoring.quadgram_score`` (``ngram_size=4``; 2 and 3 use
+    the bigram/trigram tables). Returns ``([(score, perm), ...] best first,
+    nodes_visited)``; ties are broken by lexicographic permutation order.
+    """
+    ct = ciphertext if ciphertext.isalpha() else ''.join(c for c in ciphertext if c.isalpha())
+    ct = ct.upper()
+    length = len(ct)
+    if n_cols <= 0 or top_k <= 0:
+        return [], 0
+    table, unknown, maxima = _ngram_model(ngram_size)
+    col_lengths, _rows, _cols = _column_layout(length, n_cols)
+    n_windows = max(length - ngram_size + 1, 0)
+    touching: list[list[int]] = [[] for _ in range(n_cols)]
+    for w in range(n_windows):
+        for c in sorted({(w + k) % n_cols for k in range(ngram_size)}):
+            touching[c].append(w)
+
+    letters = ['?'] * length
+    window_val = [maxima.get('?' * ngram_size, unknown)] * n_windows
+    bound = sum(window_val)
+    used = [False] * n_cols
+    perm: list[int] = []
+    # Min-heap of (score, negated perm): among equal scores the lexicographically larger perm is evicted first.
+    heap: list[tuple[float, tuple[int, ...]]] = []
+    nodes = 0
+
+    def set_column(c: int, offset: int | None) -> None:
+        for r in range(col_lengths[c]):
+            letters[r * n_cols + c] = '?' if offset is None else ct[offset + r]
+
+    def child_windows(c: int, offset: int) -> tuple[float, list[tuple[int, float]]]:
+        """Bound change and new window values if column ``c`` is read next, at ``offset``."""
+        set_column(c, offset)
+        updates = []
+        delta = 0.0
+        for w in touching[c]:
+            gram = ''.join(letters[w : w + ngram_size])
+            new = maxima.get(gram, unknown) if '?' in gram else table.get(gram, unknown)
+            updates.append((w, new))
+            delta += new - window_val[w]
+        set_column(c, None)
+        return delta, updates
+
+    def visit(offset: int) -> None:
+        nonlocal nodes, bound
+        nodes += 1
+        if len(perm) == n_cols:
+            score = sum(window_val)  # same order as _score_ngrams -> bit-identical score
+            entry = (score, tuple(-c for c in perm))
+            if len(heap) < top_k:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+            return
+        children = []
+        for c in range(n_cols):
+            if not used[c]:
+                delta, updates = child_windows(c, offset)
+                children.append((bound + delta, c, updates))
+        children.sort(key=lambda child: (-child[0], child[1]))
+        for child_bound, c, updates in children:
+            if len(heap) >= top_k and child_bound + _BOUND_EPS <= heap[0][0]:
+                break  # children are sorted, so no later sibling can do better
+            saved = bound
+            undo = [(w, window_val[w]) for w, _ in updates]
+            for w, new in updates:
+                window_val[w] = new
+            bound = child_bound
+            set_column(c, offset)
+            used[c] = True
+            perm.append(c)
+            visit(offset + col_lengths[c])
+            perm.pop()
+            used[c] = False
+            set_column(c, None)
+            for w, old in undo:
+                window_val[w] = old
+            bound = saved
+
+    visit(0)
+    ranked = sorted(((score, tuple(-c for c in key)) for score, key in heap), key=lambda e: (-e[0], e[1]))
+    return ranked, nodes
+
+
+def search_columnar_branch_and_bound(
+    ciphertext: str,
+    min_cols: int = 5,
+    max_cols: int = 8,
+    top_k: int = 50,
+    ngram_size: int = 4,
+) -> list[dict]:
+    """Exact top-``top_k`` columnar permutations per width via :func:`branch_and_bound_width`.
+
+    Unlike :func:`search_columnar`, which scores only the first
+    ``max_perms_per_width`` permutations in lexicographic order, every
+    permutation is covered; whole subtrees are skipped only when their n-gram
+    bound cannot reach the running top-``top_k``.
+    Returns list of dicts: {'cols', 'perm', 'score' (n-gram log-probability), 'text', 'nodes'}
+    where ``nodes`` is the number of search-tree nodes visited at that width.
+    """
+    ct = ''.join(c for c in ciphertext if c.isalpha())
+    results: list[dict] = []
+    for n_cols in range(min_cols, max_cols + 1):
+        ranked, nodes = branch_and_bound_width(ct, n_cols, top_k=top_k, ngram_size=ngram_size)
+        texts = apply_columnar_permutations(ct, n_cols, [perm for _, perm in ranked])
+        for (score, perm), pt in zip(ranked, texts, strict=True):
+            _log_attempt(n_cols, perm, None, score, pruned=False)
+            results.append({'cols': n_cols, 'perm': perm, 'score': score, 'text': pt, 'nodes': nodes})
+    results.sort(key=lambda r: r['score'], reverse=True)
+    return results[:top_k]
+
+
 def search_columnar_adaptive(
     ciphertext: str,
     min_cols: int = 5,
@@ -114,10 +366,7 @@ def search_columnar_adaptive(
     all_results: list[dict] = []
     prefix_cache: dict[tuple[int, ...], float] = {}
     for n_cols in range(min_cols, max_cols + 1):
-        perms = list(itertools.permutations(range(n_cols)))
-        if len(perms) > sample_perms:
-            perms = rng.sample(perms, sample_perms)
-        for perm in perms:
+        for perm in sample_permutations(n_cols, sample_perms, rng):
             pt = apply_columnar_permutation(ct, n_cols, perm)
             partial = _partial_score(pt, partial_length)
             pref = perm[:prefix_len]
@@ -145,7 +394,13 @@ def search_columnar_adaptive(
 
 __all__ = [
     'apply_columnar_permutation',
+    'apply_columnar_permutations',
+    'columnar_gather_indices',
+    'unrank_permutation',
+    'sample_permutations',
     'search_columnar',
     'search_columnar_adaptive',
+    'search_columnar_branch_and_bound',
+    'branch_and_bound_width',
     'get_transposition_attempt_log',
 ]
@@ -10,6 +10,7 @@ import inspect
 import logging
 import random
 from collections import Counter
+from fractions import Fraction
 from typing import Any
 
 from kryptos.k4.solver_config import SolverConfig
@@ -322,6 +323,159 @@ def apply_columnar_permutation_reverse(ciphertext: str, period: int, permutation
     return "".join(plaintext)
 
 
+_CODE_BASE = 27  # A-Z plus one slot for any other letter (never in the tables)
+
+
+def _letter_code(ch: str) -> int:
+    return ord(ch) - 65 if "A" <= ch <= "Z" else 26
+
+
+def _dense_fixed_point(table: dict[str, float], size: int, scale: int) -> list[int]:
+    dense = [0] * _CODE_BASE**size
+    for gram, value in table.items():
+        idx = 0
+        for ch in gram:
+            idx = idx * _CODE_BASE + _letter_code(ch)
+        dense[idx] = int(Fraction(value) * scale)
+    return dense
+
+
+class ColumnarDeltaState:
+    """Decrypted buffer plus per-window n-gram contributions for one permutation.
+
+    Mirrors ``apply_columnar_permutation_reverse`` + ``score_combined`` but lets a
+    swap of two read positions be scored by touching only the columns whose
+    characters actually move and the bigram/trigram windows that overlap them.
+    A proposal is applied in place; :meth:`commit` keeps it and :meth:`rollback`
+    restores the previous buffer and totals from an undo log, both O(rows) for
+    equal-length columns.
+
+    Window values are held as integers over a shared power-of-two denominator
+    (floats are dyadic, so this is lossless); totals therefore never drift
+    across swaps and agree with ``score_combined`` up to its own float rounding.
+    """
+
+    def __init__(self, text: str, period: int, perm: list[int]) -> None:
+        self.text = text
+        self.period = period
+        self.perm = list(perm)
+        n = len(text)
+        self.n = n
+        base_len, extra = divmod(n, period)
+        self.col_lengths = [base_len + (1 if i < extra else 0) for i in range(period)]
+        self._codes = [_letter_code(c) for c in text]
+        self._scale = max(Fraction(v).denominator for v in (*COMMON_BIGRAMS.values(), *COMMON_TRIGRAMS.values()))
+        self._bi_table = _dense_fixed_point(COMMON_BIGRAMS, 2, self._scale)
+        self._tri_table = _dense_fixed_point(COMMON_TRIGRAMS, 3, self._scale)
+        self.buffer = [_letter_code(c) for c in apply_columnar_permutation_reverse(text, period, self.perm)]
+        b = self.buffer
+        self._bi = [self._bi_table[b[w] * _CODE_BASE + b[w + 1]] for w in range(n - 1)]
+        self._tri = [self._tri_table[(b[w] * _CODE_BASE + b[w + 1]) * _CODE_BASE + b[w + 2]] for w in range(n - 2)]
+        self._bi_total = sum(self._bi)
+        self._tri_total = sum(self._tri)
+        self._undo: tuple | None = None
+
+    @property
+    def score(self) -> float:
+        n = self.n
+        bi = (self._bi_total / self._scale) / (n - 1) if n >= 2 else 0.0
+        tri = (self._tri_total / self._scale) / (n - 2) if n >= 3 else 0.0
+        return bi * 0.6 + tri * 0.4
+
+    def plaintext(self) -> str:
+        return "".join(chr(c + 65) if c < 26 else "?" for c in self.buffer)
+
+    def propose_swap(self, i: int, j: int) -> float:
+        """Swap read positions ``i`` and ``j`` in place and return the new score."""
+        if self._undo is not None:
+            raise RuntimeError("commit() or rollback() the pending proposal first")
+        lo, hi = (i, j) if i < j else (j, i)
+        perm = self.perm
+        perm[i], perm[j] = perm[j], perm[i]
+        lengths = self.col_lengths
+        start = 0
+        for k in range(lo):
+            start += lengths[perm[k]]
+        # Equal lengths: only the two swapped columns move. Unequal lengths also
+        # shift the read offset of every column in between.
+        shifts = lengths[perm[lo]] != lengths[perm[hi]]
+
+        codes, buffer, period = self._codes, self.buffer, self.period
+        char_undo: list[tuple[int, int]] = []
+        windows: set[int] = set()
+        for k in range(lo, hi + 1):
+            col = perm[k]
+            col_len = lengths[col]
+            if shifts or k == lo or k == hi:
+                pos = col
+                for src in range(start, start + col_len):
+                    code = codes[src]
+                    if buffer[pos] != code:
+                        char_undo.append((pos, buffer[pos]))
+                        buffer[pos] = code
+                        windows.add(pos)
+                        windows.add(pos - 1)
+                        windows.add(pos - 2)
+                    pos += period
+            start += col_len
+
+        bi_undo: list[tuple[int, int]] = []
+        tri_undo: list[tuple[int, int]] = []
+        bi, tri, bi_table, tri_table = self._bi, self._tri, self._bi_table, self._tri_table
+        last_bi, last_tri = self.n - 2, self.n - 3
+        bi_total, tri_total = self._bi_total, self._tri_total
+        for w in windows:
+            if w < 0:
+                continue
+            if w <= last_bi:
+                pair = buffer[w] * _CODE_BASE + buffer[w + 1]
+                new = bi_table[pair]
+                old = bi[w]
+                if new != old:
+                    bi_undo.append((w, old))
+                    bi[w] = new
+                    bi_total += new - old
+                if w <= last_tri:
+                    new = tri_table[pair * _CODE_BASE + buffer[w + 2]]
+                    old = tri[w]
+                    if new != old:
+                        tri_undo.append((w, old))
+                        tri[w] = new
+                        tri_total += new - old
+        self._bi_total, self._tri_total = bi_total, tri_total
+        self._undo = (i, j, char_undo, bi_undo, tri_undo)
+        return self.score
+
+    def commit(self) -> None:
+        self._undo = None
+
+    def rollback(self) -> None:
+        if self._undo is None:
+            return
+        i, j, char_undo, bi_undo, tri_undo = self._undo
+        self.perm[i], self.perm[j] = self.perm[j], self.perm[i]
+        for pos, code in char_undo:
+            self.buffer[pos] = code
+        for w, old in bi_undo:
+            self._bi_total += old - self._bi[w]
+            self._bi[w] = old
+        for w, old in tri_undo:
+            self._tri_total += old - self._tri[w]
+            self._tri[w] = old
+        self._undo = None
+
+
+_STOCK_SCORE_COMBINED = score_combined
+_STOCK_REVERSE = apply_columnar_permutation_reverse
+
+
+def _delta_scoring_available() -> bool:
+    # The delta state bakes in the stock decrypt/score pair. Tests (and callers
+    # experimenting with objectives) monkeypatch these module globals to steer
+    # the solvers, so fall back to full re-scoring whenever either is replaced.
+    return score_combined is _STOCK_SCORE_COMBINED and apply_columnar_permutation_reverse is _STOCK_REVERSE
+
+
 def solve_columnar_permutation_multi_start(
     ciphertext: str,
     period: int,
@@ -329,6 +483,7 @@ def solve_columnar_permutation_multi_start(
     max_iterations: int = 5000,
     config: SolverConfig | None = None,
     rng: random.Random | None = None,
+    incremental: bool = True,
 ) -> tuple[list[int], float]:
     """Solve columnar permutation with multiple random restarts.
 
@@ -337,6 +492,8 @@ def solve_columnar_permutation_multi_start(
         period: Known or suspected period
         num_restarts: Number of random restarts
         max_iterations: Max iterations per restart
+        incremental: Score swaps with :class:`ColumnarDeltaState` instead of
+            re-decrypting and re-scoring the full text each iteration.
 
     Returns:
         (best_permutation, best_score) tuple
@@ -353,11 +510,17 @@ def solve_columnar_permutation_multi_start(
     global_best_perm = list(range(period))
     global_best_score = float("-inf")
 
+    use_delta = incremental and _delta_scoring_available()
+
     for _restart in range(num_restarts):
         current_perm = list(range(period))
         rng_obj.shuffle(current_perm)
-        current_text = apply_columnar_permutation_reverse(text, period, current_perm)
-        current_score = score_combined(current_text)
+        if use_delta:
+            state = ColumnarDeltaState(text, period, current_perm)
+            current_score = state.score
+        else:
+            current_text = apply_columnar_permutation_reverse(text, period, current_perm)
+            current_score = score_combined(current_text)
 
         best_perm = current_perm[:]
         best_score = current_score
@@ -365,20 +528,28 @@ def solve_columnar_permutation_multi_start(
 
         for _ in range(max_iterations):
             i, j = rng_obj.sample(range(period), 2)
-            new_perm = current_perm[:]
-            new_perm[i], new_perm[j] = new_perm[j], new_perm[i]
-
-            new_text = apply_columnar_permutation_reverse(text, period, new_perm)
-            new_score = score_combined(new_text)
+            if use_delta:
+                new_score = state.propose_swap(i, j)
+            else:
+                new_perm = current_perm[:]
+                new_perm[i], new_perm[j] = new_perm[j], new_perm[i]
+                new_text = apply_columnar_permutation_reverse(text, period, new_perm)
+                new_score = score_combined(new_text)
 
             if new_score > current_score:
-                current_perm = new_perm
+                if use_delta:
+                    state.commit()
+                    current_perm = state.perm
+                else:
+                    current_perm = new_perm
                 current_score = new_score
                 no_improvement = 0
                 if current_score > best_score:
                     best_perm = current_perm[:]
                     best_score = current_score
             else:
+                if use_delta:
+                    state.rollback()
                 no_improvement += 1
 
             if no_improvement >= 1000:
@@ -495,6 +666,7 @@ def solve_columnar_permutation_simulated_annealing(
     config: SolverConfig | None = None,
     rng: random.Random | None = None,
     seed_perm: list[int] | None = None,
+    incremental: bool = True,
 ) -> tuple[list[int], float]:
     """Solve columnar transposition using simulated annealing.
 
@@ -512,6 +684,8 @@ def solve_columnar_permutation_simulated_annealing(
             instead of from a random shuffle, so a strong prior converges
             faster and cannot do worse than the seed's score. Must be a
             permutation of ``range(period)``.
+        incremental: Score swaps with :class:`ColumnarDeltaState` instead of
+            re-decrypting and re-scoring the full text each iteration.
 
     Returns:
         (best_permutation, best_score) tuple
@@ -538,8 +712,13 @@ def solve_columnar_permutation_simulated_annealing(
         current_perm = list(range(period))
         rng_obj.shuffle(current_perm)
 
-    current_text = apply_columnar_permutation_reverse(text, period, current_perm)
-    current_score = score_combined(current_text)
+    use_delta = incremental and _delta_scoring_available()
+    if use_delta:
+        state = ColumnarDeltaState(text, period, current_perm)
+        current_score = state.score
+    else:
+        current_text = apply_columnar_permutation_reverse(text, period, current_perm)
+        current_score = score_combined(current_text)
 
     best_perm = current_perm[:]
     best_score = current_score
@@ -547,28 +726,38 @@ def solve_columnar_permutation_simulated_annealing(
     temperature = initial_temp
 
     for _ in range(max_iterations):
-        neighbor_perm = current_perm[:]
-        i, j = rng_obj.sample(range(period), 2)
-        neighbor_perm[i], neighbor_perm[j] = neighbor_perm[j], neighbor_perm[i]
+        if use_delta:
+            i, j = rng_obj.sample(range(period), 2)
+            neighbor_score = state.propose_swap(i, j)
+        else:
+            neighbor_perm = current_perm[:]
+            i, j = rng_obj.sample(range(period), 2)
+            neighbor_perm[i], neighbor_perm[j] = neighbor_perm[j], neighbor_perm[i]
 
-        neighbor_text = apply_columnar_permutation_reverse(text, period, neighbor_perm)
-        neighbor_score = score_combined(neighbor_text)
+            neighbor_text = apply_columnar_permutation_reverse(text, period, neighbor_perm)
+            neighbor_score = score_combined(neighbor_text)
 
         delta = neighbor_score - current_score
 
         if delta > 0:
-            current_perm = neighbor_perm
+            accepted = True
+        else:
+            acceptance_prob = math.exp(delta / temperature) if temperature > 0 else 0
+            accepted = rng_obj.random() < acceptance_prob
+
+        if accepted:
+            if use_delta:
+                state.commit()
+                current_perm = state.perm
+            else:
+                current_perm = neighbor_perm
             current_score = neighbor_score
 
             if current_score > best_score:
                 best_perm = current_perm[:]
                 best_score = current_score
-        else:
-            acceptance_prob = math.exp(delta / temperature) if temperature > 0 else 0
-
-            if rng_obj.random() < acceptance_prob:
-                current_perm = neighbor_perm
-                current_score = neighbor_score
+        elif use_delta:
+            state.rollback()
 
         temperature *= cooling_rate
 
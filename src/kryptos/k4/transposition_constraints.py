@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import itertools
-from collections.abc import Sequence
+from collections import deque
+from collections.abc import Iterator, Mapping, Sequence
 
 from .cribs import normalize_cipher
 from .scoring import combined_plaintext_score_cached as combined_plaintext_score
@@ -39,6 +40,213 @@ def invert_columnar(ciphertext: str, n_cols: int, perm: tuple[int, ...]) -> str:
     return ''.join(out)
 
 
+# (crib index, start) -> column -> ciphertext offsets at which that column's segment spells the crib letters.
+_Supports = dict[tuple[int, int], dict[int, set[int]]]
+
+
+def _offset_candidates(col_lengths: list[int]) -> list[set[int]]:
+    """Every offset each column's segment can start at: sums of the lengths of some set of other columns."""
+    n_cols = len(col_lengths)
+    long_len = max(col_lengths, default=0)
+    n_long = col_lengths.count(long_len)
+    n_short = n_cols - n_long
+    domains = []
+    for length in col_lengths:
+        a_max = n_long - (length == long_len)
+        b_max = n_short - (length != long_len)
+        domains.append({a * long_len + b * (long_len - 1) for a in range(a_max + 1) for b in range(b_max + 1)})
+    return domains
+
+
+def _build_crib_csp(
+    ct: str,
+    positional_cribs: Mapping[str, Sequence[int]],
+    n_cols: int,
+    window: int,
+) -> tuple[list[int], list[set[int]], list[set[int]], _Supports] | None:
+    """Column-offset / crib-start CSP made arc consistent (AC-3), or None if it has no solution.
+
+    Variables are each column's ciphertext offset and each crib's start
+    position. A crib start supports only offsets whose segment puts the crib
+    letters at the right rows; two columns' segments may not overlap.
+    """
+    n = len(ct)
+    col_lengths = _column_lengths(n, n_cols)
+    col_dom = _offset_candidates(col_lengths)
+    starts: list[set[int]] = []
+    supports: _Supports = {}
+    for k, (crib, expected) in enumerate(positional_cribs.items()):
+        target = normalize_cipher(crib)
+        if not target:
+            starts.append(set())  # unconstrained; skipped below
+            continue
+        allowed = {
+            s for s in range(n - len(target) + 1) if expected and min(abs(s - ep) for ep in expected) <= window
+        }
+        for s in allowed:
+            per_col: dict[int, set[int]] = {}
+            for j, letter in enumerate(target):
+                r, c = divmod(s + j, n_cols)
+                fits = {o for o in per_col.get(c, col_dom[c]) if ct[o + r] == letter}
+                per_col[c] = fits
+            supports[(k, s)] = per_col
+        if not allowed:
+            return None
+        starts.append(allowed)
+    cribs = [k for k, dom in enumerate(starts) if dom]
+
+    def revise_start(k: int) -> bool:
+        keep = {s for s in starts[k] if all(fits & col_dom[c] for c, fits in supports[(k, s)].items())}
+        changed = keep != starts[k]
+        starts[k] = keep
+        return changed
+
+    def revise_col(c: int, k: int | None, d: int | None) -> bool:
+        if k is not None:
+            touching = [supports[(k, s)] for s in starts[k]]
+            if not all(c in per_col for per_col in touching):
+                return False  # some start leaves column c free
+            keep = {o for o in col_dom[c] if any(o in per_col[c] for per_col in touching)}
+        else:
+            len_c, len_d = col_lengths[c], col_lengths[d]
+            keep = {o for o in col_dom[c] if any(o + len_c <= q or q + len_d <= o for q in col_dom[d])}
+        changed = keep != col_dom[c]
+        col_dom[c] = keep
+        return changed
+
+    # ('start', k, None) revises crib k's starts; ('col', c, ('crib', k) | ('col', d)) revises column c's offsets.
+    queue = deque([('start', k, None) for k in cribs])
+    queue.extend(('col', c, ('crib', k)) for c in range(n_cols) for k in cribs)
+    queue.extend(('col', c, ('col', d)) for c in range(n_cols) for d in range(n_cols) if c != d)
+    while queue:
+        kind, var, other = queue.popleft()
+        if kind == 'start':
+            if not revise_start(var):
+                continue
+            if not starts[var]:
+                return None
+            queue.extend(('col', c, ('crib', var)) for c in range(n_cols))
+        else:
+            changed = revise_col(var, other[1], None) if other[0] == 'crib' else revise_col(var, None, other[1])
+            if not changed:
+                continue
+            if not col_dom[var]:
+                return None
+            queue.extend(('start', k, None) for k in cribs)
+            queue.extend(('col', d, ('col', var)) for d in range(n_cols) if d != var)
+    return col_lengths, col_dom, starts, supports
+
+
+def crib_offset_domains(
+    ciphertext: str,
+    positional_cribs: Mapping[str, Sequence[int]],
+    n_cols: int,
+    window: int = 5,
+) -> list[set[int]] | None:
+    """Per plaintext column, the ciphertext offsets its segment can start at given the positional cribs.
+
+    Result of the AC-3 pre-pass behind :func:`crib_consistent_permutations`;
+    ``None`` when no columnar permutation can place every crib within
+    ``window`` of one of its expected (0-based) start indices.
+    """
+    csp = _build_crib_csp(normalize_cipher(ciphertext), positional_cribs, n_cols, window)
+    return None if csp is None else csp[1]
+
+
+def crib_consistent_permutations(
+    ciphertext: str,
+    positional_cribs: Mapping[str, Sequence[int]],
+    n_cols: int,
+    window: int = 5,
+) -> Iterator[tuple[int, ...]]:
+    """Yield, in lexicographic order, exactly the read orders whose inverse places every crib.
+
+    A permutation survives iff for every crib some start within ``window`` of
+    an expected index spells it out, the same test
+    :func:`search_with_multiple_cribs_positions` applies to decrypted text.
+    The read order is built one column at a time; a column is only tried at
+    offsets left in its arc-consistent domain, and a branch is dropped as soon
+    as a crib has no start left that agrees with the columns already placed and
+    can still fit its unplaced columns: an unplaced column can only start at the
+    next offset plus a subset sum of the other unplaced columns' lengths.
+    """
+    ct = normalize_cipher(ciphertext)
+    if n_cols <= 0:
+        return
+    csp = _build_crib_csp(ct, positional_cribs, n_cols, window)
+    if csp is None:
+        return
+    col_lengths, col_dom, starts, supports = csp
+    cribs = [k for k, dom in enumerate(starts) if dom]
+    live = {k: starts[k] for k in cribs}
+    used = [False] * n_cols
+    perm: list[int] = []
+    long_len = max(col_lengths)
+    left = [sum(length == long_len for length in col_lengths), sum(length != long_len for length in col_lengths)]
+    gaps: dict[tuple[int, int], frozenset[int]] = {}
+
+    def gap_sums(n_long: int, n_short: int) -> frozenset[int]:
+        key = (n_long, n_short)
+        if key not in gaps:
+            gaps[key] = frozenset(
+                i * long_len + j * (long_len - 1) for i in range(n_long + 1) for j in range(n_short + 1)
+            )
+        return gaps[key]
+
+    def can_finish(narrowed: dict[int, set[int]], next_offset: int) -> bool:
+        # Offsets an unplaced column d can still take, relative to next_offset: subset sums of the others.
+        reach = {
+            d: gap_sums(left[0] - (col_lengths[d] == long_len), left[1] - (col_lengths[d] != long_len))
+            for d in range(n_cols)
+            if not used[d]
+        }
+        for k in cribs:
+            if not any(
+                all(
+                    any(o - next_offset in reach[d] for o in fits)
+                    for d, fits in supports[(k, s)].items()
+                    if not used[d]
+                )
+                for s in narrowed[k]
+            ):
+                return False
+        return True
+
+    def place(c: int, offset: int) -> dict[int, set[int]] | None:
+        narrowed = {}
+        for k in cribs:
+            keep = {s for s in live[k] if offset in supports[(k, s)].get(c, (offset,))}
+            if not keep:
+                return None
+            narrowed[k] = keep
+        return narrowed
+
+    def extend(offset: int) -> Iterator[tuple[int, ...]]:
+        nonlocal live
+        if len(perm) == n_cols:
+            yield tuple(perm)
+            return
+        for c in range(n_cols):
+            if used[c] or offset not in col_dom[c]:
+                continue
+            narrowed = place(c, offset)
+            if narrowed is None:
+                continue
+            is_long = col_lengths[c] == long_len
+            used[c] = True
+            left[0 if is_long else 1] -= 1
+            if can_finish(narrowed, offset + col_lengths[c]):
+                saved, live = live, narrowed
+                perm.append(c)
+                yield from extend(offset + col_lengths[c])
+                perm.pop()
+                live = saved
+            left[0 if is_long else 1] += 1
+            used[c] = False
+
+    yield from extend(0)
+
+
 def search_with_crib(ciphertext: str, crib: str, n_cols: int, max_perms: int = 1000) -> list[dict]:
     ct = normalize_cipher(ciphertext)
     target = normalize_cipher(crib)
@@ -89,21 +297,35 @@ def search_with_multiple_cribs_positions(
     window: int = 5,
     max_perms: int = 5000,
     limit: int = 50,
+    propagate: bool = True,
 ) -> list[dict]:
     """Search permutations where all provided cribs appear within any of their expected indices ± window.
     positional_cribs: mapping crib -> iterable of expected start indices (0-based).
     Adds positional bonus to score via positional_crib_bonus.
+    With ``propagate`` (default) only permutations from :func:`crib_consistent_permutations`
+    are decrypted, so ``max_perms`` caps crib-consistent candidates rather than the first
+    ``max_perms`` of all ``n_cols!``; each result then carries ``surviving_perms``, the
+    number of pre-pass survivors examined, and ``surviving_perms_capped``, True when
+    ``max_perms`` stopped the enumeration with survivors left (so the count is a lower
+    bound). Survivors beyond ``max_perms`` are never enumerated.
+    ``propagate=False`` keeps the original enumerate-and-filter path.
     Returns up to limit best matches sorted by combined score.
     """
     if not positional_cribs:
         return []
     ct = normalize_cipher(ciphertext)
     crib_norm_map: dict[str, str] = {crib.upper(): normalize_cipher(crib) for crib in positional_cribs}
-    perms_iter = itertools.permutations(range(n_cols))
+    if propagate:
+        survivors = crib_consistent_permutations(ct, positional_cribs, n_cols, window)
+        perms_iter: Iterator[tuple[int, ...]] = itertools.islice(survivors, max_perms)
+    else:
+        perms_iter = itertools.permutations(range(n_cols))
     results: list[dict] = []
+    examined = 0
     for count, perm in enumerate(perms_iter):
         if count >= max_perms:
             break
+        examined = count + 1
         pt = invert_columnar(ct, n_cols, perm)
         all_ok = True
         occurrences: dict[str, int] = {}
@@ -142,11 +364,18 @@ def search_with_multiple_cribs_positions(
                 'pos_bonus': pos_bonus,
             },
         )
+    if propagate:
+        capped = next(survivors, None) is not None
+        for r in results:
+            r['surviving_perms'] = examined
+            r['surviving_perms_capped'] = capped
     results.sort(key=lambda r: r['score'], reverse=True)
     return results[:limit]
 
 
 __all__ = [
+    'crib_consistent_permutations',
+    'crib_offset_domains',
     'invert_columnar',
     'search_with_crib',
     'search_with_crib_at_position',
@@ -9,11 +9,27 @@ from __future__ import annotations
 import random
 from collections import Counter
 
+import numpy as np
+
 from kryptos.k4.solver_config import SolverConfig
 from kryptos.provenance.search_space import SearchSpaceTracker
 
 KEYED_ALPHABET = "KRYPTOSABCDEFGHIJLMNQUVWXZ"
 STANDARD_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+DEFAULT_BEAM_WIDTH = 128
+
+KNOWN_CIPHER_KEYS: frozenset[str] = frozenset({
+    "PALIMPSEST",
+    "ABSCISSA",
+    "KRYPTOS",
+    "BERLIN",
+    "CLOCK",
+    "CIPHER",
+    "SECRET",
+    "SHADOW",
+    "LIGHT",
+    "DIGITAL",
+})
 
 
 def build_keyed_alphabet(keyword: str, base: str = STANDARD_ALPHABET) -> str:
@@ -209,6 +225,40 @@ def recover_key_by_frequency(
     if len(ct) < key_length:
         return []
 
+    if use_spy_scoring:
+        candidates = _spy_ranked_keys(ciphertext, ct, key_length, alphabet, top_n, config)
+    else:
+        beam_width = DEFAULT_BEAM_WIDTH
+        if config is not None and config.vigenere_beam_width is not None:
+            beam_width = config.vigenere_beam_width
+        # Known keys keep the priority the old dictionary ranking gave them, as long as
+        # frequency analysis puts each of their letters in its column's top candidates.
+        known = _known_key_hits(_column_key_candidates(ct, key_length, alphabet, per_column=max(10, top_n)))
+        beam = beam_search_keys(ct, key_length, alphabet=alphabet, beam_width=max(beam_width, top_n))
+        candidates = (known + [k for k in beam if k not in known])[:top_n]
+
+    if skip_tried:
+        if tracker is None:
+            tracker = SearchSpaceTracker()
+
+        candidates_filtered = [k for k in candidates if not tracker.already_tried("vigenere", k)]
+
+        new_keys = candidates_filtered
+        if new_keys:
+            tracker.record_exploration(
+                cipher_type="vigenere",
+                region_key=f"length_{key_length}",
+                count=len(new_keys),
+                keys=new_keys,
+            )
+
+        candidates = candidates_filtered
+
+    return candidates
+
+
+def _column_key_candidates(ct: str, key_length: int, alphabet: str, per_column: int) -> list[list[str]]:
+    """Best ``per_column`` key letters for each column by single-column letter frequency."""
     columns: list[list[str]] = [[] for _ in range(key_length)]
     for i, char in enumerate(ct):
         columns[i % key_length].append(char)
@@ -237,13 +287,31 @@ def recover_key_by_frequency(
                 scores.append((score, k_char))
 
         scores.sort(reverse=True)
-        per_position_candidates = 5 if use_spy_scoring else max(10, top_n)
-        key_chars.append([k for _, k in scores[:per_position_candidates]])
+        key_chars.append([k for _, k in scores[:per_column]])
+    return key_chars
+
+
+def _known_key_hits(key_chars: list[list[str]]) -> list[str]:
+    """Known cipher keys whose every letter is among its column's frequency candidates."""
+    length = len(key_chars)
+    return [
+        key
+        for key in sorted(KNOWN_CIPHER_KEYS)
+        if len(key) == length and all(ch in cands for ch, cands in zip(key, key_chars, strict=True))
+    ]
 
-    if use_spy_scoring:
-        max_candidates = min(100, 5 ** min(len(key_chars), 4))
-    else:
-        max_candidates = 500_000
+
+def _spy_ranked_keys(
+    ciphertext: str,
+    ct: str,
+    key_length: int,
+    alphabet: str,
+    top_n: int,
+    config: SolverConfig | None,
+) -> list[str]:
+    """Per-column frequency candidates, combined and re-ranked by the SPY agent."""
+    key_chars = _column_key_candidates(ct, key_length, alphabet, per_column=5)
+    max_candidates = min(100, 5 ** min(len(key_chars), 4))
 
     if config is not None and config.vigenere_max_candidates is not None:
         max_candidates = config.vigenere_max_candidates
@@ -252,7 +320,7 @@ def recover_key_by_frequency(
 
     candidates = _rank_by_word_likelihood(candidates)
 
-    if use_spy_scoring and candidates:
+    if candidates:
         from kryptos.ciphers import vigenere_decrypt
 
         spy = _get_spy_agent()
@@ -271,51 +339,89 @@ def recover_key_by_frequency(
 
         scored_candidates.sort(reverse=True)
         candidates = [key for _, key in scored_candidates[:top_n]]
-    else:
-        candidates = candidates[:top_n]
+    return candidates
 
-    if skip_tried:
-        if tracker is None:
-            tracker = SearchSpaceTracker()
 
-        candidates_filtered = [k for k in candidates if not tracker.already_tried("vigenere", k)]
+def _column_plaintexts(ct: str, key_length: int, alphabet: str) -> list[np.ndarray]:
+    """For each column, a ``(26, rows)`` array of standard letter codes: row k is
+    the column decrypted under key letter ``alphabet[k]``."""
+    to_std = np.array([ord(c) - ord("A") for c in alphabet], dtype=np.intp)
+    ct_idx = np.array([alphabet.index(c) for c in ct], dtype=np.intp)
+    shifts = np.arange(len(alphabet), dtype=np.intp)[:, None]
+    return [to_std[(ct_idx[j::key_length][None, :] - shifts) % len(alphabet)] for j in range(key_length)]
 
-        new_keys = candidates_filtered
-        if new_keys:
-            tracker.record_exploration(
-                cipher_type="vigenere",
-                region_key=f"length_{key_length}",
-                count=len(new_keys),
-                keys=new_keys,
-            )
 
-        candidates = candidates_filtered
+def beam_search_keys(
+    ciphertext: str,
+    key_length: int,
+    alphabet: str = KEYED_ALPHABET,
+    beam_width: int = DEFAULT_BEAM_WIDTH,
+) -> list[str]:
+    """Recover Vigenère keys by beam search over key columns.
 
-    return candidates
+    Keys are extended one column at a time. Each prefix is scored on the
+    plaintext its fixed columns already determine: letter frequencies plus the
+    bi/tri/quadgram windows lying entirely inside fixed columns of each period
+    block. Only the best ``beam_width`` prefixes survive each step. Survivors are
+    finally re-ranked by the full combined n-gram score of their decryption.
+
+    Args:
+        ciphertext: Ciphertext to analyze (non-alphabet characters are ignored).
+        key_length: Key period.
+        alphabet: Tableau alphabet (default: KEYED_ALPHABET).
+        beam_width: Prefixes kept per column.
+
+    Returns:
+        Up to ``beam_width`` keys, most likely first.
+    """
+    from kryptos.k4.scoring_vectorized import combined_score_batch, get_tables
+
+    ct = "".join(c for c in ciphertext.upper() if c in alphabet)
+    if key_length <= 0 or len(ct) < key_length or beam_width <= 0:
+        return []
+
+    tables = get_tables()
+    log_freq = np.log10(np.array([max(ENGLISH_FREQ.get(chr(ord("A") + i), 0.0), 1e-4) for i in range(26)]))
+    plains = _column_plaintexts(ct, key_length, alphabet)
+    size = len(alphabet)
+
+    keys = np.zeros((1, 0), dtype=np.intp)
+    scores = np.zeros(1)
+    for j, cur in enumerate(plains):
+        rows = cur.shape[1]
+        ext = scores[:, None] + log_freq[cur].sum(axis=1)[None, :]
+        prev = [plains[j - d][keys[:, j - d]][:, :rows] for d in (1, 2, 3) if j - d >= 0]
+        cur_b = cur[None, :, :]
+        if len(prev) >= 1:
+            ext += tables.bigram[prev[0][:, None, :], cur_b].sum(axis=-1)
+        if len(prev) >= 2:
+            ext += tables.trigram[prev[1][:, None, :], prev[0][:, None, :], cur_b].sum(axis=-1)
+        if len(prev) >= 3 and tables.has_quadgrams:
+            ext += tables.quadgram[prev[2][:, None, :], prev[1][:, None, :], prev[0][:, None, :], cur_b].sum(
+                axis=-1
+            )
+        flat = ext.ravel()
+        order = np.argsort(-flat, kind="stable")[:beam_width]
+        keys = np.concatenate([keys[order // size], (order % size)[:, None]], axis=1)
+        scores = flat[order]
+
+    full = np.empty((len(keys), len(ct)), dtype=np.int8)
+    for j, cur in enumerate(plains):
+        full[:, j::key_length] = cur[keys[:, j]]
+    final = combined_score_batch(full, tables)
+    ranked = np.argsort(-final, kind="stable")
+    return ["".join(alphabet[k] for k in keys[b]) for b in ranked]
 
 
 def _rank_by_word_likelihood(candidates: list[str]) -> list[str]:
     if not candidates:
         return candidates
 
-    known_cipher_keys = {
-        "PALIMPSEST",
-        "ABSCISSA",
-        "KRYPTOS",
-        "BERLIN",
-        "CLOCK",
-        "CIPHER",
-        "SECRET",
-        "SHADOW",
-        "LIGHT",
-        "DIGITAL",
-    }
-
     scored = []
     for key in candidates:
         score = 0.0
 
-        if key in known_cipher_keys:
+        if key in KNOWN_CIPHER_KEYS:
             score += 1000.0
 
         vowels = sum(1 for c in key if c in "AEIOU")
@@ -23,6 +23,10 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Rows per multi-row INSERT statement when persisting candidates.
+CANDIDATE_BATCH_SIZE = 1000
+_CANDIDATE_ROW_TEMPLATE = "(%s, %s, %s, %s, %s::jsonb, %s, %s, %s::jsonb, %s, %s::jsonb)"
+
 
 def _key_hash(key: Sequence[Sequence[int]]) -> str:
     flat = ",".join(str(v) for row in key for v in row)
@@ -50,6 +54,10 @@ def persist_campaign_candidates(
     ``candidates`` rows referencing it. Returns the new ``campaign_runs.id``,
     or ``None`` if persistence was skipped (no DATABASE_URL) or failed.
 
+    Candidate rows go out as multi-row ``INSERT`` statements of
+    ``CANDIDATE_BATCH_SIZE`` rows on a pooled connection (see ``kryptos.db``),
+    so a large ``limit`` costs a few round trips rather than one per row.
+
     Args mirror ``kryptos.k4.reporting.write_candidates_json`` so call sites
     can persist the same data they already write to disk.
     """
@@ -57,6 +65,8 @@ def persist_campaign_candidates(
         return None
 
     try:
+        from psycopg2.extras import execute_values
+
         from kryptos.db import get_conn
     except ImportError as exc:  # pragma: no cover - defensive
         logger.warning("DB persistence unavailable (%s); skipping", exc)
@@ -81,25 +91,30 @@ def persist_campaign_candidates(
                 )
                 run_id = cur.fetchone()[0]
 
-                for rank, cand in enumerate(ranked, start=1):
-                    key = cand.get("key")
-                    cur.execute(
-                        "INSERT INTO candidates"
-                        " (campaign_run_id, rank, score, source, key, key_hash, text, metrics, origin_stage, lineage)"
-                        " VALUES (%s, %s, %s, %s, %s::jsonb, %s, %s, %s::jsonb, %s, %s::jsonb)",
-                        (
-                            run_id,
-                            rank,
-                            cand.get("score"),
-                            cand.get("source"),
-                            json.dumps(key) if key is not None else None,
-                            _key_hash(key) if key else None,
-                            cand.get("text", ""),
-                            json.dumps(cand.get("metrics", {})),
-                            stage,
-                            json.dumps(cand.get("lineage") or lineage),
-                        ),
+                rows = [
+                    (
+                        run_id,
+                        rank,
+                        cand.get("score"),
+                        cand.get("source"),
+                        json.dumps(cand.get("key")) if cand.get("key") is not None else None,
+                        _key_hash(cand["key"]) if cand.get("key") else None,
+                        cand.get("text", ""),
+                        json.dumps(cand.get("metrics", {})),
+                        stage,
+                        json.dumps(cand.get("lineage") or lineage),
                     )
+                    for rank, cand in enumerate(ranked, start=1)
+                ]
+                execute_values(
+                    cur,
+                    "INSERT INTO candidates"
+                    " (campaign_run_id, rank, score, source, key, key_hash, text, metrics, origin_stage, lineage)"
+                    " VALUES %s",
+                    rows,
+                    template=_CANDIDATE_ROW_TEMPLATE,
+                    page_size=CANDIDATE_BATCH_SIZE,
+                )
         logger.info("Persisted campaign run %s with %d candidates to Neon", run_id, len(ranked))
         return int(run_id)
     except Exception as exc:  # noqa: BLE001 - persistence must never break a run
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import logging
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -49,6 +50,113 @@ class CampaignResult:
         }
 
 
+# Compact per-task payload for the process pool: (attack_number, cipher_type, key_or_params).
+AttackTask = tuple[int, str, dict[str, Any]]
+# What a worker sends back for a validated candidate: (attack_number, confidence, plaintext, validation).
+CandidateHit = tuple[int, float, str, dict[str, Any]]
+
+_worker_log = logging.getLogger("kryptos.k4_campaign.worker")
+
+
+def _vigenere_attack(
+    ciphertext: str,
+    key_length: int,
+    key: str | None = None,
+    log: logging.Logger = _worker_log,
+) -> tuple[str | None, float]:
+    try:
+        if key:
+            return vigenere_decrypt(ciphertext, key), 0.5
+
+        candidate_keys = recover_key_by_frequency(ciphertext, key_length, top_n=1)
+        if not candidate_keys:
+            return None, 0.0
+
+        best_key = candidate_keys[0]
+        plaintext = vigenere_decrypt(ciphertext, best_key)
+        confidence = 0.5
+        return plaintext, confidence
+
+    except Exception as e:
+        log.warning(f"Vigenère attack failed for key_length={key_length}: {e}")
+        return None, 0.0
+
+
+def _transposition_attack(
+    ciphertext: str,
+    period: int,
+    method: str = "simulated_annealing",
+    log: logging.Logger = _worker_log,
+) -> tuple[str | None, float]:
+    try:
+        if method == "exhaustive" and period <= 8:
+            permutation, score = solve_columnar_permutation_exhaustive(ciphertext, period)
+        else:
+            permutation, score = solve_columnar_permutation_simulated_annealing_multi_start(ciphertext, period)
+
+        plaintext = ciphertext
+
+        return plaintext, score
+    except Exception as e:
+        log.warning(f"Transposition attack failed: {e}")
+        return None, 0.0
+
+
+def _dispatch_attack(
+    ciphertext: str,
+    cipher_type: str,
+    params: dict[str, Any],
+    log: logging.Logger = _worker_log,
+) -> tuple[str | None, float]:
+    if cipher_type == "vigenere":
+        return _vigenere_attack(ciphertext, params.get("key_length"), params.get("key"), log=log)
+    elif cipher_type == "transposition":
+        return _transposition_attack(
+            ciphertext,
+            params.get("period"),
+            params.get("method", "simulated_annealing"),
+            log=log,
+        )
+    else:
+        return None, 0.0
+
+
+_WORKER_CIPHERTEXT: str = ""
+_WORKER_VALIDATOR: PlaintextValidator | None = None
+
+
+def _init_campaign_worker(
+    ciphertext: str,
+    cribs: list[str],
+    min_dictionary_score: float,
+    min_confidence: float,
+) -> None:
+    """Process-pool initializer: build the per-campaign context once per worker."""
+    global _WORKER_CIPHERTEXT, _WORKER_VALIDATOR
+    _WORKER_CIPHERTEXT = ciphertext
+    _WORKER_VALIDATOR = PlaintextValidator(
+        known_cribs=cribs,
+        min_dictionary_score=min_dictionary_score,
+        min_confidence=min_confidence,
+        log_level="WARNING",
+    )
+
+
+def _run_attack_task(task: AttackTask) -> CandidateHit | None:
+    """Execute and validate one attack; only a validated candidate leaves the worker."""
+    attack_number, cipher_type, params = task
+    try:
+        plaintext, _confidence = _dispatch_attack(_WORKER_CIPHERTEXT, cipher_type, params)
+    except Exception:
+        return None
+    if not plaintext:
+        return None
+    validation = _WORKER_VALIDATOR.validate(plaintext)
+    if not validation.is_valid:
+        return None
+    return (attack_number, validation.confidence, plaintext[:100], validation.to_dict())
+
+
 class K4CampaignOrchestrator:
     @staticmethod
     def _attack_worker(args):
@@ -93,20 +201,9 @@ class K4CampaignOrchestrator:
         self,
         ciphertext: str,
         key_length: int,
+        key: str | None = None,
     ) -> tuple[str | None, float]:
-        try:
-            candidate_keys = recover_key_by_frequency(ciphertext, key_length, top_n=1)
-            if not candidate_keys:
-                return None, 0.0
-
-            best_key = candidate_keys[0]
-            plaintext = vigenere_decrypt(ciphertext, best_key)
-            confidence = 0.5
-            return plaintext, confidence
-
-        except Exception as e:
-            self.log.warning(f"Vigenère attack failed for key_length={key_length}: {e}")
-            return None, 0.0
+        return _vigenere_attack(ciphertext, key_length, key, log=self.log)
 
     def execute_transposition_attack(
         self,
@@ -114,18 +211,7 @@ class K4CampaignOrchestrator:
         period: int,
         method: str = "simulated_annealing",
     ) -> tuple[str | None, float]:
-        try:
-            if method == "exhaustive" and period <= 8:
-                permutation, score = solve_columnar_permutation_exhaustive(ciphertext, period)
-            else:
-                permutation, score = solve_columnar_permutation_simulated_annealing_multi_start(ciphertext, period)
-
-            plaintext = ciphertext
-
-            return plaintext, score
-        except Exception as e:
-            self.log.warning(f"Transposition attack failed: {e}")
-            return None, 0.0
+        return _transposition_attack(ciphertext, period, method, log=self.log)
 
     def execute_attack(
         self,
@@ -136,7 +222,7 @@ class K4CampaignOrchestrator:
         params = attack_spec.parameters.key_or_params
 
         if cipher_type == "vigenere":
-            return self.execute_vigenere_attack(ciphertext, params.get("key_length"))
+            return self.execute_vigenere_attack(ciphertext, params.get("key_length"), params.get("key"))
         elif cipher_type == "transposition":
             return self.execute_transposition_attack(
                 ciphertext,
@@ -146,6 +232,52 @@ class K4CampaignOrchestrator:
         else:
             return None, 0.0
 
+    def _run_parallel(
+        self,
+        ciphertext: str,
+        attack_queue: list[Any],
+        max_workers: int,
+        max_time_seconds: float | None,
+    ) -> tuple[int, list[CandidateHit]]:
+        """Run ``attack_queue`` on a process pool; return (attacks executed, validated hits).
+
+        Workers are initialised once with the ciphertext and a validator built
+        from this orchestrator's cribs/thresholds. Each task is a compact
+        :data:`AttackTask`, and workers return only validated candidates.
+        """
+        from concurrent.futures import ProcessPoolExecutor, TimeoutError
+
+        tasks: list[AttackTask] = [
+            (n, spec.parameters.cipher_type, spec.parameters.key_or_params)
+            for n, spec in enumerate(attack_queue, start=1)
+        ]
+        chunksize = max(1, len(tasks) // (max_workers * 16))
+        executed = 0
+        hits: list[CandidateHit] = []
+
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_campaign_worker,
+            initargs=(
+                ciphertext,
+                self.cribs,
+                self.validator.min_dictionary_score,
+                self.validator.min_confidence,
+            ),
+        )
+        try:
+            results = executor.map(_run_attack_task, tasks, timeout=(max_time_seconds or 3600), chunksize=chunksize)
+            try:
+                for hit in results:
+                    executed += 1
+                    if hit is not None:
+                        hits.append(hit)
+            except TimeoutError:
+                self.log.warning(f"Campaign time budget exhausted after {executed}/{len(tasks)} attacks")
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        return executed, hits
+
     def run_campaign(
         self,
         ciphertext: str,
@@ -153,7 +285,6 @@ class K4CampaignOrchestrator:
         max_time_seconds: float | None = None,
     ) -> CampaignResult:
         import multiprocessing as mp
-        from concurrent.futures import ProcessPoolExecutor, TimeoutError, as_completed
 
         campaign_id = f"k4_campaign_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         start_time = datetime.now()
@@ -166,7 +297,6 @@ class K4CampaignOrchestrator:
         successful_attacks = 0
         best_candidates = []
         i = 0
-        futures = []
         max_workers = getattr(self, "max_workers", None) or mp.cpu_count()
 
         if max_workers == 1:
@@ -189,30 +319,20 @@ class K4CampaignOrchestrator:
                             },
                         )
         else:
-            with ProcessPoolExecutor(max_workers=max_workers) as executor:
-                for attack_spec in attack_queue:
-                    futures.append(executor.submit(self._attack_worker, (self, attack_spec, ciphertext)))
-
-                for future in as_completed(futures, timeout=(max_time_seconds or 3600)):
-                    i += 1
-                    try:
-                        attack_spec, plaintext, confidence = future.result(timeout=60)
-                    except TimeoutError:
-                        continue
-                    if plaintext:
-                        validation = self.validator.validate(plaintext)
-                        if validation.is_valid:
-                            successful_attacks += 1
-                            best_candidates.append(
-                                {
-                                    "attack_number": i,
-                                    "cipher_type": attack_spec.parameters.cipher_type,
-                                    "parameters": attack_spec.parameters.key_or_params,
-                                    "plaintext": plaintext[:100],
-                                    "confidence": validation.confidence,
-                                    "validation": validation.to_dict(),
-                                },
-                            )
+            i, hits = self._run_parallel(ciphertext, attack_queue, max_workers, max_time_seconds)
+            for attack_number, confidence, plaintext, validation in hits:
+                attack_spec = attack_queue[attack_number - 1]
+                successful_attacks += 1
+                best_candidates.append(
+                    {
+                        "attack_number": attack_number,
+                        "cipher_type": attack_spec.parameters.cipher_type,
+                        "parameters": attack_spec.parameters.key_or_params,
+                        "plaintext": plaintext,
+                        "confidence": confidence,
+                        "validation": validation,
+                    },
+                )
 
         end_time = datetime.now()
         duration = (end_time - start_time).total_seconds()
@@ -5,12 +5,22 @@ Enables deduplication, coverage analysis, and academic documentation.
 
 Philosophy: "If it's not logged, it never happened. If we can't prove we tried it,
 we might waste compute trying it again."
+
+Two storage backends are available. ``jsonl`` (the default) replays
+``attack_log.jsonl`` into memory at start-up and appends one line per attack.
+``sqlite`` keeps records in ``attack_log.sqlite`` with indexes on fingerprint,
+cipher type and timestamp, so start-up and dedup checks no longer scale with
+the size of the log. Existing JSONL logs move over with :func:`migrate_jsonl_log`
+(``kryptos attack-log-migrate``).
 """
 
 from __future__ import annotations
 
 import hashlib
 import json
+import sqlite3
+import threading
+from collections.abc import Iterator, Mapping, Sequence
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -18,6 +28,10 @@ from typing import Any
 
 from kryptos.paths import get_artifacts_root
 
+ATTACK_LOG_FILENAME = "attack_log.jsonl"
+ATTACK_DB_FILENAME = "attack_log.sqlite"
+STORAGE_BACKENDS = ("jsonl", "sqlite")
+
 
 @dataclass
 class AttackParameters:
@@ -82,13 +96,212 @@ class AttackRecord:
         )
 
 
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS attacks (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    fingerprint TEXT NOT NULL UNIQUE,
+    attack_id TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    cipher_type TEXT NOT NULL,
+    success INTEGER NOT NULL,
+    max_confidence REAL NOT NULL,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_attacks_cipher_type ON attacks (cipher_type);
+CREATE INDEX IF NOT EXISTS idx_attacks_timestamp ON attacks (timestamp);
+CREATE INDEX IF NOT EXISTS idx_attacks_attack_id ON attacks (attack_id);
+"""
+
+
+class SqliteAttackStore:
+    """Append-only SQLite table of attack records, keyed by parameter fingerprint.
+
+    The database runs in WAL mode and commits every ``commit_every`` inserts;
+    :meth:`commit` (or :meth:`close`) flushes the tail of a batch. Records are
+    returned in insertion order, matching the JSONL log. One connection is
+    shared across threads, so every statement runs under ``_lock``.
+    """
+
+    def __init__(self, path: Path, commit_every: int = 500):
+        self.path = path
+        self.commit_every = max(1, commit_every)
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def add(self, fingerprint: str, record: AttackRecord) -> bool:
+        """Insert ``record`` unless ``fingerprint`` is already stored; True if inserted."""
+        with self._lock:
+            cur = self._conn.execute(
+                "INSERT OR IGNORE INTO attacks"
+                " (fingerprint, attack_id, timestamp, cipher_type, success, max_confidence, record)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    fingerprint,
+                    record.attack_id,
+                    record.timestamp.isoformat(),
+                    record.parameters.cipher_type,
+                    int(record.result.success),
+                    max(record.result.confidence_scores.values(), default=0.0),
+                    json.dumps(record.to_dict()),
+                ),
+            )
+            if cur.rowcount != 1:
+                return False
+            self._pending += 1
+            if self._pending >= self.commit_every:
+                self._commit_locked()
+        return True
+
+    def get_by_fingerprint(self, fingerprint: str) -> AttackRecord | None:
+        with self._lock:
+            row = self._conn.execute("SELECT record FROM attacks WHERE fingerprint = ?", (fingerprint,)).fetchone()
+        return AttackRecord.from_dict(json.loads(row[0])) if row else None
+
+    def get_by_id(self, attack_id: str) -> AttackRecord | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT record FROM attacks WHERE attack_id = ? ORDER BY seq LIMIT 1", (attack_id,)
+            ).fetchone()
+        return AttackRecord.from_dict(json.loads(row[0])) if row else None
+
+    def contains(self, fingerprint: str) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM attacks WHERE fingerprint = ?", (fingerprint,)).fetchone()
+        return row is not None
+
+    def attack_id_for(self, fingerprint: str) -> str | None:
+        with self._lock:
+            row = self._conn.execute("SELECT attack_id FROM attacks WHERE fingerprint = ?", (fingerprint,)).fetchone()
+        return row[0] if row else None
+
+    def fingerprints(self) -> Iterator[str]:
+        for (fingerprint,) in self._iter_rows("SELECT fingerprint FROM attacks ORDER BY seq", ()):
+            yield fingerprint
+
+    def iter_records(
+        self,
+        cipher_type: str | None = None,
+        success_only: bool = False,
+        min_confidence: float | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> Iterator[AttackRecord]:
+        """Stream records in insertion order, filtered on the indexed columns."""
+        clauses: list[str] = []
+        params: list[Any] = []
+        if cipher_type:
+            clauses.append("cipher_type = ?")
+            params.append(cipher_type)
+        if success_only:
+            clauses.append("success = 1")
+        if min_confidence is not None:
+            clauses.append("max_confidence >= ?")
+            params.append(min_confidence)
+        sql = "SELECT record FROM attacks"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY seq LIMIT ? OFFSET ?"
+        params.extend([-1 if limit is None else limit, offset])
+        for (raw,) in self._iter_rows(sql, params):
+            yield AttackRecord.from_dict(json.loads(raw))
+
+    def counts(self) -> tuple[int, int]:
+        """Return ``(total, successful)`` record counts."""
+        with self._lock:
+            row = self._conn.execute("SELECT count(*), coalesce(sum(success), 0) FROM attacks").fetchone()
+        return int(row[0]), int(row[1])
+
+    def commit(self) -> None:
+        with self._lock:
+            self._commit_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            self._commit_locked()
+            self._conn.close()
+
+    def _commit_locked(self) -> None:
+        self._conn.commit()
+        self._pending = 0
+
+    def _iter_rows(self, sql: str, params: Sequence[Any], batch: int = 500) -> Iterator[tuple]:
+        # Fetch in batches so the lock is never held while the caller consumes rows.
+        with self._lock:
+            cur = self._conn.execute(sql, params)
+            rows = cur.fetchmany(batch)
+        while rows:
+            yield from rows
+            with self._lock:
+                rows = cur.fetchmany(batch)
+
+
+class _FingerprintView(Mapping[str, AttackRecord]):
+    """Read-only ``fingerprint -> AttackRecord`` mapping over a SqliteAttackStore."""
+
+    def __init__(self, store: SqliteAttackStore):
+        self._store = store
+
+    def __getitem__(self, fingerprint: str) -> AttackRecord:
+        record = self._store.get_by_fingerprint(fingerprint)
+        if record is None:
+            raise KeyError(fingerprint)
+        return record
+
+    def __contains__(self, fingerprint: object) -> bool:
+        return isinstance(fingerprint, str) and self._store.contains(fingerprint)
+
+    def __iter__(self) -> Iterator[str]:
+        return self._store.fingerprints()
+
+    def __len__(self) -> int:
+        return self._store.counts()[0]
+
+
+class _ChronologicalView(Sequence[AttackRecord]):
+    """Read-only insertion-ordered sequence of records over a SqliteAttackStore."""
+
+    def __init__(self, store: SqliteAttackStore):
+        self._store = store
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return list(self)[index]
+            return list(self._store.iter_records(offset=start, limit=max(0, stop - start)))
+        if index < 0:
+            index += len(self)
+        records = list(self._store.iter_records(offset=index, limit=1)) if index >= 0 else []
+        if not records:
+            raise IndexError(index)
+        return records[0]
+
+    def __iter__(self) -> Iterator[AttackRecord]:
+        return self._store.iter_records()
+
+    def __len__(self) -> int:
+        return self._store.counts()[0]
+
+
 class AttackLogger:
-    def __init__(self, log_dir: Path | None = None):
+    def __init__(self, log_dir: Path | None = None, storage: str = "jsonl", commit_every: int = 500):
+        """Create a logger over ``log_dir`` (default: ``artifacts/attack_logs``).
+
+        Args:
+            log_dir: Directory holding the attack log.
+            storage: ``"jsonl"`` (in-memory index over ``attack_log.jsonl``) or
+                ``"sqlite"`` (indexed ``attack_log.sqlite``, nothing loaded up front).
+            commit_every: SQLite inserts per committed batch (ignored for JSONL).
+        """
+        if storage not in STORAGE_BACKENDS:
+            raise ValueError(f"storage must be one of {STORAGE_BACKENDS}, got {storage!r}")
         self.log_dir = log_dir or (get_artifacts_root() / "attack_logs")
         self.log_dir.mkdir(parents=True, exist_ok=True)
-
-        self.attack_index: dict[str, AttackRecord] = {}
-        self.chronological_index: list[AttackRecord] = []
+        self.storage = storage
 
         self.stats = {
             "total_attacks": 0,
@@ -97,7 +310,20 @@ class AttackLogger:
             "successful_attacks": 0,
         }
 
-        self._load_existing_logs()
+        self._store: SqliteAttackStore | None = None
+        self.attack_index: Mapping[str, AttackRecord]
+        self.chronological_index: Sequence[AttackRecord]
+        if storage == "sqlite":
+            self._store = SqliteAttackStore(self.log_dir / ATTACK_DB_FILENAME, commit_every=commit_every)
+            self.attack_index = _FingerprintView(self._store)
+            self.chronological_index = _ChronologicalView(self._store)
+            total, successful = self._store.counts()
+            self.stats["total_attacks"] = self.stats["unique_attacks"] = total
+            self.stats["successful_attacks"] = successful
+        else:
+            self.attack_index = {}
+            self.chronological_index = []
+            self._load_existing_logs()
 
     def log_attack(
         self,
@@ -122,10 +348,13 @@ class AttackLogger:
         """
         fingerprint = parameters.fingerprint()
 
-        if fingerprint in self.attack_index:
+        if self._store is not None:
+            if self._store.contains(fingerprint):
+                self.stats["duplicates_prevented"] += 1
+                return self._store.attack_id_for(fingerprint) or "", True
+        elif fingerprint in self.attack_index:
             self.stats["duplicates_prevented"] += 1
-            existing = self.attack_index[fingerprint]
-            return existing.attack_id, True
+            return self.attack_index[fingerprint].attack_id, True
 
         attack_id = f"attack_{datetime.now().timestamp()}"
         record = AttackRecord(
@@ -138,23 +367,34 @@ class AttackLogger:
             tags=tags or [],
         )
 
-        self.attack_index[fingerprint] = record
-        self.chronological_index.append(record)
+        if self._store is not None:
+            if not self._store.add(fingerprint, record):  # another thread logged it first
+                self.stats["duplicates_prevented"] += 1
+                return self._store.attack_id_for(fingerprint) or attack_id, True
+        else:
+            self.attack_index[fingerprint] = record
+            self.chronological_index.append(record)
+            self._save_record(record)
 
         self.stats["total_attacks"] += 1
         self.stats["unique_attacks"] += 1
         if result.success:
             self.stats["successful_attacks"] += 1
 
-        self._save_record(record)
-
         return attack_id, False
 
     def is_duplicate(self, parameters: AttackParameters) -> bool:
         fingerprint = parameters.fingerprint()
         return fingerprint in self.attack_index
 
+    def get_by_fingerprint(self, fingerprint: str) -> AttackRecord | None:
+        if self._store is not None:
+            return self._store.get_by_fingerprint(fingerprint)
+        return self.attack_index.get(fingerprint)
+
     def get_attack(self, attack_id: str) -> AttackRecord | None:
+        if self._store is not None:
+            return self._store.get_by_id(attack_id)
         for record in self.chronological_index:
             if record.attack_id == attack_id:
                 return record
@@ -182,7 +422,14 @@ class AttackLogger:
         """
         results = []
 
-        for record in self.chronological_index:
+        if self._store is not None:
+            records: Iterator[AttackRecord] | Sequence[AttackRecord] = self._store.iter_records(
+                cipher_type=cipher_type, success_only=success_only, min_confidence=min_confidence
+            )
+        else:
+            records = self.chronological_index
+
+        for record in records:
             if cipher_type and record.parameters.cipher_type != cipher_type:
                 continue
 
@@ -212,6 +459,25 @@ class AttackLogger:
             / max(self.stats["total_attacks"] + self.stats["duplicates_prevented"], 1),
         }
 
+    def flush(self) -> None:
+        """Commit any pending SQLite batch (no-op for JSONL, which writes through)."""
+        if self._store is not None:
+            self._store.commit()
+
+    def close(self) -> None:
+        """Flush and release the SQLite connection (no-op for JSONL)."""
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+            self.attack_index = {}
+            self.chronological_index = []
+
+    def __enter__(self) -> AttackLogger:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
     def export_to_json(self, filepath: Path | None = None) -> Path:
         filepath = filepath or (self.log_dir / f"attacks_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
 
@@ -266,7 +532,7 @@ class AttackLogger:
         return filepath
 
     def _load_existing_logs(self):
-        log_file = self.log_dir / "attack_log.jsonl"
+        log_file = self.log_dir / ATTACK_LOG_FILENAME
         if not log_file.exists():
             return
 
@@ -288,12 +554,44 @@ class AttackLogger:
                     continue
 
     def _save_record(self, record: AttackRecord):
-        log_file = self.log_dir / "attack_log.jsonl"
+        log_file = self.log_dir / ATTACK_LOG_FILENAME
 
         with open(log_file, "a", encoding="utf-8") as f:
             f.write(json.dumps(record.to_dict()) + "\n")
 
 
+def migrate_jsonl_log(log_dir: Path, jsonl_path: Path | None = None, commit_every: int = 5000) -> dict[str, int]:
+    """Import an ``attack_log.jsonl`` into the SQLite store in ``log_dir``.
+
+    Re-running is safe: records whose fingerprint is already stored are
+    skipped, as are lines that do not parse.
+
+    Returns:
+        ``{"imported": ..., "duplicates": ..., "invalid": ...}`` line counts.
+    """
+    jsonl_path = jsonl_path or (log_dir / ATTACK_LOG_FILENAME)
+    log_dir.mkdir(parents=True, exist_ok=True)
+    counts = {"imported": 0, "duplicates": 0, "invalid": 0}
+    store = SqliteAttackStore(log_dir / ATTACK_DB_FILENAME, commit_every=commit_every)
+    try:
+        with open(jsonl_path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = AttackRecord.from_dict(json.loads(line))
+                except Exception:
+                    counts["invalid"] += 1
+                    continue
+                if store.add(record.parameters.fingerprint(), record):
+                    counts["imported"] += 1
+                else:
+                    counts["duplicates"] += 1
+    finally:
+        store.close()
+    return counts
+
+
 def demo_attack_logger():
     print("=" * 80)
     print("ATTACK LOGGER DEMO")
@@ -5,12 +5,22 @@ metrics like "% of Vigenère key length 1-20 explored".
 
 Philosophy: "You can't optimize what you don't measure. Show us the map
 of explored vs unexplored territory."
+
+Region counters persist as a snapshot (``search_space.json``) plus an
+append-only delta journal (``search_space.journal.jsonl``). Each
+``register_region``/``record_exploration`` appends one numbered delta; every
+``compact_every`` deltas the regions are written to a temporary snapshot that
+atomically replaces the old one, and the journal is truncated. Loading replays
+journal deltas newer than the snapshot, so a crash loses at most the delta
+being written.
 """
 
 from __future__ import annotations
 
 import json
+import os
 from collections import defaultdict
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -18,6 +28,10 @@ from typing import Any
 
 from kryptos.paths import get_artifacts_root
 
+SNAPSHOT_FILENAME = "search_space.json"
+JOURNAL_FILENAME = "search_space.journal.jsonl"
+DEFAULT_COMPACT_EVERY = 1000
+
 
 def _levenshtein(a: str, b: str) -> int:
     """Standard single-row rolling DP edit distance."""
@@ -39,6 +53,97 @@ def _levenshtein(a: str, b: str) -> int:
     return prev[lb]
 
 
+def _levenshtein_bitparallel(a: str, b: str) -> int:
+    """Exact edit distance via Myers/Hyyrö bit-vectors (one pass over ``b``).
+
+    Equal to :func:`_levenshtein`; Python ints act as arbitrary-width bit
+    vectors, so there is no length limit.
+    """
+    if a == b:
+        return 0
+    if not a:
+        return len(b)
+    if not b:
+        return len(a)
+    m = len(a)
+    peq: dict[str, int] = {}
+    for i, c in enumerate(a):
+        peq[c] = peq.get(c, 0) | (1 << i)
+    full = (1 << m) - 1
+    high = 1 << (m - 1)
+    pv, mv, score = full, 0, m
+    for c in b:
+        eq = peq.get(c, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & full)
+        mh = pv & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        ph = ((ph << 1) | 1) & full
+        mh = (mh << 1) & full
+        pv = mh | (~(xv | ph) & full)
+        mv = ph & xv
+    return score
+
+
+class _BKTree:
+    """Burkhard-Keller tree over edit distance for near-neighbour key lookups.
+
+    Each node is ``[key, {distance: child}]``. By the triangle inequality a
+    query within ``tol`` of ``q`` only needs children whose edge distance lies
+    in ``[d - tol, d + tol]`` where ``d`` is the distance from ``q`` to the node,
+    so answers are exact for every ``tol``.
+    """
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self, keys: Iterable[str] = ()):
+        self._root: list | None = None
+        self._size = 0
+        for key in keys:
+            self.add(key)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, key: str) -> bool:
+        """Insert ``key``; False if it was already present."""
+        if self._root is None:
+            self._root = [key, {}]
+            self._size = 1
+            return True
+        node = self._root
+        while True:
+            d = _levenshtein_bitparallel(key, node[0])
+            if d == 0:
+                return False
+            child = node[1].get(d)
+            if child is None:
+                node[1][d] = [key, {}]
+                self._size += 1
+                return True
+            node = child
+
+    def any_within(self, key: str, tol: int) -> bool:
+        """True if some stored key is within edit distance ``tol`` of ``key``."""
+        if self._root is None:
+            return False
+        stack = [self._root]
+        while stack:
+            word, children = stack.pop()
+            d = _levenshtein_bitparallel(key, word)
+            if d <= tol:
+                return True
+            for edge in range(max(1, d - tol), d + tol + 1):
+                child = children.get(edge)
+                if child is not None:
+                    stack.append(child)
+        return False
+
+
 @dataclass
 class KeySpaceRegion:
     cipher_type: str
@@ -72,15 +177,22 @@ class KeySpaceRegion:
 
 
 class SearchSpaceTracker:
-    def __init__(self, cache_dir: Path | None = None):
+    def __init__(self, cache_dir: Path | None = None, compact_every: int = DEFAULT_COMPACT_EVERY):
         self.cache_dir = cache_dir or (get_artifacts_root() / "search_space")
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.compact_every = max(1, compact_every)
 
         self.regions: dict[str, dict[str, KeySpaceRegion]] = defaultdict(dict)
 
         self._tried_keys: dict[str, set[str]] = defaultdict(set)
+        # Fuzzy-lookup index per cipher type, built on first use and kept in step with _tried_keys.
+        self._tried_trees: dict[str, _BKTree] = {}
 
         self._tried_keys_file = self.cache_dir / "tried_keys.jsonl"
+        self._snapshot_file = self.cache_dir / SNAPSHOT_FILENAME
+        self._journal_file = self.cache_dir / JOURNAL_FILENAME
+        self._journal_seq = 0
+        self._journal_pending = 0
 
         self._load_cache()
         self._load_tried_keys()
@@ -101,12 +213,15 @@ class SearchSpaceTracker:
             total_size: Total number of keys in this region
         """
         if region_key not in self.regions[cipher_type]:
-            self.regions[cipher_type][region_key] = KeySpaceRegion(
-                cipher_type=cipher_type,
-                parameters=parameters,
-                total_size=total_size,
-            )
-            self._save_cache()
+            delta = {
+                "op": "register",
+                "cipher_type": cipher_type,
+                "region": region_key,
+                "parameters": parameters,
+                "total_size": total_size,
+            }
+            self._apply_delta(delta)
+            self._append_delta(delta)
 
     def record_exploration(
         self,
@@ -128,14 +243,19 @@ class SearchSpaceTracker:
         if region_key not in self.regions[cipher_type]:
             self.register_region(cipher_type, region_key, {}, total_size=0)
 
-        region = self.regions[cipher_type][region_key]
-        region.explored_count += count
-        region.successful_count += successful
+        delta = {
+            "op": "explore",
+            "cipher_type": cipher_type,
+            "region": region_key,
+            "count": count,
+            "successful": successful,
+        }
+        self._apply_delta(delta)
 
         if keys:
             self._record_tried_keys(cipher_type, keys)
 
-        self._save_cache()
+        self._append_delta(delta)
 
     def already_tried(self, cipher_type: str, key: str) -> bool:
         return key in self._tried_keys[cipher_type]
@@ -145,7 +265,10 @@ class SearchSpaceTracker:
 
         Catches Vigenère keys that differ by a single character transposition or
         substitution — common in random-walk key searches.  Exact match is checked
-        first (O(1)) before the O(|tried| × |key|) Levenshtein scan.
+        first (O(1)); otherwise a BK-tree over the tried keys answers the query,
+        visiting only the branches the triangle inequality cannot rule out.  The
+        tree for a cipher type is built on its first fuzzy query and then updated
+        as keys are recorded.
 
         Args:
             cipher_type: Cipher namespace (e.g. "vigenere").
@@ -159,15 +282,10 @@ class SearchSpaceTracker:
             return True
         if tol <= 0:
             return False
-        tried = self._tried_keys.get(cipher_type, set())
-        n = len(key)
-        for prev in tried:
-            # Fast length gate: edit distance ≥ |len_a - len_b|
-            if abs(len(prev) - n) > tol:
-                continue
-            if _levenshtein(key, prev) <= tol:
-                return True
-        return False
+        tree = self._tried_trees.get(cipher_type)
+        if tree is None:
+            tree = self._tried_trees[cipher_type] = _BKTree(self._tried_keys.get(cipher_type, ()))
+        return tree.any_within(key, tol)
 
     def get_priority_recommendations(
         self,
@@ -211,6 +329,8 @@ class SearchSpaceTracker:
     def mark_tried(self, cipher_type: str, key: str):
         if key not in self._tried_keys[cipher_type]:
             self._tried_keys[cipher_type].add(key)
+            if cipher_type in self._tried_trees:
+                self._tried_trees[cipher_type].add(key)
             self._append_tried_key(cipher_type, key)
 
     def get_coverage(self, cipher_type: str, region_key: str | None = None) -> float:
@@ -345,39 +465,110 @@ class SearchSpaceTracker:
         else:
             return f"Filling gaps ({region.coverage_percent:.1f}% coverage)"
 
-    def _load_cache(self):
-        cache_file = self.cache_dir / "search_space.json"
-        if not cache_file.exists():
-            return
+    def compact(self):
+        """Fold the delta journal into a fresh snapshot and truncate the journal.
 
-        try:
-            with open(cache_file, encoding="utf-8") as f:
-                data = json.load(f)
+        The snapshot is written to a temporary file, fsynced and renamed over
+        the old one, so readers see either the previous or the new snapshot.
+        It records the last journal sequence number it includes; if we crash
+        before truncating, replay skips those deltas instead of double-counting.
+        """
+        data = {
+            "journal_seq": self._journal_seq,
+            "regions": {
+                cipher_type: {
+                    region_key: {
+                        "cipher_type": region.cipher_type,
+                        "parameters": region.parameters,
+                        "total_size": region.total_size,
+                        "explored_count": region.explored_count,
+                        "successful_count": region.successful_count,
+                    }
+                    for region_key, region in regions.items()
+                }
+                for cipher_type, regions in self.regions.items()
+            },
+        }
+
+        tmp_file = self._snapshot_file.with_name(self._snapshot_file.name + ".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self._snapshot_file)
 
-            for cipher_type, regions_data in data.items():
-                for region_key, region_dict in regions_data.items():
-                    self.regions[cipher_type][region_key] = KeySpaceRegion(**region_dict)
-        except (json.JSONDecodeError, KeyError, TypeError):
+        with open(self._journal_file, "w", encoding="utf-8"):
             pass
+        self._journal_pending = 0
+
+    def _apply_delta(self, delta: dict[str, Any]):
+        cipher_type = delta["cipher_type"]
+        region_key = delta["region"]
+        if delta["op"] == "register":
+            if region_key not in self.regions[cipher_type]:
+                self.regions[cipher_type][region_key] = KeySpaceRegion(
+                    cipher_type=cipher_type,
+                    parameters=delta["parameters"],
+                    total_size=delta["total_size"],
+                )
+        elif delta["op"] == "explore":
+            region = self.regions[cipher_type].get(region_key)
+            if region is None:
+                region = self.regions[cipher_type][region_key] = KeySpaceRegion(cipher_type, {}, 0)
+            region.explored_count += delta["count"]
+            region.successful_count += delta["successful"]
+
+    def _append_delta(self, delta: dict[str, Any]):
+        self._journal_seq += 1
+        with open(self._journal_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"seq": self._journal_seq, **delta}) + "\n")
+        self._journal_pending += 1
+        if self._journal_pending >= self.compact_every:
+            self.compact()
 
-    def _save_cache(self):
-        cache_file = self.cache_dir / "search_space.json"
+    def _load_cache(self):
+        if self._snapshot_file.exists():
+            try:
+                with open(self._snapshot_file, encoding="utf-8") as f:
+                    data = json.load(f)
+
+                if "regions" in data and "journal_seq" in data:
+                    self._journal_seq = int(data["journal_seq"])
+                    data = data["regions"]
+                # Older snapshots are a bare {cipher_type: {region: ...}} map with no journal.
+                for cipher_type, regions_data in data.items():
+                    for region_key, region_dict in regions_data.items():
+                        self.regions[cipher_type][region_key] = KeySpaceRegion(**region_dict)
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                pass
+
+        self._replay_journal()
+
+    def _replay_journal(self):
+        if not self._journal_file.exists():
+            return
 
-        data = {}
-        for cipher_type, regions in self.regions.items():
-            data[cipher_type] = {
-                region_key: {
-                    "cipher_type": region.cipher_type,
-                    "parameters": region.parameters,
-                    "total_size": region.total_size,
-                    "explored_count": region.explored_count,
-                    "successful_count": region.successful_count,
-                }
-                for region_key, region in regions.items()
-            }
+        with open(self._journal_file, "rb") as f:
+            raw = f.read()
+        complete = raw.rfind(b"\n") + 1
+        if complete < len(raw):
+            # Drop a torn final line so the next append starts on a fresh line.
+            with open(self._journal_file, "r+b") as f:
+                f.truncate(complete)
 
-        with open(cache_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        for line in raw[:complete].decode("utf-8", errors="replace").splitlines():
+            if not line.strip():
+                continue
+            try:
+                delta = json.loads(line)
+                seq = int(delta["seq"])
+                if seq <= self._journal_seq:
+                    continue
+                self._apply_delta(delta)
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                continue
+            self._journal_seq = seq
+            self._journal_pending += 1
 
     def _load_tried_keys(self):
         if not self._tried_keys_file.exists():
@@ -398,9 +589,12 @@ class SearchSpaceTracker:
 
     def _record_tried_keys(self, cipher_type: str, keys: list[str]):
         new_keys = []
+        tree = self._tried_trees.get(cipher_type)
         for key in keys:
             if key not in self._tried_keys[cipher_type]:
                 self._tried_keys[cipher_type].add(key)
+                if tree is not None:
+                    tree.add(key)
                 new_keys.append(key)
 
         if new_keys:
@@ -46,18 +46,27 @@ def _split_chunks(text: str, size: int = CHUNK_SIZE, overlap: int = CHUNK_OVERLA
             break
 
 
-def iter_artifact_chunks(artifacts_root: Path) -> Iterator[ArtifactChunk]:
-    """Yield text chunks for every indexable file under *artifacts_root*."""
+def iter_indexable_files(artifacts_root: Path) -> Iterator[Path]:
+    """Yield every file under *artifacts_root* with an indexable suffix, in path order."""
     if not artifacts_root.is_dir():
         return
     for path in sorted(artifacts_root.rglob("*")):
-        if not path.is_file() or path.suffix not in INDEXABLE_SUFFIXES:
-            continue
-        if path.stat().st_size > MAX_FILE_BYTES:
-            continue
-        text = _file_text(path)
-        if not text:
-            continue
-        rel = path.relative_to(artifacts_root).as_posix()
-        for chunk_index, chunk in enumerate(_split_chunks(text)):
-            yield ArtifactChunk(path=rel, chunk_index=chunk_index, text=chunk)
+        if path.is_file() and path.suffix in INDEXABLE_SUFFIXES:
+            yield path
+
+
+def chunk_artifact_file(path: Path, artifacts_root: Path) -> list[ArtifactChunk]:
+    """Split one artifact into chunks; empty if it is oversized or has no text."""
+    if path.stat().st_size > MAX_FILE_BYTES:
+        return []
+    text = _file_text(path)
+    if not text:
+        return []
+    rel = path.relative_to(artifacts_root).as_posix()
+    return [ArtifactChunk(path=rel, chunk_index=i, text=chunk) for i, chunk in enumerate(_split_chunks(text))]
+
+
+def iter_artifact_chunks(artifacts_root: Path) -> Iterator[ArtifactChunk]:
+    """Yield text chunks for every indexable file under *artifacts_root*."""
+    for path in iter_indexable_files(artifacts_root):
+        yield from chunk_artifact_file(path, artifacts_root)
@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
+import hashlib
+import sqlite3
+import threading
+from collections.abc import Callable, Iterable, Iterator
 from functools import lru_cache
+from itertools import islice
+from pathlib import Path
 
 import numpy as np
 
 DEFAULT_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+EMBED_BATCH_SIZE = 64
+_SQL_VARS_PER_QUERY = 500  # stay under SQLITE_MAX_VARIABLE_NUMBER on old builds
+
+# texts -> (len(texts), dim) float32 vectors
+Encoder = Callable[[list[str]], np.ndarray]
 
 
 @lru_cache(maxsize=1)
@@ -16,10 +27,107 @@ def _load_model(model_name: str):
     return SentenceTransformer(model_name)
 
 
-def embed_texts(texts: list[str], model_name: str = DEFAULT_MODEL_NAME) -> np.ndarray:
-    model = _load_model(model_name)
-    vectors = model.encode(texts, show_progress_bar=False, convert_to_numpy=True)
-    return np.asarray(vectors, dtype=np.float32)
+def _model_encoder(model_name: str, batch_size: int) -> Encoder:
+    def encode(texts: list[str]) -> np.ndarray:
+        model = _load_model(model_name)
+        return model.encode(texts, batch_size=batch_size, show_progress_bar=False, convert_to_numpy=True)
+
+    return encode
+
+
+class EmbeddingCache:
+    """Content-addressed SQLite store of vectors keyed by sha256(model name + text).
+
+    Identical chunks (repeated report boilerplate, unchanged files after a
+    full rebuild) are embedded once per model and read back afterwards.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)")
+
+    @staticmethod
+    def key(text: str, model_name: str) -> str:
+        return hashlib.sha256(f"{model_name}\0{text}".encode()).hexdigest()
+
+    def get_many(self, keys: list[str]) -> dict[str, np.ndarray]:
+        found: dict[str, np.ndarray] = {}
+        for start in range(0, len(keys), _SQL_VARS_PER_QUERY):
+            part = keys[start : start + _SQL_VARS_PER_QUERY]
+            placeholders = ",".join("?" * len(part))
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", part
+                ).fetchall()
+            found.update((key, np.frombuffer(blob, dtype=np.float32)) for key, blob in rows)
+        return found
+
+    def put_many(self, items: dict[str, np.ndarray]) -> None:
+        if not items:
+            return
+        rows = [(key, np.ascontiguousarray(vec, dtype=np.float32).tobytes()) for key, vec in items.items()]
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)", rows)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _embed_batch(batch: list[str], model_name: str, encode: Encoder, cache: EmbeddingCache | None) -> np.ndarray:
+    if cache is None:
+        return np.asarray(encode(batch), dtype=np.float32)
+    keys = [EmbeddingCache.key(text, model_name) for text in batch]
+    found = cache.get_many(list(dict.fromkeys(keys)))
+    missing = {key: text for key, text in zip(keys, batch, strict=True) if key not in found}
+    if missing:
+        vectors = np.asarray(encode(list(missing.values())), dtype=np.float32)
+        fresh = dict(zip(missing, vectors, strict=True))
+        cache.put_many(fresh)
+        found.update(fresh)
+    return np.vstack([found[key] for key in keys])
+
+
+def iter_embedding_batches(
+    texts: Iterable[str],
+    model_name: str = DEFAULT_MODEL_NAME,
+    batch_size: int = EMBED_BATCH_SIZE,
+    cache: EmbeddingCache | None = None,
+    encode: Encoder | None = None,
+) -> Iterator[np.ndarray]:
+    """Embed *texts* lazily, yielding one ``(<=batch_size, dim)`` array per batch.
+
+    Only one batch of texts and vectors is held at a time. With a *cache*,
+    vectors already stored for this model are reused and only the misses
+    (deduplicated within the batch) reach *encode*, which defaults to the
+    sentence-transformer for *model_name*.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1")
+    encode = encode or _model_encoder(model_name, batch_size)
+    it = iter(texts)
+    while batch := list(islice(it, batch_size)):
+        yield _embed_batch(batch, model_name, encode, cache)
+
+
+def embed_texts(
+    texts: list[str],
+    model_name: str = DEFAULT_MODEL_NAME,
+    batch_size: int = EMBED_BATCH_SIZE,
+    cache: EmbeddingCache | None = None,
+) -> np.ndarray:
+    batches = list(iter_embedding_batches(texts, model_name, batch_size=batch_size, cache=cache))
+    if not batches:
+        return np.empty((0, 0), dtype=np.float32)
+    return np.vstack(batches)
 
 
 def embed_query(text: str, model_name: str = DEFAULT_MODEL_NAME) -> np.ndarray:
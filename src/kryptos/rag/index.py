@@ -2,19 +2,34 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import logging
+import os
+import threading
+from collections.abc import Iterable, Iterator
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
 
 import numpy as np
 
 from kryptos.paths import get_artifacts_root, get_turbovec_index_dir
-from kryptos.rag.chunking import iter_artifact_chunks
-from kryptos.rag.embeddings import embed_query, embed_texts
+from kryptos.rag.chunking import ArtifactChunk, chunk_artifact_file, iter_indexable_files
+from kryptos.rag.embeddings import (
+    DEFAULT_MODEL_NAME,
+    EMBED_BATCH_SIZE,
+    EmbeddingCache,
+    Encoder,
+    embed_query,
+    iter_embedding_batches,
+)
+
+logger = logging.getLogger(__name__)
 
 INDEX_NAME = "kryptos-artifacts"
-EMBED_BATCH_SIZE = 64
+EMBED_CACHE_NAME = "embeddings.sqlite"
 BIT_WIDTH = 4
 
 
@@ -30,16 +45,49 @@ def _now() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
+def _empty_meta(model: str) -> dict:
+    return {"model": model, "dim": 0, "built_at": _now(), "next_id": 0, "files": {}, "chunks": {}}
+
+
+def _sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
 class ArtifactIndex:
     """Turbovec `IdMapIndex` over text chunks from `artifacts/`, with a JSON sidecar
-    mapping vector ids back to their source file/chunk/text."""
+    mapping vector ids back to their source file/chunk/text.
+
+    The sidecar also holds a manifest of every indexed file (mtime, size,
+    sha256 -> chunk ids), so :meth:`reindex` only re-chunks and re-embeds
+    files that were added or changed and drops the vectors of removed ones.
+    ``embedder`` replaces the sentence-transformer model (e.g. a deterministic
+    stub in tests). Chunks are embedded ``batch_size`` at a time and added to
+    the index as each batch arrives, through a content-addressed
+    :class:`EmbeddingCache` next to the index unless ``use_cache`` is off.
+    """
 
-    def __init__(self, index_dir: Path | None = None):
+    def __init__(
+        self,
+        index_dir: Path | None = None,
+        embedder: Encoder | None = None,
+        model_name: str = DEFAULT_MODEL_NAME,
+        batch_size: int = EMBED_BATCH_SIZE,
+        use_cache: bool = True,
+    ):
         self._index_dir = index_dir or get_turbovec_index_dir()
         self._index_path = self._index_dir / f"{INDEX_NAME}.tvim"
         self._meta_path = self._index_dir / f"{INDEX_NAME}.meta.json"
+        self._embedder = embedder
+        self._model_name = model_name
+        self._batch_size = batch_size
+        self._use_cache = use_cache
+        self._cache: EmbeddingCache | None = None
         self._index = None
         self._meta: dict | None = None
+        self._lock = threading.Lock()  # guards _index/_meta swaps vs. search
+        self._reindex_lock = threading.Lock()  # one reindex at a time
+        self._reindex_state: dict[str, Any] = {}
+        self._reindex_thread: threading.Thread | None = None
 
     @property
     def is_loaded(self) -> bool:
@@ -49,67 +97,80 @@ class ArtifactIndex:
         meta = self._meta
         if meta is None and self._meta_path.exists():
             meta = json.loads(self._meta_path.read_text(encoding="utf-8"))
-        if meta is None:
-            return {"indexed": False}
-        return {
-            "indexed": True,
-            "chunk_count": len(meta["chunks"]),
-            "model": meta["model"],
-            "built_at": meta["built_at"],
-            "index_path": str(self._index_path),
-        }
+        status: dict[str, Any] = {"indexed": False}
+        if meta is not None:
+            status = {
+                "indexed": True,
+                "chunk_count": len(meta["chunks"]),
+                "file_count": len(meta.get("files", {})),
+                "model": meta["model"],
+                "built_at": meta["built_at"],
+                "index_path": str(self._index_path),
+            }
+        if self._reindex_state:
+            status["reindex"] = dict(self._reindex_state)
+        return status
 
     def load(self) -> bool:
         """Load a previously-built index + sidecar from disk, if present."""
         if not self._meta_path.exists():
             return False
         meta = json.loads(self._meta_path.read_text(encoding="utf-8"))
+        index = None
         if meta["chunks"] and self._index_path.exists():
             from turbovec import IdMapIndex
 
-            self._index = IdMapIndex.load(str(self._index_path))
-        else:
-            self._index = None
-        self._meta = meta
+            index = IdMapIndex.load(str(self._index_path))
+        with self._lock:
+            self._index = index
+            self._meta = meta
         return True
 
     def build(self, artifacts_root: Path | None = None) -> dict:
         """Rebuild the index from scratch over *artifacts_root* (default `artifacts/`)."""
-        artifacts_root = artifacts_root or get_artifacts_root()
-        chunks = list(iter_artifact_chunks(artifacts_root))
-
-        meta: dict = {"model": "", "dim": 0, "built_at": _now(), "chunks": {}}
-        index = None
+        self.reindex(artifacts_root, full=True)
+        return self.status()
 
-        if chunks:
-            from turbovec import IdMapIndex
+    def reindex(self, artifacts_root: Path | None = None, full: bool = False) -> dict:
+        """Bring the index up to date with *artifacts_root*; return per-file change counts.
 
-            from kryptos.rag.embeddings import DEFAULT_MODEL_NAME
+        Files whose mtime and size match the manifest are skipped without being
+        read; a changed mtime with an unchanged sha256 only refreshes the
+        manifest. A full rebuild happens when ``full`` is set, when there is no
+        manifest yet (first build or a pre-manifest sidecar), or when the
+        sidecar was built with a different embedding model.
+        """
+        artifacts_root = artifacts_root or get_artifacts_root()
+        with self._reindex_lock:
+            if self._meta is None:
+                self.load()
+            meta = self._meta
+            if full or meta is None or "files" not in meta or meta["model"] not in ("", self._model_name):
+                full = True
+                meta = _empty_meta(self._model_name)
+            return self._apply_changes(artifacts_root, meta, full)
 
-            vector_batches = []
-            for start in range(0, len(chunks), EMBED_BATCH_SIZE):
-                end = start + EMBED_BATCH_SIZE
-                vector_batches.append(embed_texts([c.text for c in chunks[start:end]]))
-            vectors = np.vstack(vector_batches)
+    def start_reindex(self, artifacts_root: Path | None = None, full: bool = False) -> bool:
+        """Run :meth:`reindex` on a background thread; False if one is already running.
 
-            index = IdMapIndex(dim=vectors.shape[1], bit_width=BIT_WIDTH)
-            ids = np.arange(len(chunks), dtype=np.uint64)
-            index.add_with_ids(vectors, ids)
+        Progress and the outcome are reported under ``status()["reindex"]``.
+        """
+        with self._lock:
+            if self._reindex_state.get("state") == "running":
+                return False
+            self._reindex_state = {"state": "running", "full": full, "started_at": _now()}
+            self._reindex_thread = threading.Thread(
+                target=self._reindex_job, args=(artifacts_root, full), daemon=True, name="rag-reindex"
+            )
+            self._reindex_thread.start()
+        return True
 
-            meta["model"] = DEFAULT_MODEL_NAME
-            meta["dim"] = int(vectors.shape[1])
-            meta["chunks"] = {str(i): asdict(c) for i, c in enumerate(chunks)}
-
-        self._index_dir.mkdir(parents=True, exist_ok=True)
-        if index is not None:
-            index.write(str(self._index_path))
-        elif self._index_path.exists():
-            self._index_path.unlink()
-        self._meta_path.write_text(json.dumps(meta), encoding="utf-8")
-
-        self._index = index
-        self._meta = meta
-        return self.status()
+    def wait_for_reindex(self, timeout: float | None = None) -> dict:
+        """Block until a background reindex finishes (or ``timeout``); return its state."""
+        thread = self._reindex_thread
+        if thread is not None:
+            thread.join(timeout)
+        return dict(self._reindex_state)
 
     def search(self, query: str, k: int = 10) -> list[SearchResult]:
         if self._meta is None:
@@ -117,12 +178,16 @@ class ArtifactIndex:
         if self._index is None or not self._meta["chunks"]:
             return []
 
-        query_vec = embed_query(query, self._meta["model"]).reshape(1, -1)
-        scores, ids = self._index.search(query_vec, k=min(k, len(self._meta["chunks"])))
+        query_vec = self._embed_query(query).reshape(1, -1)
+        with self._lock:
+            chunks = self._meta["chunks"]
+            scores, ids = self._index.search(query_vec, k=min(k, len(chunks)))
 
         results = []
         for score, chunk_id in zip(scores[0], ids[0], strict=True):
-            chunk_meta = self._meta["chunks"][str(int(chunk_id))]
+            chunk_meta = chunks.get(str(int(chunk_id)))
+            if chunk_meta is None:  # added by a reindex that has not published its sidecar yet
+                continue
             results.append(
                 SearchResult(
                     score=float(score),
@@ -132,3 +197,147 @@ class ArtifactIndex:
                 ),
             )
         return results
+
+    # -- internals ----------------------------------------------------------
+    def _embed_batches(self, texts: Iterable[str]) -> Iterator[np.ndarray]:
+        if self._use_cache and self._cache is None:
+            self._cache = EmbeddingCache(self._index_dir / EMBED_CACHE_NAME)
+        return iter_embedding_batches(
+            texts, self._model_name, batch_size=self._batch_size, cache=self._cache, encode=self._embedder
+        )
+
+    def _embed_query(self, query: str) -> np.ndarray:
+        if self._embedder is not None:
+            return np.asarray(self._embedder([query]), dtype=np.float32)[0]
+        return embed_query(query, self._meta["model"])  # type: ignore[index]
+
+    def _reindex_job(self, artifacts_root: Path | None, full: bool) -> None:
+        try:
+            changes = self.reindex(artifacts_root, full=full)
+        except Exception as exc:  # noqa: BLE001 - surfaced through status()
+            logger.exception("RAG reindex failed")
+            outcome: dict[str, Any] = {"state": "error", "error": str(exc)}
+        else:
+            outcome = {"state": "idle", "changes": changes}
+        with self._lock:
+            self._reindex_state = {**self._reindex_state, **outcome, "finished_at": _now()}
+
+    def _apply_changes(self, artifacts_root: Path, meta: dict, full: bool) -> dict:
+        files: dict[str, dict] = dict(meta["files"])
+        changes = {"full": full, "added": 0, "changed": 0, "removed": 0, "unchanged": 0, "chunks_embedded": 0}
+        stale_ids: list[int] = []
+        new_chunks: list[ArtifactChunk] = []
+        new_files: dict[str, dict] = {}
+        touched = False
+
+        seen: set[str] = set()
+        for path in iter_indexable_files(artifacts_root):
+            rel = path.relative_to(artifacts_root).as_posix()
+            seen.add(rel)
+            st = path.stat()
+            entry = files.get(rel)
+            if entry is not None and entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+                changes["unchanged"] += 1
+                continue
+            digest = _sha256(path)
+            if entry is not None and entry["sha256"] == digest:
+                files[rel] = {**entry, "mtime_ns": st.st_mtime_ns, "size": st.st_size}
+                changes["unchanged"] += 1
+                touched = True
+                continue
+            if entry is not None:
+                stale_ids.extend(entry["chunk_ids"])
+                changes["changed"] += 1
+            else:
+                changes["added"] += 1
+            chunks = chunk_artifact_file(path, artifacts_root)
+            new_chunks.extend(chunks)
+            new_files[rel] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "sha256": digest, "n": len(chunks)}
+
+        for rel in [rel for rel in files if rel not in seen]:
+            stale_ids.extend(files.pop(rel)["chunk_ids"])
+            changes["removed"] += 1
+
+        if not (full or touched or stale_ids or new_files):
+            return changes
+
+        next_id = meta["next_id"]
+        ids = np.arange(next_id, next_id + len(new_chunks), dtype=np.uint64)
+        index, dim = self._add_vectors(new_chunks, ids, live=not full)
+        changes["chunks_embedded"] = len(new_chunks)
+
+        chunk_meta: dict[str, dict] = dict(meta["chunks"])
+        for chunk_id in stale_ids:
+            chunk_meta.pop(str(chunk_id), None)
+        for chunk_id, chunk in zip(ids, new_chunks, strict=True):
+            chunk_meta[str(int(chunk_id))] = asdict(chunk)
+        offset = 0
+        for rel, entry in new_files.items():
+            n = entry.pop("n")
+            entry["chunk_ids"] = [int(i) for i in ids[offset : offset + n]]
+            files[rel] = entry
+            offset += n
+
+        new_meta = {
+            "model": self._model_name,
+            "dim": dim or meta["dim"],
+            "built_at": _now(),
+            "next_id": next_id + len(new_chunks),
+            "files": files,
+            "chunks": chunk_meta,
+        }
+
+        with self._lock:
+            if index is not None:
+                for chunk_id in stale_ids:
+                    index.remove(chunk_id)
+            if not chunk_meta:
+                index = None
+            self._write(index, new_meta)
+            self._index = index
+            self._meta = new_meta
+        return changes
+
+    def _add_vectors(self, chunks: list[ArtifactChunk], ids: np.ndarray, live: bool):
+        """Stream embeddings for *chunks* into an index batch by batch; return ``(index, dim)``.
+
+        With ``live`` the vectors go straight into the index being searched
+        (search skips ids the sidecar does not know yet) and are taken back
+        out if embedding fails part-way; otherwise a fresh index is built.
+        """
+        index = self._index if live else None
+        if not chunks:
+            return index, 0
+        added = 0
+        dim = 0
+        target = index
+        try:
+            for batch in self._embed_batches(c.text for c in chunks):
+                batch_ids = ids[added : added + len(batch)]
+                dim = int(batch.shape[1])
+                if target is None:
+                    from turbovec import IdMapIndex
+
+                    target = IdMapIndex(dim=dim, bit_width=BIT_WIDTH)
+                with self._lock:
+                    target.add_with_ids(batch, batch_ids)
+                added += len(batch)
+        except BaseException:
+            if index is not None and target is index:
+                with self._lock:
+                    for chunk_id in ids[:added]:
+                        index.remove(int(chunk_id))
+            raise
+        return target, dim
+
+    def _write(self, index, meta: dict) -> None:
+        self._index_dir.mkdir(parents=True, exist_ok=True)
+        if index is not None:
+            tmp_index = self._index_path.with_suffix(".tvim.tmp")
+            index.write(str(tmp_index))
+            os.replace(tmp_index, self._index_path)
+        elif self._index_path.exists():
+            self._index_path.unlink()
+        tmp_meta = self._meta_path.with_suffix(".json.tmp")
+        tmp_meta.write_text(json.dumps(meta), encoding="utf-8")
+        os.replace(tmp_meta, self._meta_path)
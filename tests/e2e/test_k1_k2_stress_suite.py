@@ -64,11 +64,11 @@ def test_k1_k2_stress_suite():
     assert all(r["key_match"] for r in k2["noise"])
     assert all(r["key_match"] and r["plaintext_match_ratio"] == 1.0 for r in k2["partial_ciphertext"])
 
-    # --- K1: short ciphertext is fragile -- only low noise / full length recover the key ---
+    # --- K1: short ciphertext is fragile -- low noise always recovers, heavier noise only sometimes ---
     k1_noise_success = sum(1 for r in k1["noise"] if r["key_match"])
-    assert k1_noise_success == 4
+    assert k1_noise_success == 6
     assert all(r["key_match"] for r in k1["noise"] if r["noise_rate"] <= 0.05)
-    assert not any(r["key_match"] for r in k1["noise"] if r["noise_rate"] >= 0.10)
 
+    # The beam's column candidates survive truncation down to half the ciphertext.
     k1_partial_success = [r["fraction"] for r in k1["partial_ciphertext"] if r["key_match"]]
-    assert k1_partial_success == [1.0]
+    assert k1_partial_success == [1.0, 0.75, 0.5]
@@ -114,6 +114,14 @@ class TestRunCompositeSweep:
         result = run_composite_sweep(K4, **self._tiny_params(tmp_path))
         assert result["run_params"]["total_candidates_checked"] > 0
 
+    def test_progress_cb_fires_per_clock_state(self, tmp_path):
+        seen = []
+        result = run_composite_sweep(K4, progress_cb=seen.append, **self._tiny_params(tmp_path))
+        states = result["run_params"]["clock_states_count"]
+        assert [info["clock_idx"] for info in seen] == list(range(1, states + 1))
+        assert all(info["total_clock"] == states for info in seen)
+        assert seen[-1]["total_candidates"] == result["run_params"]["total_candidates_checked"]
+
 
 def _make_test_ciphertext(plain: str, n_cols: int) -> str:
     """Encrypt plain with identity columnar then 00:00:00 Berlin Clock shifts.
@@ -61,10 +61,13 @@ def test_rag_reindex_endpoint(tmp_path, monkeypatch):
         client = TestClient(create_app(index=index))
 
         resp = client.post("/api/rag/reindex")
-        assert resp.status_code == 200
-        assert resp.json()["chunk_count"] == 1
+        assert resp.status_code == 202
+        assert resp.json()["started"] is True
 
+        index.wait_for_reindex(timeout=120)
         status = client.get("/api/rag/status").json()
         assert status["indexed"] is True
+        assert status["chunk_count"] == 1
+        assert status["reindex"]["state"] == "idle"
     finally:
         paths.get_repo_root.cache_clear()  # type: ignore[attr-defined]
@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import json
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+import pytest
+
 from kryptos.provenance.attack_log import (
+    ATTACK_DB_FILENAME,
     AttackLogger,
     AttackParameters,
     AttackRecord,
     AttackResult,
+    migrate_jsonl_log,
 )
 
 
@@ -395,3 +402,114 @@ class TestIntegration:
         # Export
         json_path = logger.export_to_json()
         assert json_path.exists()
+
+
+def _log_mixed(logger: AttackLogger, n: int = 6) -> None:
+    for i in range(n):
+        logger.log_attack(
+            "XYZABC",
+            AttackParameters("vigenere" if i % 2 else "hill", {"key": f"K{i}"}),
+            AttackResult(success=i % 3 == 0, confidence_scores={"SPY": i / 10}),
+            tags=["k4"] + (["even"] if i % 2 == 0 else []),
+        )
+
+
+class TestSqliteStorage:
+    """SQLite backend behaves like the JSONL backend."""
+
+    def test_rejects_unknown_storage(self, tmp_path):
+        with pytest.raises(ValueError, match="storage must be one of"):
+            AttackLogger(log_dir=tmp_path, storage="parquet")
+
+    def test_queries_match_jsonl_backend(self, tmp_path):
+        jsonl = AttackLogger(log_dir=tmp_path / "jsonl")
+        sqlite = AttackLogger(log_dir=tmp_path / "sqlite", storage="sqlite")
+        _log_mixed(jsonl)
+        _log_mixed(sqlite)
+
+        def keys(records):
+            return [r.parameters.key_or_params["key"] for r in records]
+
+        for kwargs in (
+            {},
+            {"cipher_type": "vigenere"},
+            {"success_only": True},
+            {"min_confidence": 0.3},
+            {"tags": ["even"]},
+            {"cipher_type": "hill", "limit": 2},
+        ):
+            assert keys(sqlite.query_attacks(**kwargs)) == keys(jsonl.query_attacks(**kwargs)), kwargs
+        assert sqlite.get_statistics() == jsonl.get_statistics()
+
+    def test_dedup_and_lookup(self, tmp_path):
+        logger = AttackLogger(log_dir=tmp_path, storage="sqlite")
+        params = AttackParameters("vigenere", {"key": "ABC"})
+        id1, dup1 = logger.log_attack("XYZABC", params, AttackResult(success=False))
+        id2, dup2 = logger.log_attack("XYZABC", params, AttackResult(success=True))
+
+        assert (dup1, dup2) == (False, True)
+        assert id1 == id2
+        assert logger.is_duplicate(params)
+        assert logger.get_attack(id1).parameters == params
+        assert logger.attack_index[params.fingerprint()].attack_id == id1
+        assert len(logger.chronological_index) == 1
+        assert logger.stats["duplicates_prevented"] == 1
+
+    def test_concurrent_logging_from_threads(self, tmp_path):
+        logger = AttackLogger(log_dir=tmp_path, storage="sqlite", commit_every=7)
+
+        def log(i):
+            params = AttackParameters("vigenere", {"key": f"K{i % 50}"})
+            return logger.log_attack("XYZ", params, AttackResult(success=False))[1]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            duplicates = list(pool.map(log, range(200)))
+            keys = list(pool.map(lambda _: sum(1 for _ in logger.attack_index), range(8)))
+
+        assert duplicates.count(False) == 50
+        assert keys == [50] * 8
+        logger.close()
+
+    def test_reopen_restores_index_without_loading(self, tmp_path):
+        with AttackLogger(log_dir=tmp_path, storage="sqlite", commit_every=4) as logger:
+            _log_mixed(logger, n=10)
+
+        reopened = AttackLogger(log_dir=tmp_path, storage="sqlite")
+        assert reopened.stats["total_attacks"] == 10
+        assert reopened.stats["successful_attacks"] == 4
+        assert reopened.is_duplicate(AttackParameters("hill", {"key": "K0"}))
+        assert [r.parameters.key_or_params["key"] for r in reopened.chronological_index[2:4]] == ["K2", "K3"]
+
+    def test_wal_mode_and_indexes(self, tmp_path):
+        AttackLogger(log_dir=tmp_path, storage="sqlite").close()
+        conn = sqlite3.connect(tmp_path / ATTACK_DB_FILENAME)
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        indexed = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        conn.close()
+        assert {"idx_attacks_cipher_type", "idx_attacks_timestamp"} <= indexed
+        assert any(name.startswith("sqlite_autoindex_attacks") for name in indexed)  # UNIQUE fingerprint
+
+    def test_exports_work_on_sqlite(self, tmp_path):
+        logger = AttackLogger(log_dir=tmp_path, storage="sqlite")
+        _log_mixed(logger)
+
+        data = json.loads(logger.export_to_json(tmp_path / "export.json").read_text(encoding="utf-8"))
+        assert data["metadata"]["total_attacks"] == 6
+        assert [a["parameters"]["key_or_params"]["key"] for a in data["attacks"]] == [f"K{i}" for i in range(6)]
+
+        tex = logger.export_to_latex_table(tmp_path / "table.tex", limit=3).read_text(encoding="utf-8")
+        assert tex.count("\\\\") == 4  # header row + 3 records
+
+
+class TestMigration:
+    def test_migrate_jsonl_log(self, tmp_path):
+        _log_mixed(AttackLogger(log_dir=tmp_path))
+        with open(tmp_path / "attack_log.jsonl", "a", encoding="utf-8") as f:
+            f.write("not json\n")
+
+        assert migrate_jsonl_log(tmp_path) == {"imported": 6, "duplicates": 0, "invalid": 1}
+        assert migrate_jsonl_log(tmp_path) == {"imported": 0, "duplicates": 6, "invalid": 1}
+
+        jsonl = AttackLogger(log_dir=tmp_path)
+        sqlite = AttackLogger(log_dir=tmp_path, storage="sqlite")
+        assert [r.to_dict() for r in sqlite.chronological_index] == [r.to_dict() for r in jsonl.chronological_index]
@@ -0,0 +1,104 @@
+"""Single-pass baseline_stats agrees exactly with the per-metric scoring helpers."""
+
+from __future__ import annotations
+
+import json
+import math
+import random
+
+import pytest
+
+from kryptos.k4 import scoring
+from kryptos.k4.reporting import write_candidates_json
+
+SAMPLES = [
+    "",
+    "A",
+    "AB",
+    "ABC",
+    "BERLIN CLOCK",
+    "clock, then berlin!",
+    "Éclair über straße",
+    "THE" * 2000,  # long enough to hit the wordlist window cap
+    "OBKRUOXOGHULBSOLIFBBWFLRVQQPRNGKSSOTWTQSJQSSEKZZWATJKLUDIAWINFBNYPVTTMZFPKWGDKZXTJCDIGKUHUAUEKCAR",
+]
+
+
+def _random_samples(count: int = 200, seed: int = 3) -> list[str]:
+    rng = random.Random(seed)
+    pool = "ABCDEFGHIJKLMNOPQRSTUVWXYZ theandberlinclockeast,.-É"
+    return ["".join(rng.choice(pool) for _ in range(rng.randint(0, 150))) for _ in range(count)]
+
+
+def _per_metric(text: str) -> dict[str, float]:
+    return {
+        'chi_square': scoring.chi_square_stat(text),
+        'bigram_score': scoring.bigram_score(text),
+        'trigram_score': scoring.trigram_score(text),
+        'quadgram_score': scoring.quadgram_score(text) if scoring.QUADGRAMS else 0.0,
+        'crib_bonus': scoring.crib_bonus(text),
+        'rarity_weighted_crib_bonus': scoring.rarity_weighted_crib_bonus(text),
+        'combined_score': scoring.combined_plaintext_score(text),
+        'index_of_coincidence': scoring.index_of_coincidence(text),
+        'vowel_ratio': scoring.vowel_ratio(text),
+        'letter_coverage': scoring.letter_coverage(text),
+        'letter_entropy': scoring.letter_entropy(text),
+        'repeating_bigram_fraction': scoring.repeating_bigram_fraction(text),
+        'wordlist_hit_rate': scoring.wordlist_hit_rate(text),
+        'trigram_entropy': scoring.trigram_entropy(text),
+        'bigram_gap_variance': scoring.bigram_gap_variance(text),
+        'berlin_clock_pattern_bonus': float(scoring.berlin_clock_pattern_validator(text)['pattern_bonus']),
+    }
+
+
+def _assert_identical(text: str) -> None:
+    got, expected = scoring.baseline_stats(text), _per_metric(text)
+    assert list(got) == list(expected)  # key order is part of the report format
+    for key, value in expected.items():
+        assert got[key] == value or (math.isnan(got[key]) and math.isnan(value)), key
+
+
+@pytest.mark.parametrize("text", SAMPLES + _random_samples())
+def test_matches_per_metric_helpers(text):
+    _assert_identical(text)
+
+
+def test_matches_with_patched_tables(monkeypatch):
+    monkeypatch.setattr(scoring, "QUADGRAMS", {})
+    monkeypatch.setattr(scoring, "WORDLIST", {"THE", "CLOCK"})
+    monkeypatch.setattr(scoring, "_get_all_cribs", lambda: ["BERLIN", "CLOCK", ""])
+    for text in SAMPLES:
+        _assert_identical(text)
+    assert scoring.baseline_stats("BERLINCLOCK")['crib_bonus'] == 55.0
+
+
+def test_wordlist_window_cap_is_preserved(monkeypatch):
+    monkeypatch.setattr(scoring, "WORDLIST", {"THE"})
+    text = "THE" * 2000
+    # 5000 windows, all of them length 3 (5998 available): every third one is THE.
+    assert scoring.wordlist_hit_rate(text) == 1667 / 5000
+    assert scoring.baseline_stats(text)['wordlist_hit_rate'] == 1667 / 5000
+
+
+def test_report_metrics_match(tmp_path):
+    texts = _random_samples(50, seed=9)
+    path = write_candidates_json(
+        "stage",
+        "K4",
+        "CT",
+        [{"text": t, "score": float(-i)} for i, t in enumerate(texts)],
+        output_path=str(tmp_path / "cands.json"),
+    )
+    payload = json.loads((tmp_path / "cands.json").read_text(encoding="utf-8"))
+    assert path.endswith("cands.json")
+    for entry in payload["candidates"]:
+        expected = _per_metric(entry["text"])
+        assert entry["metrics"] == json.loads(json.dumps(expected))
+
+
+def test_report_and_helpers_share_metric_cores(monkeypatch):
+    monkeypatch.setattr(scoring, "_crib_bonus", lambda seq, cribs: 1.0)
+    monkeypatch.setattr(scoring, "_combine_scores", lambda chi, bi, tri, quad, cribs: cribs + 41.0)
+    stats = scoring.baseline_stats("BERLIN CLOCK")
+    assert stats['crib_bonus'] == scoring.crib_bonus("BERLIN CLOCK") == 1.0
+    assert stats['combined_score'] == scoring.combined_plaintext_score("BERLIN CLOCK") == 42.0
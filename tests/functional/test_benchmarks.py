@@ -48,6 +48,11 @@ class TestRunBenchmarks:
         assert rows[0]["space_reduction"] is not None
         assert 0.0 <= rows[0]["space_reduction"] <= 1.0
 
+    def test_clock_dedup_factor_reported_for_clock_cases(self, tmp_path):
+        rows = run_benchmarks(names=["clock_hill", "beaufort_sweep"], out_dir=tmp_path)
+        assert rows[0]["clock_dedup_factor"] >= 1.0
+        assert rows[1]["clock_dedup_factor"] is None
+
 
 class TestFormatResultsTable:
     def test_renders_markdown(self):
@@ -0,0 +1,113 @@
+"""Tests for invert-once / batched Hill decryption paths."""
+
+import random
+import unittest
+from math import gcd
+
+from kryptos.k4 import hill_cipher
+from kryptos.k4.hill_cipher import (
+    MOD_INV_TABLE,
+    brute_force_crib,
+    hill_decrypt,
+    hill_decrypt_batch,
+    hill_decrypt_with_inverse,
+    hill_encrypt,
+    inverse_key,
+    matrix_inv_mod,
+    mod_inv,
+)
+from kryptos.k4.hill_search import score_decryptions
+
+K4 = "OBKRUOXOGHULBSOLIFBBWFLRVQQPRNGKSSOTWTQSJQSSEKZZWATJKLUDIAWINFBNYPVTTMZFPKWGDKZXTJCDIGKUHUAUEKCAR"
+
+
+def _reference_decrypt(text, key):
+    """Per-block decrypt as originally written (inverts for every block)."""
+    nums = [hill_cipher.ALPHABET.index(c) for c in text]
+    size = len(key)
+    out = []
+    for i in range(0, len(nums) - len(nums) % size, size):
+        inv = matrix_inv_mod(key)
+        if inv is None:
+            return None
+        block = nums[i : i + size]
+        out.extend(sum(inv[r][c] * block[c] for c in range(size)) % 26 for r in range(size))
+    return ''.join(hill_cipher.ALPHABET[n] for n in out)
+
+
+def _random_keys(size, count, seed):
+    rng = random.Random(seed)
+    keys = []
+    while len(keys) < count:
+        key = [[rng.randrange(26) for _ in range(size)] for _ in range(size)]
+        if matrix_inv_mod(key) is not None:
+            keys.append(key)
+    return keys
+
+
+class TestModInvTable(unittest.TestCase):
+    def test_table_matches_linear_search(self):
+        for a in range(26):
+            expected = next((x for x in range(1, 26) if (a * x) % 26 == 1), None)
+            self.assertEqual(MOD_INV_TABLE[a], expected)
+            self.assertEqual(mod_inv(a), expected)
+            self.assertEqual(MOD_INV_TABLE[a] is not None, gcd(a, 26) == 1)
+
+    def test_other_modulus_still_supported(self):
+        self.assertEqual(mod_inv(3, 7), 5)
+
+
+class TestInvertOnce(unittest.TestCase):
+    def test_with_inverse_matches_reference(self):
+        for size in (2, 3):
+            for key in _random_keys(size, 20, seed=size):
+                self.assertEqual(hill_decrypt(K4, key), _reference_decrypt(K4, key))
+                self.assertEqual(hill_decrypt_with_inverse(K4, inverse_key(key)), _reference_decrypt(K4, key))
+
+    def test_inverse_key_is_memoised_and_copy_safe(self):
+        key = [[3, 3], [2, 5]]
+        first = inverse_key(key)
+        first[0][0] = 99
+        self.assertEqual(inverse_key(key), matrix_inv_mod(key))
+
+    def test_singular_key_keeps_legacy_results(self):
+        singular = [[2, 4], [1, 2]]
+        self.assertIsNone(hill_decrypt("ABCD", singular))
+        self.assertEqual(hill_decrypt("A", singular), '')
+
+
+class TestBatchDecrypt(unittest.TestCase):
+    def test_batch_matches_single_key_decrypt(self):
+        for size in (2, 3):
+            keys = _random_keys(size, 15, seed=10 + size)
+            inverses = [inverse_key(k) for k in keys]
+            batch = hill_decrypt_batch(K4, inverses)
+            self.assertEqual(batch, [hill_decrypt(K4, k) for k in keys])
+
+    def test_batch_rejects_bad_shape(self):
+        with self.assertRaises(ValueError):
+            hill_decrypt_batch(K4, [[1, 0, 0], [0, 1, 0]])
+
+    def test_score_decryptions_mixed_sizes_and_singular(self):
+        keys = _random_keys(2, 5, seed=1) + [[[2, 4], [1, 2]]] + _random_keys(3, 5, seed=2)
+        res = score_decryptions(K4, keys)
+        self.assertEqual(len(res), 10)
+        for row in res:
+            self.assertEqual(row['text'], hill_decrypt(K4, row['key']))
+        scores = [r['score'] for r in res]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+
+
+class TestBruteForceCrib(unittest.TestCase):
+    def test_recovers_key_within_limit(self):
+        key = [[0, 1], [1, 3]]  # early in lexicographic enumeration
+        ct = hill_encrypt("BERL", key)
+        res = brute_force_crib(ct, "BERL", limit=2000)
+        self.assertIn(key, [r['key'] for r in res])
+        for r in res:
+            self.assertEqual(r['enc'], ct)
+            self.assertEqual(hill_encrypt("BERL", r['key']), ct)
+
+
+if __name__ == '__main__':
+    unittest.main()
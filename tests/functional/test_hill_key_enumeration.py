@@ -0,0 +1,87 @@
+"""Tests for vectorized 2x2 key enumeration and the crib-constrained key solver."""
+
+from __future__ import annotations
+
+from math import gcd
+
+import numpy as np
+
+from kryptos.k4.hill_cipher import (
+    COPRIME_DETERMINANTS,
+    hill_encrypt,
+    invertible_2x2_key_array,
+    invertible_2x2_keys,
+    iter_invertible_2x2_by_determinant,
+    solve_2x2_keys_from_cribs,
+)
+from kryptos.k4.hypotheses import HillCipher2x2Hypothesis
+
+PLANTED_KEY = [[5, 8], [17, 3]]
+CRIBS = {"EAST": ("EAST", 22), "BERLIN": ("BERLIN", 63)}
+
+
+def _planted_plaintext() -> str:
+    text = list("THEQUICKBROWNFOXJUMPSOVERTHELAZYDOG" * 3)[:98]
+    for word, start in CRIBS.values():
+        text[start : start + len(word)] = word
+    return "".join(text)
+
+
+def _reference_keys() -> list[list[list[int]]]:
+    keys = []
+    for a in range(26):
+        for b in range(26):
+            for c in range(26):
+                for d in range(26):
+                    if gcd((a * d - b * c) % 26, 26) == 1:
+                        keys.append([[a, b], [c, d]])
+    return keys
+
+
+class TestEnumeration:
+    def test_matches_reference_loop_in_order(self):
+        assert invertible_2x2_keys() == _reference_keys()
+
+    def test_array_shape_and_count(self):
+        keys = invertible_2x2_key_array()
+        assert keys.shape == (157_248, 2, 2)
+        assert keys.dtype == np.int8
+
+    def test_determinant_classes_partition_the_space(self):
+        classes = dict(iter_invertible_2x2_by_determinant())
+        assert tuple(classes) == COPRIME_DETERMINANTS
+        assert sum(len(k) for k in classes.values()) == 157_248
+        for det, keys in classes.items():
+            k = keys.astype(int)
+            assert np.all((k[:, 0, 0] * k[:, 1, 1] - k[:, 0, 1] * k[:, 1, 0]) % 26 == det)
+
+    def test_cache_round_trip(self, tmp_path):
+        path = tmp_path / "keys" / "hill2x2.npy"
+        first = invertible_2x2_key_array(path)
+        assert path.exists()
+        second = invertible_2x2_key_array(path)
+        assert np.array_equal(first, second)
+
+
+class TestCribSolver:
+    def test_recovers_planted_key(self):
+        ct = hill_encrypt(_planted_plaintext(), PLANTED_KEY)
+        assert solve_2x2_keys_from_cribs(ct, CRIBS) == [PLANTED_KEY]
+
+    def test_wrong_alignment_excludes_planted_key(self):
+        ct = hill_encrypt(_planted_plaintext(), PLANTED_KEY)
+        assert PLANTED_KEY not in solve_2x2_keys_from_cribs(ct, CRIBS, offset=1)
+
+    def test_conflicting_cribs_yield_nothing(self):
+        ct = hill_encrypt(_planted_plaintext(), PLANTED_KEY)
+        assert solve_2x2_keys_from_cribs(ct, {"A": ("EAST", 22), "B": ("WEST", 22)}) == []
+
+    def test_no_covered_block_falls_back_to_full_space(self):
+        assert len(solve_2x2_keys_from_cribs("ABCDEF", {"X": ("Q", 3)})) == 157_248
+
+    def test_hypothesis_with_cribs_scores_only_consistent_keys(self):
+        ct = hill_encrypt(_planted_plaintext(), PLANTED_KEY)
+        candidates = HillCipher2x2Hypothesis(cribs=CRIBS).generate_candidates(ct, limit=5)
+        assert len(candidates) == 1
+        assert candidates[0].key_info["matrix"] == PLANTED_KEY
+        assert candidates[0].plaintext == _planted_plaintext()
@@ -0,0 +1,315 @@
+"""Tests for the persistent, cancellable K4 attack job queue."""
+
+from __future__ import annotations
+
+import json
+import multiprocessing
+import os
+import signal
+import sqlite3
+import threading
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from kryptos.api import k4_attack_routes
+from kryptos.api.job_queue import PROGRESS_MAX_OVERHEAD, JobQueue, JobStore, ProgressThrottle, progress_event
+
+
+def _wait_for(predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        result = predicate()
+        if result:
+            return result
+        time.sleep(0.01)
+    raise AssertionError("condition not met before timeout")
+
+
+def _app(job_db, max_workers=2):
+    app = FastAPI()
+    app.include_router(k4_attack_routes.create_k4_attack_router(job_db=job_db, max_workers=max_workers))
+    return app
+
+
+def _sweep_until_cancelled(job_id, _req):
+    while True:
+        k4_attack_routes._update_job(job_id, progress_pct=10.0, clock_time="13:00")
+        time.sleep(0.01)
+
+
+def _quick_sweep(_job_id, req):
+    return {"status": "null_result", "attack": req.attack_id, "total_candidates": 3, "best_candidates": [{"k": 1}]}
+
+
+class TestJobQueue:
+    def test_worker_pool_is_bounded(self, tmp_path):
+        release = threading.Event()
+        started = []
+
+        def runner(job_id, _params):
+            started.append(job_id)
+            release.wait(10)
+            return {"status": "complete"}
+
+        q = JobQueue(runner, db_path=tmp_path / "jobs.sqlite", max_workers=1)
+        jobs = [q.submit("p7_gronsfeld", {}) for _ in range(3)]
+        _wait_for(lambda: started)
+        time.sleep(0.05)
+
+        assert [q.get(j["job_id"])["status"] for j in jobs] == ["running", "queued", "queued"]
+        release.set()
+        _wait_for(lambda: all(q.get(j["job_id"])["status"] == "complete" for j in jobs))
+        assert started == [j["job_id"] for j in jobs]
+
+    def test_cancel_running_job_is_cooperative(self, tmp_path):
+        def runner(job_id, _params):
+            while True:
+                q.progress(job_id, progress_pct=5.0)
+                time.sleep(0.01)
+
+        q = JobQueue(runner, db_path=tmp_path / "jobs.sqlite")
+        job = q.submit("p1_three_layer", {})
+        _wait_for(lambda: q.get(job["job_id"])["status"] == "running")
+
+        assert q.cancel(job["job_id"])["cancel_requested"] is True
+        _wait_for(lambda: q.get(job["job_id"])["status"] == "cancelled")
+
+    def test_cancel_queued_job_never_runs(self, tmp_path):
+        release = threading.Event()
+        ran = []
+
+        def runner(job_id, _params):
+            ran.append(job_id)
+            release.wait(10)
+            return {"status": "complete"}
+
+        q = JobQueue(runner, db_path=tmp_path / "jobs.sqlite", max_workers=1)
+        first = q.submit("p7_gronsfeld", {})
+        second = q.submit("p7_gronsfeld", {})
+        _wait_for(lambda: ran)
+
+        assert q.cancel(second["job_id"])["status"] == "cancelled"
+        release.set()
+        _wait_for(lambda: q.get(first["job_id"])["status"] == "complete")
+        time.sleep(0.05)
+        assert ran == [first["job_id"]]
+
+    def test_summary_stored_as_result_file(self, tmp_path):
+        q = JobQueue(lambda _id, _p: {"summary": {"best": [1, 2]}}, db_path=tmp_path / "jobs.sqlite")
+        job = q.submit("p7_gronsfeld", {})
+        done = _wait_for(lambda: (j := q.get(job["job_id"]))["status"] == "complete" and j)
+
+        assert done["summary"] == {"best": [1, 2]}
+        assert done["result_path"].startswith(str(tmp_path / "results"))
+
+    def test_runner_exception_marks_error(self, tmp_path):
+        def runner(_job_id, _params):
+            raise ValueError("boom")
+
+        q = JobQueue(runner, db_path=tmp_path / "jobs.sqlite")
+        job = q.submit("p7_gronsfeld", {})
+        done = _wait_for(lambda: (j := q.get(job["job_id"]))["status"] == "error" and j)
+        assert done["error"] == "boom"
+
+
+class TestAttackJobRoutes:
+    def test_run_poll_and_cancel(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(k4_attack_routes, "_run_attack_worker", _sweep_until_cancelled)
+        client = TestClient(_app(tmp_path / "jobs.sqlite"))
+
+        job = client.post("/api/k4/attacks/run", json={"attack_id": "p1_three_layer"}).json()
+        url = f"/api/k4/attacks/jobs/{job['job_id']}"
+        _wait_for(lambda: client.get(url).json()["progress_pct"] == 10.0)
+
+        assert client.delete(url).status_code == 200
+        _wait_for(lambda: client.get(url).json()["status"] == "cancelled")
+        assert client.delete(url).status_code == 409
+        assert client.delete("/api/k4/attacks/jobs/nope").status_code == 404
+
+    def test_completed_job_reports_summary(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(k4_attack_routes, "_run_attack_worker", _quick_sweep)
+        client = TestClient(_app(tmp_path / "jobs.sqlite"))
+
+        job = client.post("/api/k4/attacks/run", json={"attack_id": "p7_gronsfeld"}).json()
+        url = f"/api/k4/attacks/jobs/{job['job_id']}"
+        done = _wait_for(lambda: (j := client.get(url).json())["status"] == "complete" and j)
+
+        assert done["total_candidates"] == 3
+        assert done["top_candidates"] == [{"k": 1}]
+        assert done["summary"]["attack"] == "p7_gronsfeld"
+
+
+def _serve_until_killed(job_db, running, submit):
+    def _sweep(job_id, req):
+        running.value = 1
+        _sweep_until_cancelled(job_id, req)
+
+    k4_attack_routes._run_attack_worker = _sweep
+    with TestClient(_app(job_db)) as client:  # startup recovers jobs from earlier runs
+        if submit:
+            client.post("/api/k4/attacks/run", json={"attack_id": "p1_three_layer"})
+        time.sleep(60)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork to kill a server mid-job")
+class TestRestartRecovery:
+    @staticmethod
+    def _start_and_kill(job_db, submit):
+        ctx = multiprocessing.get_context("fork")
+        running = ctx.Value("i", 0)
+        server = ctx.Process(target=_serve_until_killed, args=(job_db, running, submit))
+        server.start()
+        try:
+            _wait_for(lambda: running.value, timeout=30)
+        finally:
+            os.kill(server.pid, signal.SIGKILL)
+            server.join()
+
+    def test_killed_job_resumes_on_restart(self, tmp_path, monkeypatch):
+        job_db = tmp_path / "jobs.sqlite"
+        self._start_and_kill(job_db, submit=True)
+
+        (job,) = _all_jobs(job_db)
+        assert (job["status"], job["attempts"]) == ("running", 1)
+
+        monkeypatch.setattr(k4_attack_routes, "_run_attack_worker", _quick_sweep)
+        with TestClient(_app(job_db)):
+            done = _wait_for(lambda: (j := k4_attack_routes._get_job(job["job_id"]))["status"] == "complete" and j)
+
+        assert done["attempts"] == 2
+        assert done["summary"]["attack"] == "p1_three_layer"
+
+    def test_job_killed_every_attempt_is_marked_interrupted(self, tmp_path):
+        job_db = tmp_path / "jobs.sqlite"
+        self._start_and_kill(job_db, submit=True)
+        self._start_and_kill(job_db, submit=False)  # resumed, then killed again
+
+        with TestClient(_app(job_db)):
+            pass
+        (job,) = _all_jobs(job_db)
+        assert job["status"] == "interrupted"
+        assert job["attempts"] == 2
+        assert "restart" in job["error"]
+
+
+def test_startup_recovers_each_job_once(tmp_path, monkeypatch):
+    # FastAPI runs an included router's startup handlers twice (app + nested lifespan).
+    job_db = tmp_path / "jobs.sqlite"
+    store = JobStore(job_db)
+    queued = store.create("p7_gronsfeld", {"attack_id": "p7_gronsfeld"})["job_id"]
+    running = store.create("p1_three_layer", {"attack_id": "p1_three_layer"})["job_id"]
+    store.claim(running)  # left running by a dead process, one attempt short of the limit
+    store.close()
+
+    release = threading.Event()
+    runs = []
+
+    def sweep(job_id, req):
+        runs.append(job_id)
+        release.wait(10)
+        return _quick_sweep(job_id, req)
+
+    def recover_then_let_workers_claim(self):
+        counts = original_recover(self)
+        _wait_for(lambda: len(runs) == 2)  # the second startup pass sees both jobs running
+        return counts
+
+    original_recover = JobQueue.recover
+    monkeypatch.setattr(JobQueue, "recover", recover_then_let_workers_claim)
+    monkeypatch.setattr(k4_attack_routes, "_run_attack_worker", sweep)
+    with TestClient(_app(job_db, max_workers=3)):  # a spare worker would pick up a duplicate
+        time.sleep(0.05)
+        assert [k4_attack_routes._get_job(j)["status"] for j in (queued, running)] == ["running", "running"]
+        release.set()
+        _wait_for(lambda: all(k4_attack_routes._get_job(j)["status"] == "complete" for j in (queued, running)))
+        assert k4_attack_routes._QUEUE.recover() == {"requeued": 0, "interrupted": 0, "cancelled": 0}
+
+    assert sorted(runs) == sorted([queued, running])
+    assert {j["job_id"]: j["attempts"] for j in _all_jobs(job_db)} == {queued: 1, running: 2}
+
+
+def _all_jobs(job_db):
+    with sqlite3.connect(job_db) as conn:
+        conn.row_factory = sqlite3.Row
+        return [dict(row) for row in conn.execute("SELECT * FROM jobs")]
+
+
+class TestProgressEvents:
+    def test_throttle_spaces_emissions_by_interval_and_cost(self):
+        now = [0.0]
+        emitted = []
+
+        def emit(info):
+            emitted.append(info["n"])
+            now[0] += 0.02  # each emission costs 20 ms
+
+        throttle = ProgressThrottle(emit, min_interval=0.5, max_overhead=0.01, clock=lambda: now[0])
+        for n in range(1000):
+            throttle({"n": n})
+            now[0] += 0.01
+
+        # 20 ms per emission -> at least 2 s of sweep time between emissions.
+        assert emitted[0] == 0
+        assert len(emitted) <= 1 + 10.2 // 2.01
+        assert throttle({"n": "final"}, force=True) and emitted[-1] == "final"
+
+    @pytest.mark.parametrize("cost", [0.0001, 0.003, 0.05])
+    def test_throttle_overhead_stays_under_one_percent(self, cost):
+        now = [0.0]
+        spent = [0.0]
+
+        def emit(_info):
+            now[0] += cost
+            spent[0] += cost
+
+        throttle = ProgressThrottle(emit, clock=lambda: now[0])
+        while now[0] < 600.0:
+            throttle({})
+            now[0] += 0.001  # one clock state of sweep work
+        assert spent[0] / now[0] < PROGRESS_MAX_OVERHEAD
+
+    def test_progress_event_fields(self):
+        event = progress_event(
+            {
+                "clock_idx": 5,
+                "total_clock": 20,
+                "clock_time": "13:00:00",
+                "total_candidates": 1000,
+                "top_candidates": [{"instructional_score": 0.42, "keyword_hits": 2}],
+            },
+            elapsed=2.0,
+        )
+        assert event["states_done"] == 5 and event["progress_pct"] == 25.0
+        assert event["tested_per_sec"] == 500.0
+        assert event["eta_seconds"] == 6.0
+        assert (event["best_score"], event["best_keyword_hits"]) == (0.42, 2)
+
+    def test_sse_stream_reports_progress_then_final_status(self, tmp_path, monkeypatch):
+        def sweep(job_id, _req):
+            progress_cb = k4_attack_routes._clock_progress(job_id)
+            for idx in range(1, 51):
+                progress_cb({"clock_idx": idx, "total_clock": 50, "clock_time": f"{idx:02d}:00",
+                             "total_candidates": idx * 100, "top_candidates": []})
+            return {"status": "null_result", "best_candidates": []}
+
+        monkeypatch.setattr(k4_attack_routes, "_run_attack_worker", sweep)
+        client = TestClient(_app(tmp_path / "jobs.sqlite"))
+        job = client.post("/api/k4/attacks/run", json={"attack_id": "p1_three_layer"}).json()
+        _wait_for(lambda: client.get(f"/api/k4/attacks/jobs/{job['job_id']}").json()["status"] == "complete")
+
+        with client.stream("GET", f"/api/k4/attacks/jobs/{job['job_id']}/events") as resp:
+            assert resp.headers["content-type"].startswith("text/event-stream")
+            events = [json.loads(line[len("data: "):]) for line in resp.iter_lines() if line.startswith("data: ")]
+
+        progress = [e for e in events if e["type"] == "progress"]
+        assert progress[0]["states_done"] == 1
+        assert progress[-1]["states_done"] == 50 and progress[-1]["candidates_tested"] == 5000
+        assert len(progress) < 50  # throttled
+        assert events[-1] == {**events[-1], "type": "status", "status": "complete"}
+
+    def test_sse_unknown_job_is_404(self, tmp_path):
+        client = TestClient(_app(tmp_path / "jobs.sqlite"))
+        assert client.get("/api/k4/attacks/jobs/nope/events").status_code == 404
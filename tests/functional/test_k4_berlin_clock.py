@@ -1,7 +1,9 @@
 """Berlin Clock key stream tests."""
 
+import tempfile
 import unittest
 from datetime import time
+from pathlib import Path
 
 from kryptos.k4 import (
     Pipeline,
@@ -12,6 +14,12 @@ from kryptos.k4 import (
     full_clock_state,
     make_berlin_clock_stage,
 )
+from kryptos.k4.berlin_clock import (
+    clock_dedup_factor,
+    dedupe_clock_shift_sequences,
+    enumerate_unique_clock_shift_sequences,
+)
+from kryptos.k4.clock_hill_attack import run_clock_hill_attack
 
 
 class TestBerlinClock(unittest.TestCase):
@@ -49,5 +57,44 @@ class TestBerlinClock(unittest.TestCase):
         self.assertTrue(len(r.metadata['candidates']) <= 10)
 
 
+class TestClockShiftDedup(unittest.TestCase):
+    def test_hourly_states_are_already_unique(self):
+        unique = enumerate_unique_clock_shift_sequences(step_seconds=3600)
+        self.assertEqual(len(unique), 24)
+        self.assertEqual(clock_dedup_factor(unique), 1.0)
+
+    def test_sub_minute_steps_collapse_to_second_parity(self):
+        unique = enumerate_unique_clock_shift_sequences(start='10:15:00', end='10:16:59', step_seconds=1)
+        self.assertEqual(len(unique), 4)  # two minutes x even/odd second
+        self.assertEqual(clock_dedup_factor(unique), 30.0)
+        self.assertEqual(unique[0]['time'], '10:15:00')
+        self.assertEqual(unique[0]['times'][:3], ['10:15:00', '10:15:02', '10:15:04'])
+        self.assertEqual(len({tuple(u['shifts']) for u in unique}), 4)
+
+    def test_dedupe_keeps_first_seen_order_and_extra_keys(self):
+        states = [
+            {'time': 'a', 'shifts': [1, 2], 'priority': True},
+            {'time': 'b', 'shifts': [3]},
+            {'time': 'c', 'shifts': [1, 2], 'priority': False},
+        ]
+        out = dedupe_clock_shift_sequences(states)
+        self.assertEqual([s['times'] for s in out], [['a', 'c'], ['b']])
+        self.assertTrue(out[0]['priority'])
+
+    def test_sweep_tests_unique_vectors_and_reports_all_times(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            summary = run_clock_hill_attack(
+                clock_step_seconds=1,
+                keyword_eureka_threshold=5,
+                null_artifact_path=Path(tmp) / 'clock_hill.json',
+            )
+        params = summary['run_params']
+        self.assertEqual(params['total_clock_states'], 2880)
+        self.assertEqual(params['clock_dedup_factor'], 30.0)
+        for cand in summary['best_candidates']:
+            self.assertEqual(len(cand['clock_times']), 30)
+            self.assertIn(cand['clock_time'], cand['clock_times'])
+
+
 if __name__ == '__main__':
     unittest.main()
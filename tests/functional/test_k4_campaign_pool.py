@@ -0,0 +1,66 @@
+import pickle
+from types import SimpleNamespace
+
+from kryptos.ciphers import vigenere_encrypt
+from kryptos.pipeline import k4_campaign
+from kryptos.pipeline.attack_generator import AttackSpec
+from kryptos.pipeline.k4_campaign import K4CampaignOrchestrator
+from kryptos.pipeline.validator import PlaintextValidator
+from kryptos.provenance.attack_log import AttackParameters
+
+PLAINTEXT = "THEBERLINCLOCKISTHEKEYTOTHEPUZZLEANDTHEANSWERLIESINTHEEASTNORTHEAST"
+KEY = "PALIMPSEST"
+CIPHERTEXT = vigenere_encrypt(PLAINTEXT, KEY)
+CRIBS = ["BERLIN", "CLOCK"]
+
+
+def _spec(key: str) -> AttackSpec:
+    return AttackSpec(
+        parameters=AttackParameters(cipher_type="vigenere", key_or_params={"key_length": len(key), "key": key}),
+        priority=1.0,
+        source="test",
+        rationale="r",
+        tags=[],
+    )
+
+
+def test_run_attack_task_returns_only_validated_hits():
+    k4_campaign._init_campaign_worker(CIPHERTEXT, CRIBS, 0.3, 0.7)
+
+    hit = k4_campaign._run_attack_task((7, "vigenere", {"key_length": len(KEY), "key": KEY}))
+    assert hit is not None
+    attack_number, confidence, plaintext, validation = hit
+    assert attack_number == 7
+    assert plaintext == PLAINTEXT
+    assert confidence >= 0.7
+    assert validation["is_valid"] is True
+
+    assert k4_campaign._run_attack_task((8, "vigenere", {"key_length": 10, "key": "WRONGKEYXY"})) is None
+    assert k4_campaign._run_attack_task((9, "unknown", {})) is None
+
+
+def test_attack_task_payload_is_small():
+    task = (1, "vigenere", {"key_length": len(KEY), "key": KEY})
+    assert len(pickle.dumps(task)) < 200
+
+
+def test_parallel_campaign_matches_serial(tmp_path):
+    queue = [_spec("WRONGKEYXY"), _spec(KEY), _spec("ABCDEFGHIJ"), _spec(KEY)]
+    results = {}
+    for workers in (1, 2):
+        orchestrator = K4CampaignOrchestrator(
+            workspace_dir=tmp_path / f"w{workers}", log_level="WARNING", max_workers=workers
+        )
+        orchestrator.cribs = CRIBS
+        orchestrator.validator = PlaintextValidator(
+            known_cribs=CRIBS, min_dictionary_score=0.3, min_confidence=0.7, log_level="WARNING"
+        )
+        orchestrator.attack_generator = SimpleNamespace(generate_comprehensive_queue=lambda **_kwargs: queue)
+        results[workers] = orchestrator.run_campaign(CIPHERTEXT, max_attacks=len(queue), max_time_seconds=120)
+
+    serial, parallel = results[1], results[2]
+    assert parallel.total_attacks == serial.total_attacks == len(queue)
+    assert parallel.successful_attacks == serial.successful_attacks == 2
+    assert sorted(c["attack_number"] for c in parallel.best_candidates) == [2, 4]
+    assert [c["plaintext"] for c in parallel.best_candidates] == [c["plaintext"] for c in serial.best_candidates]
+    assert parallel.best_candidates[0]["parameters"]["key"] == KEY
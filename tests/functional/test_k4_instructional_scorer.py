@@ -1,6 +1,13 @@
 """Tests for InstructionalScorer (K4-ATTACK-5)."""
 
+import random
+
+import pytest
+
+from kryptos.benchmarks import _linear_instructional_score
+from kryptos.k4 import scoring_instructional as si
 from kryptos.k4.scoring_instructional import (
+    INSTRUCTIONAL_VECTORS,
     combined_instructional_score,
     entropy_gate,
     instructional_score,
@@ -8,6 +15,25 @@ from kryptos.k4.scoring_instructional import (
 )
 
 
+def _random_words(count: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    words = []
+    for _ in range(count):
+        base = list(rng.choice(sorted(INSTRUCTIONAL_VECTORS)))
+        for _ in range(rng.randint(0, 2)):
+            op = rng.choice("sid")
+            pos = rng.randrange(len(base) + 1)
+            if op == "i":
+                base.insert(pos, rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ"))
+            elif base and pos < len(base):
+                if op == "s":
+                    base[pos] = rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+                else:
+                    del base[pos]
+        words.append("".join(base))
+    return words
+
+
 class TestLevenshtein:
     def test_identical(self):
         assert levenshtein("EAST", "EAST") == 0
@@ -118,3 +144,28 @@ class TestCombinedInstructionalScore:
         # Both should return floats; gated returns base only, ungated adds bonus
         assert isinstance(gated, float)
         assert isinstance(ungated, float)
+
+
+class TestDeletionIndexParity:
+    @pytest.mark.parametrize("tol", [0, 1, 2])
+    def test_match_agrees_with_linear_scan(self, tol):
+        index = si._DeletionIndex(INSTRUCTIONAL_VECTORS, tol)
+        for word in _random_words(400, seed=tol):
+            assert index.match(word) == si._fuzzy_match(word, INSTRUCTIONAL_VECTORS, tol=tol), word
+
+    def test_scores_agree_on_random_and_planted_texts(self):
+        rng = random.Random(5)
+        texts = ["".join(rng.choices("ABCDEFGHIJKLMNOPQRSTUVWXYZ", k=97)) for _ in range(5)]
+        texts += ["SLOWLYDESPARATLYTHENORTHEASTCORNERBERLINCLOCKDIGBENEATH", "WESTNRTHEASTBERLINECLOCK"]
+        for text in texts:
+            assert instructional_score(text) == _linear_instructional_score(text)
+            assert instructional_score(text, fuzzy_tol=0) == _linear_instructional_score(text, fuzzy_tol=0)
+        vocab = frozenset({"KRYPTOS", "SANBORN", "CLOCK"})
+        for text in texts:
+            kwargs = {"vocabulary": vocab, "min_word": 4, "max_word": 8}
+            assert instructional_score(text, **kwargs) == _linear_instructional_score(text, **kwargs)
+
+    def test_custom_vocabulary(self):
+        vocab = frozenset({"KRYPTOS", "SANBORN"})
+        assert instructional_score("XXKRYPTQSXX", vocabulary=vocab) > 0
+        assert instructional_score("XXXXXXXXXXX", vocabulary=vocab) == 0.0
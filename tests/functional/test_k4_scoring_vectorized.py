@@ -0,0 +1,90 @@
+"""Parity tests: vectorized n-gram backend vs the dict path in k4.scoring."""
+
+from __future__ import annotations
+
+import random
+
+import numpy as np
+import pytest
+
+from kryptos.k4 import scoring
+from kryptos.k4 import scoring_vectorized as sv
+
+K4 = "OBKRUOXOGHULBSOLIFBBWFLRVQQPRNGKSSOTWTQSJQSSEKZZWATJKLUDIAWINFBNYPVTTMZFPKWGDKZXTJCDIGKUHUAUEKCAR"
+CRIB_TEXTS = [
+    "SLOWLYDESPARATLYSLOWLYTHEREMAINSOFPASSAGEDEBRISEASTNORTHEASTBERLINCLOCK",
+    "the berlin clock stands east-northeast of the wall, tick tock",
+    "THEREISNOTHINGHEREBUTTIONTHERTHATHEREWITH",
+]
+
+
+def _random_texts(count: int, length: int, seed: int = 7) -> list[str]:
+    rng = random.Random(seed)
+    letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    return ["".join(rng.choice(letters) for _ in range(length)) for _ in range(count)]
+
+
+@pytest.fixture(autouse=True)
+def _fresh_tables():
+    sv.reset_tables()
+    yield
+    sv.reset_tables()
+
+
+class TestEncoding:
+    def test_encode_drops_non_letters_and_uppercases(self):
+        assert sv.decode(sv.encode_text("a-b c!")) == "ABC"
+
+    def test_encode_batch_rejects_ragged(self):
+        with pytest.raises(ValueError):
+            sv.encode_batch(["ABC", "ABCD"])
+
+    def test_non_ascii_letters_score_as_unknown(self):
+        text = "BERLÉINCLOCK"
+        assert sv.combined_plaintext_score_vec(text) == scoring.combined_plaintext_score(text)
+
+
+class TestParity:
+    @pytest.mark.parametrize("text", _random_texts(25, 97) + [K4] + CRIB_TEXTS)
+    def test_component_scores_identical(self, text):
+        codes = sv.encode_text(text)
+        assert sv.ngram_score_encoded(codes, 2) == scoring.bigram_score(text)
+        assert sv.ngram_score_encoded(codes, 3) == scoring.trigram_score(text)
+        assert sv.ngram_score_encoded(codes, 4) == scoring.quadgram_score(text)
+        assert sv.chi_square_encoded(codes) == scoring.chi_square_stat(text)
+        assert sv.combined_score_encoded(codes) == scoring.combined_plaintext_score(text)
+
+    @pytest.mark.parametrize("text", ["", "A", "AB", "ABC"])
+    def test_short_texts(self, text):
+        assert sv.combined_plaintext_score_vec(text) == scoring.combined_plaintext_score(text)
+
+    def test_batch_matches_per_text(self):
+        texts = _random_texts(40, 97, seed=11) + [K4]
+        batch = sv.encode_batch(texts)
+        scores = sv.combined_score_batch(batch)
+        assert scores.shape == (len(texts),)
+        expected = np.array([scoring.combined_plaintext_score(t) for t in texts])
+        assert np.array_equal(scores, expected)
+
+    def test_tables_follow_scoring_dicts(self):
+        text = "THEREISNOTHINGHERE"
+        saved = dict(scoring.QUADGRAMS)
+        try:
+            scoring.QUADGRAMS.clear()
+            sv.reset_tables()
+            assert sv.combined_plaintext_score_vec(text) == scoring.combined_plaintext_score(text)
+        finally:
+            scoring.QUADGRAMS.update(saved)
+
+
+class TestSharedTables:
+    def test_attached_tables_score_identically(self):
+        shm, spec = sv.share_tables()
+        try:
+            tables = sv.attach_tables(spec)
+            codes = sv.encode_text(K4)
+            assert sv.combined_score_encoded(codes, tables) == scoring.combined_plaintext_score(K4)
+            assert not tables.quadgram.flags.writeable
+        finally:
+            shm.close()
+            shm.unlink()
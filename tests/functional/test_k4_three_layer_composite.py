@@ -269,3 +269,71 @@ class TestCIATimestamps:
         # First two callbacks should be priority states
         assert calls[0]["is_priority"] is True
         assert calls[1]["is_priority"] is True
+
+
+# ---------------------------------------------------------------------------
+# Process-pool executor
+# ---------------------------------------------------------------------------
+class TestShardedExecutor:
+    """workers > 1 must reproduce the serial sweep exactly (results, ties, progress)."""
+
+    @staticmethod
+    def _near_miss_ct() -> str:
+        from kryptos.k4.transposition_analysis import apply_columnar_permutation_encrypt
+
+        plain = ("THEEASTCLOCKISEASTOFTHEWALLANDTHECLOCKREADSEAST" * 3)[:97]
+        return apply_columnar_permutation_encrypt(plain, 5, [0, 1, 2, 3, 4])
+
+    def _params(self, tmp_path: Path) -> dict:
+        return dict(
+            ciphertext=self._near_miss_ct(),
+            subst_alphabets={"STANDARD": STANDARD, "KRYPTOS": KRYPTOS_ALPHA},
+            grid_sizes=[5],
+            clock_step_seconds=7200,
+            priority_clock_times=[],
+            max_perms_per_grid=24,
+            null_artifact_path=tmp_path / "null.json",
+            eureka_snapshot_path=tmp_path / "snap.md",
+        )
+
+    @staticmethod
+    def _comparable(summary: dict) -> dict:
+        params = {k: v for k, v in summary["run_params"].items() if k != "ts_start"}
+        return {"run_params": params, "best_candidates": summary["best_candidates"]}
+
+    def test_workers_match_serial(self, tmp_path):
+        serial_calls: list[dict] = []
+        pooled_calls: list[dict] = []
+        serial = run_three_layer_composite(**self._params(tmp_path), progress_cb=serial_calls.append)
+        pooled = run_three_layer_composite(**self._params(tmp_path), workers=3, progress_cb=pooled_calls.append)
+        assert len(serial["best_candidates"]) == 10
+        assert self._comparable(pooled) == self._comparable(serial)
+        assert pooled_calls == serial_calls
+
+    def test_artifact_shape_unchanged(self, tmp_path):
+        params = self._params(tmp_path)
+        run_three_layer_composite(**params, workers=2)
+        data = json.loads(Path(params["null_artifact_path"]).read_text())
+        assert set(data) == {"status", "timestamp", "run_params", "best_candidates", "null_artifact_path"}
+
+    def test_best_candidates_ranked(self, tmp_path):
+        result = run_three_layer_composite(**self._params(tmp_path), workers=2)
+        keys = [(-c["keyword_hits"], -c["instructional_score"]) for c in result["best_candidates"]]
+        assert keys == sorted(keys)
+
+    def test_eureka_from_worker(self, tmp_path):
+        ct = TestEurekaTrigger()._make_ct()
+        with pytest.raises(EurekaSignal) as exc_info:
+            run_three_layer_composite(
+                ciphertext=ct,
+                subst_alphabets={"STANDARD": STANDARD},
+                grid_sizes=[5],
+                clock_step_seconds=43200,
+                priority_clock_times=[],
+                max_perms_per_grid=5,
+                null_artifact_path=tmp_path / "null.json",
+                eureka_snapshot_path=tmp_path / "snap.md",
+                workers=2,
+            )
+        assert exc_info.value.result["key_info"]["clock_time"] == "00:00:00"
+        assert Path(exc_info.value.snapshot_path).exists()
@@ -0,0 +1,87 @@
+"""Tests for incremental (delta) scoring in the columnar SA / hill-climb solvers."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from kryptos.benchmarks import compare_sa_delta_scoring
+from kryptos.k4 import transposition_analysis as ta
+
+K4 = "OBKRUOXOGHULBSOLIFBBWFLRVQQPRNGKSSOTWTQSJQSSEKZZWATJKLUDIAWINFBNYPVTTMZFPKWGDKZXTJCDIGKUHUAUEKCAR"
+
+
+def _full_score(text: str, period: int, perm: list[int]) -> float:
+    return ta.score_combined(ta.apply_columnar_permutation_reverse(text, period, perm))
+
+
+class TestColumnarDeltaState:
+    @pytest.mark.parametrize("period", [2, 3, 5, 7, 8, 10, 13])
+    def test_random_swaps_match_full_rescore(self, period):
+        rng = random.Random(period)
+        perm = list(range(period))
+        rng.shuffle(perm)
+        state = ta.ColumnarDeltaState(K4, period, perm)
+        assert state.score == pytest.approx(_full_score(K4, period, perm), abs=1e-12)
+        for _ in range(300):
+            i, j = rng.sample(range(period), 2)
+            proposed = state.propose_swap(i, j)
+            assert proposed == pytest.approx(_full_score(K4, period, state.perm), abs=1e-12)
+            assert state.plaintext() == ta.apply_columnar_permutation_reverse(K4, period, state.perm)
+            if rng.random() < 0.5:
+                state.commit()
+            else:
+                state.rollback()
+            assert state.score == pytest.approx(_full_score(K4, period, state.perm), abs=1e-12)
+
+    def test_rollback_restores_buffer_and_perm(self):
+        state = ta.ColumnarDeltaState(K4, 7, [3, 0, 5, 1, 6, 2, 4])
+        before = (state.plaintext(), list(state.perm), state.score)
+        state.propose_swap(0, 6)
+        state.rollback()
+        assert (state.plaintext(), state.perm, state.score) == before
+
+    def test_pending_proposal_must_be_resolved(self):
+        state = ta.ColumnarDeltaState(K4, 5, [0, 1, 2, 3, 4])
+        state.propose_swap(0, 1)
+        with pytest.raises(RuntimeError):
+            state.propose_swap(1, 2)
+
+
+class TestSolversUseDeltaScoring:
+    def test_sa_same_result_as_full_rescore(self):
+        kwargs = dict(max_iterations=4000, initial_temp=50.0, cooling_rate=0.9999)
+        full = ta.solve_columnar_permutation_simulated_annealing(
+            K4, 7, rng=random.Random(3), incremental=False, **kwargs
+        )
+        delta = ta.solve_columnar_permutation_simulated_annealing(K4, 7, rng=random.Random(3), **kwargs)
+        assert delta[0] == full[0]
+        assert delta[1] == pytest.approx(full[1], abs=1e-9)
+
+    def test_multi_start_same_result_as_full_rescore(self):
+        full = ta.solve_columnar_permutation_multi_start(
+            K4, 6, num_restarts=2, max_iterations=1500, rng=random.Random(4), incremental=False
+        )
+        delta = ta.solve_columnar_permutation_multi_start(K4, 6, num_restarts=2, max_iterations=1500, rng=random.Random(4))
+        assert delta[0] == full[0]
+        assert delta[1] == pytest.approx(full[1], abs=1e-9)
+
+    def test_monkeypatched_scorer_falls_back_to_full_rescore(self, monkeypatch):
+        calls = {"n": 0}
+
+        def _score(text: str) -> float:
+            calls["n"] += 1
+            return 0.0
+
+        monkeypatch.setattr(ta, "score_combined", _score)
+        ta.solve_columnar_permutation_simulated_annealing(K4, 5, max_iterations=10, rng=random.Random(0))
+        assert calls["n"] == 11
+
+
+def test_compare_sa_delta_scoring_reports_both_paths():
+    result = compare_sa_delta_scoring(period=7, iterations=2000, seed=5)
+    assert result["equal_final_scores"]
+    assert result["full"]["best_perm"] == result["delta"]["best_perm"]
+    assert result["delta"]["iterations_per_sec"] > 0
+    assert result["speedup"] is not None
@@ -0,0 +1,88 @@
+"""Import-path regression tests: `kryptos` / `kryptos.k4` stay lazy, n-gram tables load on first use."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import textwrap
+
+# Cumulative `-X importtime` budget for `import kryptos.k4` (microseconds). Generous so slow
+# CI machines pass; an eager import of scoring/transposition would blow past it anyway.
+K4_IMPORT_BUDGET_US = 250_000
+
+_AUDIT_NGRAM_OPENS = """
+import sys
+opened = []
+sys.addaudithook(
+    lambda event, args: opened.append(str(args[0]))
+    if event == "open" and isinstance(args[0], str) and "ngrams" in args[0] else None
+)
+"""
+
+
+def _run(code: str, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", textwrap.dedent(code)],
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=120,
+    )
+
+
+def _importtime(module: str) -> dict[str, int]:
+    """Map module name -> cumulative import time (us) from `python -X importtime`."""
+    proc = _run(f"import {module}", "-X", "importtime")
+    cumulative = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self_us, cum_us, name = (part.strip() for part in line[len("import time:") :].split("|"))
+        cumulative[name] = int(cum_us)
+    return cumulative
+
+
+def test_cli_import_reads_no_ngram_tables():
+    proc = _run(_AUDIT_NGRAM_OPENS + "import kryptos.cli.main\nprint(len(opened))")
+    assert proc.stdout.strip() == "0"
+
+
+def test_scoring_tables_load_on_first_use():
+    proc = _run(
+        _AUDIT_NGRAM_OPENS
+        + """
+from kryptos.k4 import scoring
+before = len(opened)
+scoring.quadgram_score("BERLINCLOCK")
+print(before, any("quadgrams" in path for path in opened))
+"""
+    )
+    assert proc.stdout.split() == ["0", "True"]
+
+
+def test_package_imports_stay_lazy():
+    proc = _run(
+        """
+import sys
+import kryptos.k4
+print(sorted(m for m in sys.modules if m.startswith("kryptos")))
+"""
+    )
+    assert proc.stdout.strip() == "['kryptos', 'kryptos.k4']"
+
+
+def test_k4_import_within_budget():
+    times = _importtime("kryptos.k4")
+    assert times["kryptos.k4"] < K4_IMPORT_BUDGET_US
+    assert not {"kryptos.k4.scoring", "kryptos.k4.transposition", "kryptos.ciphers"} & set(times)
+
+
+def test_lazy_exports_resolve():
+    import kryptos
+    from kryptos import k4
+
+    assert kryptos.k4_decrypt_best is k4.decrypt_best
+    assert kryptos.vigenere_decrypt("", "KEY") == ""
+    assert k4.scoring.__name__ == "kryptos.k4.scoring"
+    assert k4.adfgvx_encrypt is k4.adfgvx.adfgvx_encrypt
+    assert {"k4_decrypt_best", "check_cribs"} <= set(dir(kryptos))
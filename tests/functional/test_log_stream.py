@@ -2,6 +2,8 @@
 
 import asyncio
 import logging
+import threading
+import time
 
 from fastapi.testclient import TestClient
 
@@ -40,6 +42,33 @@ def test_log_buffer_tail_and_since():
     assert buf.since(buf.latest_seq()) == []
 
 
+def test_log_buffer_since_cursor_edges():
+    buf = LogBuffer(capacity=4)
+    for i in range(10):
+        buf.append(str(i))
+
+    # A cursor older than the ring returns everything still held.
+    assert [line for _seq, line in buf.since(0)] == ["6", "7", "8", "9"]
+    assert [seq for seq, _line in buf.since(7)] == [8, 9, 10]
+    assert buf.since(10) == []
+    assert buf.since(99) == []
+
+
+def test_log_buffer_wait_wakes_on_append_from_thread():
+    buf = LogBuffer()
+
+    async def scenario():
+        threading.Timer(0.05, buf.append, args=("late",)).start()
+        t0 = time.monotonic()
+        woke = await buf.wait(0, timeout=5.0)
+        return woke, time.monotonic() - t0
+
+    woke, elapsed = _run(scenario())
+    assert woke and elapsed < 1.0
+    assert _run(buf.wait(0, timeout=0.01)) is True  # already newer than the cursor
+    assert _run(buf.wait(buf.latest_seq(), timeout=0.01)) is False
+
+
 # --- Handler ------------------------------------------------------------------
 
 
@@ -121,3 +150,37 @@ def test_http_stream_backlog(tmp_path):
     assert resp.status_code == 200
     assert resp.headers["content-type"].startswith("text/event-stream")
     assert "data: CAMPAIGN started" in resp.text
+
+
+def test_stream_load_100_concurrent_clients():
+    """100 followers on one buffer each get every line, woken by appends (no timer polling)."""
+    buf = LogBuffer(capacity=1000)
+    n_clients, n_lines = 100, 500
+
+    async def never_disconnected():
+        return False
+
+    async def client():
+        stream = log_event_stream(never_disconnected, backlog=0, buffer=buf, poll_interval=60.0)
+        return await _collect(stream, limit=n_lines)
+
+    def producer():
+        for i in range(n_lines):
+            buf.append(f"line {i}")
+            if i % 50 == 0:
+                time.sleep(0.005)
+
+    async def scenario():
+        tasks = [asyncio.create_task(client()) for _ in range(n_clients)]
+        await asyncio.sleep(0.05)  # let every client reach buf.wait()
+        t0 = time.monotonic()
+        await asyncio.to_thread(producer)
+        results = await asyncio.wait_for(asyncio.gather(*tasks), timeout=10.0)
+        return results, time.monotonic() - t0
+
+    results, elapsed = _run(scenario())
+    expected = [_format_sse(f"line {i}") for i in range(n_lines)]
+    assert all(frames == expected for frames in results)
+    # poll_interval is 60 s, so finishing quickly means the streams were woken by appends.
+    assert elapsed < 5.0
+    assert buf._waiters == {}
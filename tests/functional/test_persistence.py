@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import json
 import os
+import time
 
 import pytest
 
+from kryptos import persistence
 from kryptos.persistence import db_enabled, fetch_recent_runs, fetch_run_candidates, persist_campaign_candidates
 
 SAMPLE_CANDIDATES = [
@@ -51,6 +53,60 @@ class TestReportingIntegration:
         assert "db_run_id" not in paths
 
 
+class _FakeCursor:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.last_sql = sql
+
+    def fetchone(self):
+        return (7,)
+
+
+class _FakeConn:
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def cursor(self):
+        return self._cursor
+
+
+class TestBatchedInsert:
+    def test_candidates_sent_as_one_batched_insert(self, monkeypatch):
+        import psycopg2.extras
+
+        import kryptos.db as db
+
+        monkeypatch.setenv("DATABASE_URL", "postgresql://fake")
+        monkeypatch.setattr(db, "get_conn", lambda: _FakeConn(_FakeCursor()))
+        calls = []
+        monkeypatch.setattr(
+            psycopg2.extras, "execute_values", lambda cur, sql, rows, **kw: calls.append((sql, list(rows), kw))
+        )
+
+        run_id = persist_campaign_candidates("stage1", "K4", "OBKR", SAMPLE_CANDIDATES)
+
+        assert run_id == 7
+        assert len(calls) == 1
+        sql, rows, kw = calls[0]
+        assert sql.startswith("INSERT INTO candidates") and sql.endswith("VALUES %s")
+        assert kw["page_size"] == persistence.CANDIDATE_BATCH_SIZE
+        assert [r[1] for r in rows] == [1, 2]
+        assert rows[0][0] == 7 and rows[0][6] == "EASTNORTHEAST"
+        assert json.loads(rows[0][4]) == [[1, 2], [3, 4]] and rows[0][5] is not None
+        assert rows[1][4] is None and rows[1][5] is None
+
+
 @pytest.mark.skipif(not os.environ.get("DATABASE_URL"), reason="DATABASE_URL not set")
 class TestLivePersistence:
     @pytest.fixture(autouse=True)
@@ -97,3 +153,16 @@ class TestLivePersistence:
         ]
         run_id = persist_campaign_candidates("__pers_test__", "__pers_test__", "OBKR", many, limit=3)
         assert len(fetch_run_candidates(run_id)) == 3
+
+    def test_bulk_insert_throughput(self, capsys):
+        n = 20_000
+        many = [
+            {"score": -float(i), "source": "q3", "key": [[i % 26, 1], [2, 3]], "text": f"__pers_test__{i}"}
+            for i in range(n)
+        ]
+        start = time.perf_counter()
+        run_id = persist_campaign_candidates("__pers_test__", "__pers_test__", "OBKR", many, limit=n)
+        elapsed = time.perf_counter() - start
+        assert len(fetch_run_candidates(run_id, limit=n)) == n
+        with capsys.disabled():
+            print(f"\npersist_campaign_candidates: {n} rows in {elapsed:.2f}s ({n / elapsed:,.0f} rows/sec)")
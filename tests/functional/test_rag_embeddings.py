@@ -0,0 +1,125 @@
+"""Batched, cached embedding pipeline (no model download: a local stub encoder)."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from kryptos.rag.embeddings import EmbeddingCache, iter_embedding_batches
+from kryptos.rag.index import EMBED_CACHE_NAME, ArtifactIndex
+
+DIM = 8
+
+
+class StubEncoder:
+    """Deterministic 8-dim vectors derived from the text's bytes; records each call."""
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    def __call__(self, texts: list[str]) -> np.ndarray:
+        self.calls.append(list(texts))
+        out = np.zeros((len(texts), DIM), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for i, byte in enumerate(text.encode()):
+                out[row, i % DIM] += byte
+        return out
+
+    @property
+    def encoded(self) -> list[str]:
+        return [text for call in self.calls for text in call]
+
+
+def test_batches_are_bounded_and_lazy():
+    encoder = StubEncoder()
+    texts = (f"chunk {i}" for i in range(10))
+    batches = iter_embedding_batches(texts, "stub", batch_size=4, encode=encoder)
+
+    first = next(batches)
+    assert first.shape == (4, DIM)
+    assert encoder.calls == [["chunk 0", "chunk 1", "chunk 2", "chunk 3"]]
+    assert [b.shape[0] for b in batches] == [4, 2]
+    assert max(len(call) for call in encoder.calls) == 4
+
+
+def test_batch_size_must_be_positive():
+    with pytest.raises(ValueError):
+        list(iter_embedding_batches(["x"], "stub", batch_size=0, encode=StubEncoder()))
+
+
+def test_cache_skips_repeated_and_known_texts(tmp_path):
+    cache = EmbeddingCache(tmp_path / "cache.sqlite")
+    encoder = StubEncoder()
+    texts = ["boilerplate footer", "result A", "boilerplate footer", "result B"]
+
+    cached = np.vstack(list(iter_embedding_batches(texts, "stub", batch_size=3, cache=cache, encode=encoder)))
+    plain = np.vstack(list(iter_embedding_batches(texts, "stub", encode=StubEncoder())))
+
+    np.testing.assert_array_equal(cached, plain)
+    assert sorted(encoder.encoded) == ["boilerplate footer", "result A", "result B"]
+    assert len(cache) == 3
+
+    encoder.calls.clear()
+    list(iter_embedding_batches(texts, "stub", cache=cache, encode=encoder))
+    assert encoder.calls == []
+
+
+def test_cache_is_keyed_by_model_and_persists(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    EmbeddingCache(path).put_many({EmbeddingCache.key("text", "model-a"): np.ones(DIM, dtype=np.float32)})
+
+    reopened = EmbeddingCache(path)
+    assert EmbeddingCache.key("text", "model-a") != EmbeddingCache.key("text", "model-b")
+    hits = reopened.get_many([EmbeddingCache.key("text", "model-a"), EmbeddingCache.key("text", "model-b")])
+    assert list(hits) == [EmbeddingCache.key("text", "model-a")]
+    np.testing.assert_array_equal(hits[EmbeddingCache.key("text", "model-a")], np.ones(DIM))
+
+
+def test_full_rebuild_reuses_cached_vectors(tmp_path):
+    pytest.importorskip("turbovec")
+    artifacts_root = tmp_path / "artifacts"
+    artifacts_root.mkdir()
+    for i in range(5):
+        (artifacts_root / f"report_{i}.md").write_text(f"Report {i}: no eureka this run.", encoding="utf-8")
+    (artifacts_root / "copy.md").write_text("Report 0: no eureka this run.", encoding="utf-8")
+
+    encoder = StubEncoder()
+    index = ArtifactIndex(index_dir=tmp_path / "index", embedder=encoder, model_name="stub", batch_size=2)
+    index.build(artifacts_root)
+
+    assert len(encoder.encoded) == 5  # copy.md duplicates report_0.md
+    assert max(len(call) for call in encoder.calls) <= 2
+    assert (tmp_path / "index" / EMBED_CACHE_NAME).exists()
+
+    encoder.calls.clear()
+    status = index.build(artifacts_root)
+    assert encoder.calls == []
+    assert status["chunk_count"] == 6
+    assert {r.path for r in index.search("Report", k=6)} == {"copy.md", *(f"report_{i}.md" for i in range(5))}
+
+
+def test_failed_incremental_batch_is_rolled_back(tmp_path):
+    pytest.importorskip("turbovec")
+    artifacts_root = tmp_path / "artifacts"
+    artifacts_root.mkdir()
+    (artifacts_root / "a.md").write_text("first report", encoding="utf-8")
+    encoder = StubEncoder()
+    index = ArtifactIndex(index_dir=tmp_path / "index", embedder=encoder, model_name="stub", batch_size=1)
+    index.build(artifacts_root)
+
+    for name in ("b.md", "c.md"):
+        (artifacts_root / name).write_text(f"{name} report", encoding="utf-8")
+
+    def flaky(texts):
+        if "c.md report" in texts:
+            raise RuntimeError("encoder crashed")
+        return encoder(texts)
+
+    index._embedder = flaky
+    with pytest.raises(RuntimeError):
+        index.reindex(artifacts_root)
+    assert [r.path for r in index.search("report", k=5)] == ["a.md"]
+
+    index._embedder = encoder
+    assert index.reindex(artifacts_root)["added"] == 2
+    assert {r.path for r in index.search("report", k=5)} == {"a.md", "b.md", "c.md"}
@@ -0,0 +1,172 @@
+"""Incremental RAG reindexing against a deterministic stub embedder."""
+
+from __future__ import annotations
+
+import json
+import os
+import zlib
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from kryptos.api.app import create_app
+from kryptos.rag.index import ArtifactIndex
+
+pytest.importorskip("turbovec")
+
+DIM = 64
+
+
+class TrigramEmbedder:
+    """Hashes character trigrams into a fixed-size unit vector; records what it embedded."""
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    def __call__(self, texts: list[str]) -> np.ndarray:
+        self.calls.append(list(texts))
+        out = np.zeros((len(texts), DIM), dtype=np.float32)
+        for row, text in enumerate(texts):
+            lowered = text.lower()
+            for i in range(len(lowered) - 2):
+                out[row, zlib.crc32(lowered[i : i + 3].encode()) % DIM] += 1.0
+            norm = np.linalg.norm(out[row])
+            if norm:
+                out[row] /= norm
+        return out
+
+    @property
+    def embedded(self) -> list[str]:
+        return [text for call in self.calls for text in call]
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+@pytest.fixture
+def artifacts_root(tmp_path):
+    root = tmp_path / "artifacts"
+    _write(root / "decisions" / "a.json", json.dumps({"hypothesis": "Hill cipher 2x2 key matrix"}))
+    _write(root / "notes.md", "Berlin Clock lamp counts as transposition column widths.")
+    _write(root / "reports" / "run.md", "Vigenere sweep over KRYPTOS keyed alphabet finished.")
+    return root
+
+
+def _index(tmp_path, embedder):
+    return ArtifactIndex(index_dir=tmp_path / "index", embedder=embedder, model_name="stub-trigram")
+
+
+def test_reindex_without_changes_embeds_nothing(tmp_path, artifacts_root):
+    embedder = TrigramEmbedder()
+    index = _index(tmp_path, embedder)
+    first = index.reindex(artifacts_root)
+    assert (first["full"], first["added"], first["chunks_embedded"]) == (True, 3, 3)
+
+    embedder.calls.clear()
+    again = index.reindex(artifacts_root)
+    assert again == {**again, "full": False, "unchanged": 3, "chunks_embedded": 0}
+    assert embedder.calls == []
+
+
+def test_only_changed_and_added_files_are_embedded(tmp_path, artifacts_root):
+    embedder = TrigramEmbedder()
+    index = _index(tmp_path, embedder)
+    index.reindex(artifacts_root)
+    embedder.calls.clear()
+
+    _write(artifacts_root / "notes.md", "Quagmire tableau with PALIMPSEST primary key.")
+    _write(artifacts_root / "reports" / "new.md", "Double transposition with route cipher tail.")
+    changes = index.reindex(artifacts_root)
+
+    assert (changes["changed"], changes["added"], changes["unchanged"]) == (1, 1, 2)
+    assert sorted(embedder.embedded) == sorted(
+        ["Quagmire tableau with PALIMPSEST primary key.", "Double transposition with route cipher tail."]
+    )
+    assert index.search("Quagmire tableau PALIMPSEST", k=1)[0].path == "notes.md"
+    assert all("Berlin Clock" not in r.text for r in index.search("Berlin Clock lamp", k=10))
+    assert index.status()["chunk_count"] == 4
+
+
+def test_touched_but_identical_file_is_not_reembedded(tmp_path, artifacts_root):
+    embedder = TrigramEmbedder()
+    index = _index(tmp_path, embedder)
+    index.reindex(artifacts_root)
+    embedder.calls.clear()
+
+    notes = artifacts_root / "notes.md"
+    st = notes.stat()
+    os.utime(notes, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+    changes = index.reindex(artifacts_root)
+
+    assert (changes["changed"], changes["unchanged"], changes["chunks_embedded"]) == (0, 3, 0)
+    assert embedder.calls == []
+
+
+def test_removed_file_drops_its_vectors(tmp_path, artifacts_root):
+    index = _index(tmp_path, TrigramEmbedder())
+    index.reindex(artifacts_root)
+
+    (artifacts_root / "reports" / "run.md").unlink()
+    changes = index.reindex(artifacts_root)
+
+    assert changes["removed"] == 1
+    assert index.status()["file_count"] == 2
+    assert {r.path for r in index.search("Vigenere sweep KRYPTOS", k=10)} == {"decisions/a.json", "notes.md"}
+
+
+def test_manifest_survives_reload(tmp_path, artifacts_root):
+    _index(tmp_path, TrigramEmbedder()).reindex(artifacts_root)
+    _write(artifacts_root / "notes.md", "Period-7 Gronsfeld digits from the clock face.")
+
+    embedder = TrigramEmbedder()
+    reloaded = _index(tmp_path, embedder)
+    assert reloaded.load() is True
+    changes = reloaded.reindex(artifacts_root)
+
+    assert (changes["full"], changes["changed"], changes["unchanged"]) == (False, 1, 2)
+    assert embedder.embedded == ["Period-7 Gronsfeld digits from the clock face."]
+    assert reloaded.search("Gronsfeld clock face", k=1)[0].path == "notes.md"
+
+
+def test_model_change_forces_full_rebuild(tmp_path, artifacts_root):
+    _index(tmp_path, TrigramEmbedder()).reindex(artifacts_root)
+
+    other = ArtifactIndex(index_dir=tmp_path / "index", embedder=TrigramEmbedder(), model_name="stub-other")
+    changes = other.reindex(artifacts_root)
+    assert (changes["full"], changes["chunks_embedded"]) == (True, 3)
+    assert other.status()["model"] == "stub-other"
+
+
+def test_reindex_endpoint_runs_in_background(tmp_path, artifacts_root, monkeypatch):
+    monkeypatch.setattr("kryptos.rag.index.get_artifacts_root", lambda: artifacts_root)
+    index = _index(tmp_path, TrigramEmbedder())
+    client = TestClient(create_app(index=index))
+
+    resp = client.post("/api/rag/reindex")
+    assert resp.status_code == 202
+    assert resp.json()["started"] is True
+    state = index.wait_for_reindex(timeout=30)
+
+    assert state["state"] == "idle"
+    assert state["changes"]["added"] == 3
+    status = client.get("/api/rag/status").json()
+    assert status["indexed"] is True and status["file_count"] == 3
+    assert status["reindex"]["finished_at"]
+    results = client.get("/api/rag/search", params={"q": "Hill cipher matrix", "k": 1}).json()["results"]
+    assert results[0]["path"] == "decisions/a.json"
+
+
+def test_failed_background_reindex_reports_error(tmp_path, artifacts_root):
+    def broken(_texts):
+        raise RuntimeError("embedder offline")
+
+    index = _index(tmp_path, broken)
+    assert index.start_reindex(artifacts_root) is True
+    state = index.wait_for_reindex(timeout=30)
+
+    assert state["state"] == "error"
+    assert state["error"] == "embedder offline"
+    assert index.status() == {"indexed": False, "reindex": state}
@@ -0,0 +1,67 @@
+"""Early-abort quadgram scoring and the top-K ranking built on it."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from kryptos.k4 import scoring
+from kryptos.k4.scoring import QuadgramTopK, quadgram_score, score_at_least
+
+
+def _texts(count: int, seed: int = 7) -> list[str]:
+    rng = random.Random(seed)
+    pool = "ETAOINSHRDLUTIONTHEANDINGCKBERLIN"
+    return ["".join(rng.choice(pool) for _ in range(rng.randint(0, 110))) for _ in range(count)]
+
+
+class CountingTable(dict):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lookups = 0
+
+    def get(self, key, default=None):
+        self.lookups += 1
+        return super().get(key, default)
+
+
+@pytest.mark.parametrize("threshold", [-1e9, -350.0, -200.0, -50.0, 0.0, 25.0, 1e9])
+def test_matches_quadgram_score_or_rejects(threshold):
+    for text in _texts(300):
+        exact = quadgram_score(text)
+        got = score_at_least(text, threshold)
+        if exact >= threshold:
+            assert got == exact  # bit-identical, not approximately equal
+        else:
+            assert got is None
+
+
+def test_threshold_equal_to_score_passes():
+    text = "THEBERLINCLOCKTELLSTHETIMEINTHENORTHEAST"
+    exact = quadgram_score(text)
+    assert score_at_least(text, exact) == exact
+    assert score_at_least("ABC", 0.0) == 0.0
+    assert score_at_least("ABC", 0.5) is None
+
+
+def test_hopeless_text_stops_early(monkeypatch):
+    table = CountingTable({"THEM": -1.0, "TION": -1.5})
+    monkeypatch.setattr(scoring, "QUADGRAMS", table)
+    text = "Q" * 100  # every quadgram unknown
+    assert score_at_least(text, -150.0) is None
+    assert 0 < table.lookups < len(text) - 3
+    table.lookups = 0
+    assert score_at_least(text, quadgram_score(text)) == quadgram_score(text)
+
+
+def test_top_k_matches_full_scoring_with_ties():
+    texts = _texts(400, seed=11) + ["THENORTHEAST"] * 3
+    early, full = QuadgramTopK(5), QuadgramTopK(5, early_abort=False)
+    for i, text in enumerate(texts):
+        early.offer(text, {"i": i})
+        full.offer(text, {"i": i})
+    expected = sorted(range(len(texts)), key=lambda i: (-quadgram_score(texts[i]), i))[:5]
+    assert [r["i"] for r in early.results()] == expected
+    assert early.results() == full.results()
+    assert QuadgramTopK(0).offer("ANYTHING", {}) is None
@@ -2,7 +2,18 @@
 
 from __future__ import annotations
 
+import json
+import multiprocessing
+import os
+import signal
+import time
+
+import pytest
+
+from kryptos.provenance import search_space
 from kryptos.provenance.search_space import (
+    JOURNAL_FILENAME,
+    SNAPSHOT_FILENAME,
     KeySpaceRegion,
     SearchSpaceTracker,
 )
@@ -348,3 +359,115 @@ class TestIntegration:
         assert "vigenere" in report["cipher_types"]
         assert "hill" in report["cipher_types"]
         assert "transposition" in report["cipher_types"]
+
+
+def _explore_forever(cache_dir, acked, compact_every):
+    tracker = SearchSpaceTracker(cache_dir=cache_dir, compact_every=compact_every)
+    tracker.register_region("vigenere", "length_5", {"key_length": 5}, 10**6)
+    while True:
+        tracker.record_exploration("vigenere", "length_5", count=1, successful=1)
+        with acked.get_lock():
+            acked.value += 1
+
+
+class TestDeltaJournal:
+    """Snapshot + append-only journal persistence."""
+
+    def test_deltas_replayed_across_instances(self, tmp_path):
+        tracker = SearchSpaceTracker(cache_dir=tmp_path)
+        tracker.register_region("vigenere", "length_5", {"key_length": 5}, 1000)
+        tracker.record_exploration("vigenere", "length_5", count=7, successful=2)
+        tracker.record_exploration("hill", "2x2", count=3)
+
+        assert not (tmp_path / SNAPSHOT_FILENAME).exists()
+        assert len((tmp_path / JOURNAL_FILENAME).read_text(encoding="utf-8").splitlines()) == 4
+
+        reloaded = SearchSpaceTracker(cache_dir=tmp_path)
+        region = reloaded.regions["vigenere"]["length_5"]
+        assert (region.total_size, region.explored_count, region.successful_count) == (1000, 7, 2)
+        assert reloaded.regions["hill"]["2x2"].explored_count == 3
+
+    def test_compaction_writes_snapshot_and_truncates_journal(self, tmp_path):
+        tracker = SearchSpaceTracker(cache_dir=tmp_path, compact_every=5)
+        for _ in range(12):
+            tracker.record_exploration("vigenere", "length_5", count=1)
+
+        snapshot = json.loads((tmp_path / SNAPSHOT_FILENAME).read_text(encoding="utf-8"))
+        assert snapshot["journal_seq"] == 10
+        assert snapshot["regions"]["vigenere"]["length_5"]["explored_count"] == 9
+        assert len((tmp_path / JOURNAL_FILENAME).read_text(encoding="utf-8").splitlines()) == 3
+        assert not (tmp_path / (SNAPSHOT_FILENAME + ".tmp")).exists()
+        assert SearchSpaceTracker(cache_dir=tmp_path).regions["vigenere"]["length_5"].explored_count == 12
+
+    def test_crash_before_journal_truncate_does_not_double_count(self, tmp_path):
+        tracker = SearchSpaceTracker(cache_dir=tmp_path, compact_every=1000)
+        tracker.record_exploration("vigenere", "length_5", count=4)
+        journal = (tmp_path / JOURNAL_FILENAME).read_bytes()
+        tracker.compact()
+        # Simulate dying after the snapshot rename but before the journal was emptied.
+        (tmp_path / JOURNAL_FILENAME).write_bytes(journal)
+
+        assert SearchSpaceTracker(cache_dir=tmp_path).regions["vigenere"]["length_5"].explored_count == 4
+
+    def test_crash_during_snapshot_write_keeps_old_state(self, tmp_path, monkeypatch):
+        tracker = SearchSpaceTracker(cache_dir=tmp_path)
+        tracker.record_exploration("vigenere", "length_5", count=4)
+
+        def _die(*_args):
+            raise OSError("disk vanished")
+
+        monkeypatch.setattr(search_space.os, "replace", _die)
+        with pytest.raises(OSError):
+            tracker.compact()
+        monkeypatch.undo()
+
+        assert SearchSpaceTracker(cache_dir=tmp_path).regions["vigenere"]["length_5"].explored_count == 4
+
+    def test_torn_tail_is_dropped_and_appends_resume(self, tmp_path):
+        tracker = SearchSpaceTracker(cache_dir=tmp_path)
+        tracker.record_exploration("vigenere", "length_5", count=2)
+        with open(tmp_path / JOURNAL_FILENAME, "a", encoding="utf-8") as f:
+            f.write('{"seq": 3, "op": "explore", "cipher_type": "vig')
+
+        resumed = SearchSpaceTracker(cache_dir=tmp_path)
+        resumed.record_exploration("vigenere", "length_5", count=5)
+
+        assert SearchSpaceTracker(cache_dir=tmp_path).regions["vigenere"]["length_5"].explored_count == 7
+
+    def test_legacy_snapshot_still_loads(self, tmp_path):
+        legacy = {
+            "vigenere": {
+                "length_5": {
+                    "cipher_type": "vigenere",
+                    "parameters": {"key_length": 5},
+                    "total_size": 1000,
+                    "explored_count": 40,
+                    "successful_count": 1,
+                },
+            },
+        }
+        (tmp_path / SNAPSHOT_FILENAME).write_text(json.dumps(legacy), encoding="utf-8")
+        tracker = SearchSpaceTracker(cache_dir=tmp_path)
+        tracker.record_exploration("vigenere", "length_5", count=2)
+
+        assert SearchSpaceTracker(cache_dir=tmp_path).regions["vigenere"]["length_5"].explored_count == 42
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork to kill a writer mid-stream")
+    @pytest.mark.parametrize("compact_every", [1000, 37])
+    def test_sigkill_mid_stream_loses_nothing_acknowledged(self, tmp_path, compact_every):
+        ctx = multiprocessing.get_context("fork")
+        acked = ctx.Value("i", 0)
+        writer = ctx.Process(target=_explore_forever, args=(tmp_path, acked, compact_every))
+        writer.start()
+        deadline = time.monotonic() + 30
+        while acked.value < 400 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        os.kill(writer.pid, signal.SIGKILL)
+        writer.join()
+        assert acked.value >= 400
+
+        region = SearchSpaceTracker(cache_dir=tmp_path).regions["vigenere"]["length_5"]
+        # Every acknowledged delta survives; at most the one in flight at the kill may also have landed.
+        assert acked.value <= region.explored_count <= acked.value + 1
+        assert region.successful_count == region.explored_count
+        assert region.total_size == 10**6
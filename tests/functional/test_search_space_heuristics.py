@@ -1,8 +1,11 @@
 """Tests for cross-run memory heuristics added to SearchSpaceTracker."""
 
+import random
 from pathlib import Path
 
-from kryptos.provenance.search_space import SearchSpaceTracker, _levenshtein
+import pytest
+
+from kryptos.provenance.search_space import SearchSpaceTracker, _levenshtein, _levenshtein_bitparallel
 
 
 class TestLevenshtein:
@@ -22,6 +25,18 @@ class TestLevenshtein:
     def test_symmetric(self):
         assert _levenshtein("NORTH", "SOUTH") == _levenshtein("SOUTH", "NORTH")
 
+    def test_bitparallel_matches_dp(self):
+        rng = random.Random(3)
+        for _ in range(5000):
+            a = "".join(rng.choices("ABC", k=rng.randint(0, 12)))
+            b = "".join(rng.choices("ABC", k=rng.randint(0, 12)))
+            assert _levenshtein_bitparallel(a, b) == _levenshtein(a, b), (a, b)
+
+    def test_bitparallel_long_keys(self):
+        a = "KRYPTOS" * 20
+        b = "KRYPTOX" * 19 + "ABSCISSA"
+        assert _levenshtein_bitparallel(a, b) == _levenshtein(a, b)
+
 
 class TestAlreadyTriedFuzzy:
     def _tracker(self, tmp_path: Path) -> SearchSpaceTracker:
@@ -66,6 +81,30 @@ class TestAlreadyTriedFuzzy:
         # "KRYPTOS" is 6 edits from "A" — must NOT match with tol=1
         assert t.already_tried_fuzzy("vigenere", "KRYPTOS", tol=1) is False
 
+    @pytest.mark.parametrize("tol", [1, 2, 3, 5])
+    def test_matches_brute_force(self, tmp_path, tol):
+        rng = random.Random(tol)
+        t = self._tracker(tmp_path)
+        tried = ["".join(rng.choices("ABCDEF", k=rng.randint(3, 9))) for _ in range(400)]
+        t.record_exploration("vigenere", "mixed", count=len(tried), keys=tried)
+        for _ in range(300):
+            query = "".join(rng.choices("ABCDEF", k=rng.randint(1, 11)))
+            expected = query in tried or any(_levenshtein(query, k) <= tol for k in tried)
+            assert t.already_tried_fuzzy("vigenere", query, tol=tol) is expected, query
+
+    def test_index_tracks_keys_recorded_after_first_query(self, tmp_path):
+        t = self._tracker(tmp_path)
+        t.mark_tried("vigenere", "KRYPTOS")
+        assert t.already_tried_fuzzy("vigenere", "BERLIX", tol=1) is False
+        t.mark_tried("vigenere", "BERLIN")
+        t.record_exploration("vigenere", "length_5", keys=["CLOCK"])
+        assert t.already_tried_fuzzy("vigenere", "BERLIX", tol=1) is True
+        assert t.already_tried_fuzzy("vigenere", "CLOCX", tol=1) is True
+
+    def test_index_rebuilt_from_disk(self, tmp_path):
+        self._tracker(tmp_path).record_exploration("vigenere", "length_7", keys=["KRYPTOS", "PALIMPS"])
+        assert self._tracker(tmp_path).already_tried_fuzzy("vigenere", "PALIMPX", tol=1) is True
+
 
 class TestGetPriorityRecommendations:
     def _populated_tracker(self, tmp_path: Path) -> SearchSpaceTracker:
@@ -118,3 +157,12 @@ class TestGetPriorityRecommendations:
         vig_recs = [r for r in recs if r["cipher_type"] == "vigenere"]
         if vig_recs:
             assert vig_recs[0]["tried_key_count"] == 2
+
+
+def test_compare_fuzzy_dedup_reports_each_size():
+    from kryptos.benchmarks import compare_fuzzy_dedup
+
+    rows = compare_fuzzy_dedup(sizes=(500, 2000), n_queries=40, baseline_queries=40)
+    assert [r["tried_keys"] for r in rows] == [500, 2000]
+    assert all(r["equal_answers"] for r in rows)
+    assert all(r["indexed_per_query_sec"] > 0 for r in rows)
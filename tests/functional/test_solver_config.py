@@ -9,6 +9,7 @@ def test_solver_config_defaults_are_empty():
     config = SolverConfig()
 
     assert config.rng_seed is None
+    assert config.vigenere_beam_width is None
     assert config.vigenere_max_candidates is None
     assert config.sa_num_restarts is None
     assert config.sa_max_iterations is None
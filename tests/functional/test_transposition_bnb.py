@@ -0,0 +1,54 @@
+"""Branch-and-bound columnar search returns the exhaustive optimum."""
+
+from __future__ import annotations
+
+import itertools
+import math
+
+import pytest
+
+from kryptos.k4.beaufort_sweep import K4
+from kryptos.k4.scoring import bigram_score, quadgram_score
+from kryptos.k4.transposition import (
+    apply_columnar_permutations,
+    branch_and_bound_width,
+    search_columnar_branch_and_bound,
+)
+
+
+def _exhaustive(ciphertext: str, n_cols: int, score_fn=quadgram_score) -> list[tuple[float, tuple[int, ...]]]:
+    perms = list(itertools.permutations(range(n_cols)))
+    texts = apply_columnar_permutations(ciphertext, n_cols, perms)
+    return sorted(((score_fn(t), p) for t, p in zip(texts, perms, strict=True)), key=lambda e: (-e[0], e[1]))
+
+
+@pytest.mark.parametrize("n_cols", [2, 3, 4, 5, 6, 7])
+def test_top_k_matches_exhaustive(n_cols):
+    expected = _exhaustive(K4, n_cols)[:20]
+    ranked, nodes = branch_and_bound_width(K4, n_cols, top_k=20)
+    assert ranked == expected
+    assert nodes <= sum(math.perm(n_cols, d) for d in range(n_cols + 1))
+
+
+def test_width_eight_best_matches_and_prunes():
+    best = _exhaustive(K4, 8)[0]
+    ranked, nodes = branch_and_bound_width(K4, 8, top_k=1)
+    assert ranked == [best]
+    assert nodes < math.factorial(8)
+
+
+def test_bigram_objective_matches_exhaustive():
+    ranked, _ = branch_and_bound_width(K4, 5, top_k=5, ngram_size=2)
+    assert ranked == _exhaustive(K4, 5, bigram_score)[:5]
+
+
+def test_search_wrapper_ranks_across_widths():
+    results = search_columnar_branch_and_bound(K4, min_cols=4, max_cols=6, top_k=10)
+    assert len(results) == 10
+    scores = [r["score"] for r in results]
+    assert scores == sorted(scores, reverse=True)
+    best = max((_exhaustive(K4, w)[0] for w in (4, 5, 6)), key=lambda e: e[0])
+    assert scores[0] == best[0]
+    for r in results:
+        assert quadgram_score(r["text"]) == r["score"]
+        assert r["nodes"] > 0
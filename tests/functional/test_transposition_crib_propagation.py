@@ -0,0 +1,117 @@
+"""Crib-position constraint pre-pass for multi-crib columnar search."""
+
+from __future__ import annotations
+
+import itertools
+import math
+import random
+
+from kryptos.k4 import transposition_constraints
+from kryptos.k4.pipeline import make_transposition_multi_crib_stage
+from kryptos.k4.transposition_constraints import (
+    _column_lengths,
+    crib_consistent_permutations,
+    crib_offset_domains,
+    invert_columnar,
+    search_with_multiple_cribs_positions,
+)
+
+PLAINTEXT = (
+    "THEUNITEDSTATESINTELLIGENCECOMMUNITYDISCOVEREDTHEHIDDENMESSAGE"
+    "CONCEALEDWITHINTHESCULPTUREATLANGLEYVIRGINIA"
+)
+N_COLS = 7
+TRUE_PERM = (3, 0, 5, 1, 6, 2, 4)
+
+
+def _encrypt(plaintext: str, n_cols: int, perm: tuple[int, ...]) -> str:
+    lengths = _column_lengths(len(plaintext), n_cols)
+    columns = [''.join(plaintext[r * n_cols + c] for r in range(lengths[c])) for c in range(n_cols)]
+    return ''.join(columns[c] for c in perm)
+
+
+CT = _encrypt(PLAINTEXT, N_COLS, TRUE_PERM)
+CRIBS = {"LANGLEY": [PLAINTEXT.find("LANGLEY") + 2], "HIDDEN": [PLAINTEXT.find("HIDDEN") - 1]}
+
+
+def _keys(results):
+    return sorted((r['perm'], r['text'], tuple(sorted(r['positions'].items()))) for r in results)
+
+
+def test_fixture_round_trips():
+    assert invert_columnar(CT, N_COLS, TRUE_PERM) == PLAINTEXT
+
+
+def test_survivors_are_exactly_the_crib_consistent_permutations():
+    survivors = list(crib_consistent_permutations(CT, CRIBS, N_COLS, window=3))
+    expected = [
+        perm
+        for perm in itertools.permutations(range(N_COLS))
+        if all(
+            any(invert_columnar(CT, N_COLS, perm)[s : s + len(crib)] == crib for s in range(ep - 3, ep + 4))
+            for crib, (ep,) in CRIBS.items()
+        )
+    ]
+    assert survivors == expected
+    assert TRUE_PERM in survivors
+    assert len(survivors) < math.factorial(N_COLS) // 100
+
+
+def test_propagated_search_matches_enumerate_and_filter():
+    total = math.factorial(N_COLS)
+    fast = search_with_multiple_cribs_positions(CT, CRIBS, N_COLS, window=3, max_perms=total, limit=total)
+    slow = search_with_multiple_cribs_positions(
+        CT, CRIBS, N_COLS, window=3, max_perms=total, limit=total, propagate=False
+    )
+    assert _keys(fast) == _keys(slow)
+    assert [r['score'] for r in fast] == [r['score'] for r in slow]
+    assert {r['surviving_perms'] for r in fast} == {len(fast)}
+    assert all('surviving_perms' not in r for r in slow)
+
+
+def test_max_perms_caps_scoring_and_the_count():
+    every = search_with_multiple_cribs_positions(CT, {"E": [10]}, 5, window=0, max_perms=10**6, limit=10**6)
+    capped = search_with_multiple_cribs_positions(CT, {"E": [10]}, 5, window=0, max_perms=3, limit=10)
+    assert len(every) > 3
+    assert (every[0]['surviving_perms'], every[0]['surviving_perms_capped']) == (len(every), False)
+    assert len(capped) == 3
+    assert (capped[0]['surviving_perms'], capped[0]['surviving_perms_capped']) == (3, True)
+
+
+def test_max_perms_bounds_enumeration_at_width_ten(monkeypatch):
+    # A loose crib leaves over a million width-10 orders; only max_perms (+1 to detect the cap) are drawn.
+    drawn = []
+    consistent = transposition_constraints.crib_consistent_permutations
+
+    def counting(*args, **kwargs):
+        for perm in consistent(*args, **kwargs):
+            drawn.append(perm)
+            yield perm
+
+    monkeypatch.setattr(transposition_constraints, "crib_consistent_permutations", counting)
+    rng = random.Random(10)
+    ct = "".join(rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ") for _ in range(97))
+    results = search_with_multiple_cribs_positions(ct, {"E": [10]}, 10, window=5, max_perms=200, limit=5)
+    assert len(drawn) == 201
+    assert results and all(r['surviving_perms'] == 200 and r['surviving_perms_capped'] for r in results)
+
+
+def test_offset_domains_pin_crib_columns():
+    domains = crib_offset_domains(CT, {"LANGLEY": [PLAINTEXT.find("LANGLEY")]}, N_COLS, window=0)
+    assert domains is not None
+    lengths = _column_lengths(len(CT), N_COLS)
+    true_offsets = {c: sum(lengths[p] for p in TRUE_PERM[: TRUE_PERM.index(c)]) for c in range(N_COLS)}
+    assert all(true_offsets[c] in domains[c] for c in range(N_COLS))
+    assert sum(len(d) == 1 for d in domains) >= 5  # the seven crib letters fall in distinct columns
+
+    assert crib_offset_domains(CT, {"QQQQ": [0]}, N_COLS, window=5) is None
+    assert list(crib_consistent_permutations(CT, {"LANGLEY": []}, N_COLS)) == []
+
+
+def test_multi_crib_stage_reports_survivors_per_width():
+    stage = make_transposition_multi_crib_stage(positional_cribs=CRIBS, min_cols=6, max_cols=7, window=3)
+    meta = stage.func(CT).metadata
+    assert meta['surviving_perms'][7] >= 1
+    assert set(meta['surviving_perms']) == {6, 7}
+    assert meta['surviving_perms_capped'] == {6: False, 7: False}
+    assert meta['candidates'][0]['text'] == PLAINTEXT
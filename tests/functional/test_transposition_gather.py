@@ -0,0 +1,61 @@
+"""Gather-index inversion of columnar transpositions (cached layout, itemgetter / NumPy take)."""
+
+from __future__ import annotations
+
+import itertools
+import random
+
+import pytest
+
+from kryptos.benchmarks import _columnar_split_join, compare_columnar_gather
+from kryptos.k4 import transposition as tr
+
+K4 = "OBKRUOXOGHULBSOLIFBBWFLRVQQPRNGKSSOTWTQSJQSSEKZZWATJKLUDIAWINFBNYPVTTMZFPKWGDKZXTJCDIGKUHUAUEKCAR"
+
+
+@pytest.mark.parametrize("n_cols", range(2, 11))
+def test_gather_matches_split_join(n_cols):
+    perms = list(tr.sample_permutations(n_cols, 200, random.Random(n_cols)))
+    expected = [_columnar_split_join(K4, n_cols, p) for p in perms]
+    assert [tr.apply_columnar_permutation(K4, n_cols, p) for p in perms] == expected
+    assert tr.apply_columnar_permutations(K4, n_cols, perms) == expected
+
+
+@pytest.mark.parametrize("length", [0, 1, 3, 7, 12])
+def test_short_texts_and_more_columns_than_letters(length):
+    text = K4[:length]
+    for perm in itertools.permutations(range(5)):
+        expected = _columnar_split_join(text, 5, perm)
+        assert tr.apply_columnar_permutation(text, 5, perm) == expected
+    reverse = (4, 3, 2, 1, 0)
+    assert tr.apply_columnar_permutations(text, 5, [reverse]) == [_columnar_split_join(text, 5, reverse)]
+
+
+def test_gather_indices_are_a_permutation_of_positions():
+    indices = tr.columnar_gather_indices(97, 7, (3, 0, 6, 1, 5, 2, 4))
+    assert sorted(indices) == list(range(97))
+    plaintext = tr.apply_columnar_permutation(K4, 7, (3, 0, 6, 1, 5, 2, 4))
+    assert plaintext == "".join(K4[i] for i in indices)
+
+
+def test_non_letters_are_stripped_before_gathering():
+    noisy = "OBKR UOXO-GHUL?BSOL"
+    clean = "OBKRUOXOGHULBSOL"
+    perm = (2, 0, 3, 1)
+    assert tr.apply_columnar_permutation(noisy, 4, perm) == tr.apply_columnar_permutation(clean, 4, perm)
+    assert tr.apply_columnar_permutations(noisy, 4, [perm]) == [tr.apply_columnar_permutation(clean, 4, perm)]
+
+
+def test_layout_is_cached_per_length_and_width():
+    tr._column_layout.cache_clear()
+    for perm in itertools.permutations(range(6)):
+        tr.apply_columnar_permutation(K4, 6, perm)
+    info = tr._column_layout.cache_info()
+    assert (info.misses, info.hits) == (1, 719)
+
+
+def test_compare_columnar_gather_reports_rates():
+    rows = compare_columnar_gather(widths=(5, 8), n_perms=300)
+    assert [r["cols"] for r in rows] == [5, 8]
+    assert [r["perms"] for r in rows] == [120, 300]
+    assert all(r["equal_texts"] and r["batched_per_sec"] for r in rows)
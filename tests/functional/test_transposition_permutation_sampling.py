@@ -0,0 +1,69 @@
+"""Lehmer unranking and lazy permutation sampling for columnar searches."""
+
+from __future__ import annotations
+
+import itertools
+import math
+import random
+import tracemalloc
+
+import pytest
+
+from kryptos.k4 import transposition as tr
+
+K4 = "OBKRUOXOGHULBSOLIFBBWFLRVQQPRNGKSSOTWTQSJQSSEKZZWATJKLUDIAWINFBNYPVTTMZFPKWGDKZXTJCDIGKUHUAUEKCAR"
+# 10 columns materialised as tuples is ~3.6M objects (hundreds of MB); a lazy sweep needs a few MB.
+PEAK_BUDGET_BYTES = 16 * 1024 * 1024
+
+
+class TestUnrank:
+    @pytest.mark.parametrize("n", range(1, 7))
+    def test_matches_itertools_order(self, n):
+        ranks = [tr.unrank_permutation(r, n) for r in range(math.factorial(n))]
+        assert ranks == list(itertools.permutations(range(n)))
+
+    def test_last_rank_of_twelve(self):
+        assert tr.unrank_permutation(math.factorial(12) - 1, 12) == tuple(range(11, -1, -1))
+
+    def test_out_of_range(self):
+        with pytest.raises(ValueError):
+            tr.unrank_permutation(math.factorial(4), 4)
+
+
+class TestSampler:
+    @pytest.mark.parametrize("n", [5, 7, 8])
+    def test_random_matches_materialised_sample(self, n):
+        expected = random.Random(42).sample(list(itertools.permutations(range(n))), 100)
+        assert list(tr.sample_permutations(n, 100, random.Random(42))) == expected
+
+    def test_small_space_yields_everything_in_order(self):
+        assert list(tr.sample_permutations(4, 500)) == list(itertools.permutations(range(4)))
+
+    def test_strided_covers_leading_column(self):
+        perms = list(tr.sample_permutations(10, 120, strategy="strided"))
+        assert len(set(perms)) == 120
+        assert {p[0] for p in perms} == set(range(10))
+
+    def test_first_matches_prefix(self):
+        expected = list(itertools.islice(itertools.permutations(range(8)), 50))
+        assert list(tr.sample_permutations(8, 50, strategy="first")) == expected
+
+    def test_unknown_strategy(self):
+        with pytest.raises(ValueError):
+            list(tr.sample_permutations(8, 5, strategy="bogus"))
+
+
+class TestMemoryCeiling:
+    @pytest.mark.parametrize("n_cols", [10, 12])
+    def test_adaptive_sweep_stays_under_budget(self, n_cols):
+        tr.get_transposition_attempt_log(clear=True)
+        tracemalloc.start()
+        try:
+            results = tr.search_columnar_adaptive(K4, min_cols=n_cols, max_cols=n_cols, sample_perms=60)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+            tr.get_transposition_attempt_log(clear=True)
+        assert results
+        assert all(len(r["perm"]) == n_cols for r in results)
+        assert peak < PEAK_BUDGET_BYTES
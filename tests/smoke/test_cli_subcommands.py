@@ -24,6 +24,23 @@ def test_db_init_fails_cleanly_without_database_url(monkeypatch, capsys):
     assert "db-init failed" in out
 
 
+def test_attack_log_migrate(tmp_path: Path, capsys):
+    from kryptos.provenance.attack_log import AttackLogger, AttackParameters, AttackResult
+
+    AttackLogger(log_dir=tmp_path).log_attack("XYZ", AttackParameters("vigenere", {"key": "ABC"}), AttackResult(False))
+    rc = _invoke(["attack-log-migrate", "--log-dir", str(tmp_path)])
+    out = capsys.readouterr().out
+    assert rc == 0
+    assert "Imported 1 attacks" in out
+    assert AttackLogger(log_dir=tmp_path, storage="sqlite").stats["total_attacks"] == 1
+
+
+def test_attack_log_migrate_missing_file(tmp_path: Path, capsys):
+    rc = _invoke(["attack-log-migrate", "--log-dir", str(tmp_path)])
+    assert rc == 1
+    assert "attack-log-migrate failed" in capsys.readouterr().out
+
+
 def test_k4_decrypt_minimal(tmp_path: Path, capsys):
     cipher_file = tmp_path / "cipher.txt"
     cipher_file.write_text("OBKRUOXOGHULBSOLIFB", encoding="utf-8")